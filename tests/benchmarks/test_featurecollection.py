@@ -50,3 +50,29 @@ def test_single_series_feature_collection_multiple_descriptors(
     fc = FeatureCollection(mfd)
 
     benchmark(fc.calculate, dummy_data, n_jobs=n_cores)
+
+
+@pytest.mark.benchmark(group="per-window overhead")
+@pytest.mark.parametrize("window", WINDOWS)
+@pytest.mark.parametrize("stride", STRIDES)
+@pytest.mark.parametrize("tuple_output", [False, True])
+def test_stroll_per_window_overhead(
+    benchmark, window, stride, tuple_output, dummy_data  # noqa: F811
+):
+    import pandas as pd
+
+    from tsflex.features import FuncWrapper
+    from tsflex.features.segmenter import StridedRollingFactory
+
+    stroll = StridedRollingFactory.get_segmenter(
+        dummy_data["EDA"], pd.Timedelta(window), [pd.Timedelta(stride)]
+    )
+    # A no-op function, so that the elapsed time is the per-window overhead
+    func = FuncWrapper(len)
+    if tuple_output:
+        func = FuncWrapper(lambda x: (len(x), len(x)), output_names=["len", "len2"])
+    benchmark(stroll.apply_func, func)
+
+    stats = stroll.apply_func_stats
+    benchmark.extra_info["nb_windows"] = stats.nb_windows
+    benchmark.extra_info["overhead_per_window"] = stats.elapsed / stats.nb_windows
@@ -5,6 +5,7 @@ __author__ = "Jeroen Van Der Donckt, Emiel Deprost, Jonas Van Der Donckt"
 import math
 import os
 import random
+import time
 import warnings
 from pathlib import Path
 from typing import List, Tuple
@@ -21,6 +22,8 @@ from tsflex.features import (
     FeatureDescriptor,
     FuncWrapper,
     MultipleFeatureDescriptors,
+    PairwiseFeatureDescriptor,
+    TaskHooks,
 )
 from tsflex.utils.data import flatten
 
@@ -1778,6 +1781,511 @@ def test_multiple_inputs_vectorized_features(dummy_data):
     assert np.all(res["EDA|TMP__windowed_diff" + p].values == manual_diff)
 
 
+def test_stacked_multiple_inputs_features(dummy_data):
+    def magnitude(x, y, z):
+        return np.mean(np.sqrt(x**2 + y**2 + z**2))
+
+    def magnitude_stacked(xyz):
+        return np.mean(np.linalg.norm(xyz, axis=-1), axis=-1)
+
+    acc_cols = ("ACC_x", "ACC_y", "ACC_z")
+    fc = FeatureCollection(
+        feature_descriptors=[
+            FeatureDescriptor(magnitude, acc_cols, "5min", "2.5min"),
+            FeatureDescriptor(
+                FuncWrapper(
+                    magnitude_stacked,
+                    output_names="mag_vect",
+                    vectorized=True,
+                    stack_series=True,
+                ),
+                acc_cols,
+                "5min",
+                "2.5min",
+            ),
+        ]
+    )
+
+    for n_jobs in [0, None]:
+        res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs)
+        assert res.shape[1] == 2
+        assert res.shape[0] > 1
+        p = "ACC_x|ACC_y|ACC_z__"
+        assert np.allclose(
+            res[p + "magnitude__w=5m"].values, res[p + "mag_vect__w=5m"].values
+        )
+
+
+def test_float_dtype_features(dummy_data):
+    fc = FeatureCollection(
+        feature_descriptors=[
+            FeatureDescriptor(np.mean, "EDA", "5min", "2.5min"),
+            FeatureDescriptor(
+                FuncWrapper(np.std, output_names="std_vect", vectorized=True, axis=1),
+                "EDA",
+                "5min",
+                "2.5min",
+            ),
+            FeatureDescriptor(np.argmax, "EDA", "5min", "2.5min"),
+            FeatureDescriptor(
+                FuncWrapper(np.min, output_names="min_f64", output_dtype=np.float64),
+                "EDA",
+                "5min",
+                "2.5min",
+            ),
+        ]
+    )
+
+    res_f64 = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    for n_jobs in [0, None]:
+        res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs, float_dtype="f4")
+        assert res.shape == res_f64.shape
+        assert res["EDA__mean__w=5m"].dtype == np.float32
+        assert res["EDA__std_vect__w=5m"].dtype == np.float32
+        # Integer outputs and outputs with an output_dtype are not affected
+        assert res["EDA__argmax__w=5m"].dtype == res_f64["EDA__argmax__w=5m"].dtype
+        assert res["EDA__min_f64__w=5m"].dtype == np.float64
+        assert np.allclose(res.values, res_f64.values, rtol=1e-5)
+
+    with pytest.raises(AssertionError):
+        fc.calculate(dummy_data, float_dtype=np.int32)
+
+
+def test_intermediate_features(dummy_data):
+    from tsflex.features.intermediate import Intermediate, rfft, sort
+
+    nb_calls = []
+
+    def _counted_rfft(x):
+        nb_calls.append(1)
+        return np.fft.rfft(x, axis=-1)
+
+    counted_rfft = Intermediate(_counted_rfft, name="counted_rfft")
+
+    def max_magnitude(x_fft):
+        return np.max(np.abs(x_fft))
+
+    def dominant_bin(x_fft):
+        return np.argmax(np.abs(x_fft))
+
+    def median(x_sorted):
+        return x_sorted[len(x_sorted) // 2]
+
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                FuncWrapper(max_magnitude, intermediate=counted_rfft),
+                FuncWrapper(dominant_bin, intermediate=counted_rfft),
+                FuncWrapper(
+                    lambda x: np.max(np.abs(x), axis=1),
+                    output_names="max_magnitude_vect",
+                    intermediate=rfft(),
+                    vectorized=True,
+                ),
+                FuncWrapper(median, intermediate=sort()),
+            ],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    # The intermediate is computed once per series (for the same segmentation)
+    assert len(nb_calls) == 2
+    assert res.shape[1] == 8
+    assert np.allclose(
+        res["EDA__max_magnitude__w=5m"], res["EDA__max_magnitude_vect__w=5m"]
+    )
+
+    # Compare with the features computed on the raw windows
+    fc_raw = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                FuncWrapper(lambda x: np.max(np.abs(np.fft.rfft(x))), "max_magnitude"),
+                FuncWrapper(
+                    lambda x: np.argmax(np.abs(np.fft.rfft(x))), "dominant_bin"
+                ),
+                FuncWrapper(lambda x: np.sort(x)[len(x) // 2], "median"),
+            ],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res_raw = fc_raw.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert np.allclose(res[res_raw.columns], res_raw)
+
+    res_mp = fc.calculate(dummy_data, return_df=True, n_jobs=None)
+    assert np.allclose(res_mp[res.columns], res)
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_intermediate_features_eviction(dummy_data, tmp_path, n_jobs):
+    from tsflex.features.intermediate import Intermediate, _get_intermediate_cache
+
+    # Log the intermediate computations & cache sizes (also in the worker processes)
+    log_path = tmp_path / "log.txt"
+
+    def log(msg):
+        with open(log_path, "a") as f:
+            f.write(f"{msg}\n")
+
+    def _counted_rfft(x):
+        log("rfft")
+        return np.fft.rfft(x, axis=-1)
+
+    counted_rfft = Intermediate(_counted_rfft, name="counted_rfft")
+
+    def max_magnitude(x_fft):
+        log(f"cache_size={len(_get_intermediate_cache())}")
+        return np.max(np.abs(x_fft), axis=1)
+
+    def dominant_bin(x_fft):
+        log(f"cache_size={len(_get_intermediate_cache())}")
+        return np.argmax(np.abs(x_fft), axis=1)
+
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                FuncWrapper(max_magnitude, vectorized=True, intermediate=counted_rfft),
+                FuncWrapper(dominant_bin, vectorized=True, intermediate=counted_rfft),
+                FuncWrapper(np.mean),
+            ],
+            series_names=["EDA", "TMP"],
+            windows=["1min", "5min"],
+            strides="1min",
+        )
+    )
+    assert len(fc._get_task_batches(fc._get_feature_tasks(None, False, True))) == 4 * 2
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs)
+    assert res.shape[1] == 2 * 2 * 3
+    log_lines = log_path.read_text().split()
+    # The intermediate is computed once per series & window (regardless of n_jobs),
+    # and is evicted after the functions that share it
+    assert log_lines.count("rfft") == 2 * 2
+    assert set(log_lines) == {"rfft", "cache_size=1"}
+
+
+def test_series_intermediate_features(dummy_data):
+    from tsflex.features.intermediate import (
+        SeriesIntermediate,
+        _prefix_statistics,
+        _prefix_window_statistics,
+        prefix_statistics,
+    )
+
+    nb_calls = []
+
+    def counted_prefix_statistics(values):
+        nb_calls.append(1)
+        return _prefix_statistics(values)
+
+    counted_stats = SeriesIntermediate(
+        counted_prefix_statistics, _prefix_window_statistics, name="counted_stats"
+    )
+
+    def nanmean(stats):
+        return stats["sum"] / stats["count"]
+
+    def rms(stats):
+        return np.sqrt(stats["sumsq"] / stats["count"])
+
+    def nan_count(stats):
+        return stats["nan_count"]
+
+    def zero_crossings(stats):
+        return stats["sign_changes"]
+
+    df = dummy_data[["EDA", "TMP"]].copy()
+    df["EDA"] -= df["EDA"].mean()  # zero-crossings
+    df.iloc[100:300, 0] = np.nan
+
+    fc = FeatureCollection(
+        [
+            MultipleFeatureDescriptors(
+                functions=[
+                    FuncWrapper(nanmean, intermediate=counted_stats),
+                    FuncWrapper(rms, vectorized=True, intermediate=counted_stats),
+                    FuncWrapper(nan_count, intermediate=prefix_statistics()),
+                    FuncWrapper(
+                        zero_crossings,
+                        vectorized=True,
+                        intermediate=prefix_statistics(),
+                    ),
+                ],
+                series_names=["EDA", "TMP"],
+                windows=["30s", "2min"],
+                strides=["15s", "1min"],
+            ),
+        ]
+    )
+    res = fc.calculate(df, return_df=True, n_jobs=0)
+    # The precomputation is computed once per series
+    assert len(nb_calls) == 2
+    assert res.shape[1] == 2 * 2 * 4
+
+    def _zero_crossings(x):
+        x = x[~np.isnan(x)]  # as NaNs have no sign
+        return np.sum(np.sign(x[1:]) * np.sign(x[:-1]) < 0)
+
+    fc_raw = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                FuncWrapper(np.nanmean, "nanmean"),
+                FuncWrapper(lambda x: np.sqrt(np.nanmean(x**2)), "rms"),
+                FuncWrapper(lambda x: np.sum(np.isnan(x)), "nan_count"),
+                FuncWrapper(_zero_crossings, "zero_crossings"),
+            ],
+            series_names=["EDA", "TMP"],
+            windows=["30s", "2min"],
+            strides=["15s", "1min"],
+        )
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        res_raw = fc_raw.calculate(df, return_df=True, n_jobs=0)
+    # Note: zero-crossings over NaN gaps are not counted by the prefix statistics
+    for win in ["30s", "2m"]:
+        nan_windows = res_raw[f"EDA__nan_count__w={win}"] > 0
+        assert nan_windows.any()
+        col = f"EDA__zero_crossings__w={win}"
+        assert (res.loc[nan_windows, col] <= res_raw.loc[nan_windows, col]).all()
+        res_raw.loc[nan_windows, col] = res.loc[nan_windows, col]
+    assert np.allclose(res[res_raw.columns], res_raw, equal_nan=True)
+
+    # Window per window
+    x = df["EDA"].values[:500]
+    stats = prefix_statistics()(x)
+    assert stats["nan_count"] == 200 and stats["count"] == 300
+    assert np.isclose(stats["sum"], np.nansum(x))
+    assert stats["sign_changes"] == _zero_crossings(x[:100]) + _zero_crossings(x[300:])
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_nested_stride_features(dummy_data, n_jobs):
+    nb_windows = []
+
+    def counted_mean(x):
+        nb_windows.append(1)
+        return np.mean(x)
+
+    strides = ["30s", "1min", "2.5min"]
+    fc = FeatureCollection(
+        [
+            FeatureDescriptor(
+                FuncWrapper(counted_mean, f"mean_{stride}"), "EDA", "5min", stride
+            )
+            for stride in strides
+        ]
+        + [
+            FeatureDescriptor(
+                FuncWrapper(counted_mean, "mean_1min_2min"),
+                "EDA",
+                "5min",
+                ["1min", "2min"],
+            ),
+            # Not nested (45s is not a multiple of 30s) -> computed separately
+            FeatureDescriptor(
+                FuncWrapper(counted_mean, "mean_45s"), "EDA", "5min", "45s"
+            ),
+        ]
+    )
+    res_list = fc.calculate(dummy_data, return_df=False, n_jobs=n_jobs)
+    assert len(res_list) == 5
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs)
+    assert res.shape[1] == 5
+
+    # Compare with the separately computed features
+    nb_windows_single = {}
+    for desc in flatten(fc._feature_desc_dict.values()):
+        res_single = FeatureCollection(desc).calculate(
+            dummy_data, return_df=True, n_jobs=0
+        )
+        nb_windows_single[desc.function.output_names[0]] = len(res_single)
+        assert_frame_equal(res.loc[res_single.index, res_single.columns], res_single)
+
+    # The grouped features are computed once on the windows of the smallest stride
+    nb_windows.clear()
+    fc.calculate(dummy_data, n_jobs=0)
+    assert len(nb_windows) == (
+        nb_windows_single["mean_30s"] + nb_windows_single["mean_45s"]
+    )
+
+
+def test_nested_stride_features_non_divisible_base():
+    # The strides of the first feature ([5, 7]) are not all multiples of its smallest
+    # stride (5) -> the feature with stride 10 should not be nested in its group
+    data = pd.Series(np.arange(100, dtype=float), name="a")
+    fc = FeatureCollection(
+        [
+            FeatureDescriptor(np.min, "a", 10, [5, 7]),
+            FeatureDescriptor(FuncWrapper(np.min, output_names="min2"), "a", 10, 10),
+        ]
+    )
+    res = fc.calculate(data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2
+
+    for desc in flatten(fc._feature_desc_dict.values()):
+        res_single = FeatureCollection(desc).calculate(data, return_df=True, n_jobs=0)
+        assert_frame_equal(res.loc[res_single.index, res_single.columns], res_single)
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_pairwise_features(dummy_data, n_jobs):
+    nb_calls = []
+
+    def corr_cov(windows):
+        nb_calls.append(1)
+        deviations = windows - windows.mean(axis=1, keepdims=True)
+        cov = np.einsum("nwi,nwj->nij", deviations, deviations) / windows.shape[1]
+        std = np.sqrt(np.diagonal(cov, axis1=1, axis2=2))
+        return cov / (std[:, :, None] * std[:, None, :]), cov
+
+    series_names = ["ACC_x", "ACC_y", "ACC_z"]
+    fc = FeatureCollection(
+        PairwiseFeatureDescriptor(
+            FuncWrapper(corr_cov, ["corr", "cov"]), series_names, "30s", "15s"
+        )
+    )
+    assert fc.get_nb_output_features() == 3 * 2
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs)
+    assert res.shape[1] == 3 * 2
+    assert set(res.columns) == {
+        f"{a}|{b}__{f}__w=30s"
+        for a, b in [("ACC_x", "ACC_y"), ("ACC_x", "ACC_z"), ("ACC_y", "ACC_z")]
+        for f in ["corr", "cov"]
+    }
+
+    # Compare with the features of the series tuples
+    fc_tuples = FeatureCollection(
+        MultipleFeatureDescriptors(
+            [
+                FuncWrapper(lambda x, y: np.corrcoef(x, y)[0, 1], "corr"),
+                FuncWrapper(lambda x, y: np.cov(x, y, ddof=0)[0, 1], "cov"),
+            ],
+            [("ACC_x", "ACC_y"), ("ACC_x", "ACC_z"), ("ACC_y", "ACC_z")],
+            "30s",
+            "15s",
+        )
+    )
+    res_tuples = fc_tuples.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert_frame_equal(res[res_tuples.columns], res_tuples)
+
+    # All the pairs are computed in one (vectorized) function call
+    nb_calls.clear()
+    fc.calculate(dummy_data, n_jobs=0)
+    assert len(nb_calls) == 1
+
+    # The pairwise feature can be reduced & the windows can be set manually
+    fc_reduced = fc.reduce(["ACC_x|ACC_z__cov__w=30s"])
+    assert fc_reduced.get_nb_output_features() == 3 * 2
+    res_manual = fc.calculate(
+        dummy_data,
+        segment_start_idxs=res.index[:10] - pd.Timedelta("30s"),
+        segment_end_idxs=res.index[:10],
+        return_df=True,
+        n_jobs=0,
+    )
+    assert "ACC_y|ACC_z__corr__w=manual" in res_manual.columns
+    assert np.allclose(res_manual.values, res.iloc[:10].values)
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_profile_features(dummy_data, n_jobs):
+    fc = FeatureCollection(
+        [
+            MultipleFeatureDescriptors([np.min, np.max], "EDA", "30s", "15s"),
+            FeatureDescriptor(
+                FuncWrapper(np.mean, vectorized=True, axis=-1), "TMP", "30s", "15s"
+            ),
+        ]
+    )
+    res, profile_df = fc.calculate(
+        dummy_data, return_df=True, n_jobs=n_jobs, profile=True
+    )
+    assert_frame_equal(res, fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs))
+
+    assert len(profile_df) == 3
+    assert set(profile_df["function"]) == {"min", "max", "mean"}
+    assert profile_df["function_time"].is_monotonic_decreasing
+    assert sorted(flatten(profile_df["output_names"])) == sorted(res.columns)
+    assert (profile_df["nb_windows"] == len(res)).all()
+    for col in ["segmentation_time", "function_time", "assembly_time", "peak_memory"]:
+        assert (profile_df[col] >= 0).all()
+
+    profile_df = profile_df.set_index("function")
+    assert profile_df.loc["min", "nb_func_calls"] == len(res)
+    assert profile_df.loc["min", "p99_window_latency"] > 0
+    # Vectorized -> only the mean latency per window is available
+    assert profile_df.loc["mean", "nb_func_calls"] == 1
+    assert profile_df.loc["mean", "mean_window_latency"] > 0
+    assert np.isnan(profile_df.loc["mean", "p99_window_latency"])
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_task_hooks_features(dummy_data, n_jobs):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors([np.min, np.max], ["EDA", "TMP"], "30s", "15s")
+    )
+    hooks = TaskHooks(
+        on_task_start=lambda info: os.getpid(),
+        on_task_end=lambda info: info,
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs, hooks=hooks)
+    assert_frame_equal(res, fc.calculate(dummy_data, return_df=True, n_jobs=0))
+
+    # The events of the (worker) processes are aggregated
+    assert len(hooks.events) == 2 * 4
+    start_events = [e for e in hooks.events if e.hook == "on_task_start"]
+    assert len(start_events) == 4
+    assert (os.getpid() in {e.output for e in start_events}) == (n_jobs == 0)
+    end_infos = [e.output for e in hooks.events if e.hook == "on_task_end"]
+    assert {info["function"] for info in end_infos} == {"min", "max"}
+    assert {info["series_names"] for info in end_infos} == {("EDA",), ("TMP",)}
+    assert all(info["window"] == pd.Timedelta("30s") for info in end_infos)
+    assert all(info["duration"] > 0 for info in end_infos)
+    assert all(info["output_shape"] == (len(res), 1) for info in end_infos)
+    assert sorted(flatten(info["output_names"] for info in end_infos)) == sorted(
+        res.columns
+    )
+
+    # The error hook is invoked (and its event is aggregated) when a task fails
+    def raise_error(x):
+        raise ValueError("error")
+
+    hooks = TaskHooks(on_error=lambda info, e: (info["function"], str(e)))
+    fc_error = FeatureCollection(
+        MultipleFeatureDescriptors([raise_error, np.max], "EDA", ["30s", "1min"], "15s")
+    )
+    with pytest.raises(RuntimeError):
+        fc_error.calculate(dummy_data, n_jobs=n_jobs, hooks=hooks)
+    assert len(hooks.events) >= 1
+    assert all(e.output == ("raise_error", "error") for e in hooks.events)
+
+    # The events of the tasks that completed before the failing task are kept
+    def slow_raise_error(x):
+        time.sleep(0.5)
+        raise ValueError("error")
+
+    hooks = TaskHooks(
+        on_task_end=lambda info: info["function"],
+        on_error=lambda info, e: info["function"],
+    )
+    fc_error = FeatureCollection(
+        [
+            FeatureDescriptor(np.max, "EDA", "30s", "15s"),
+            FeatureDescriptor(slow_raise_error, "TMP", "30s", "15s"),
+        ]
+    )
+    with pytest.raises(RuntimeError):
+        fc_error.calculate(dummy_data, n_jobs=n_jobs, hooks=hooks)
+    assert [(e.hook, e.output) for e in hooks.events] == [
+        ("on_task_end", "max"),
+        ("on_error", "slow_raise_error"),
+    ]
+
+
 ### Test feature extraction length
 
 
@@ -1978,8 +2486,68 @@ def test_error_same_output_feature_collection(dummy_data):
         windows=["5s", "7s", "5s"],  # Two times 5s
         strides="2.5s",
     )
+    # The identical features are only added once
+    fc = FeatureCollection(feature_descriptors=mfd)
+    assert fc.get_nb_output_features() == 3 * 2 * 2
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 3 * 2 * 2
+
+    # A different function with the same output name raises an error
     with pytest.raises(AssertionError):
-        FeatureCollection(feature_descriptors=mfd)
+        FeatureCollection(
+            [
+                FeatureDescriptor(FuncWrapper(np.max, "f"), "EDA", "5s", "2.5s"),
+                FeatureDescriptor(FuncWrapper(np.min, "f"), "EDA", "5s", "2.5s"),
+            ]
+        )
+    # The same function with the same output name, but other strides, as well
+    with pytest.raises(AssertionError):
+        FeatureCollection(
+            [
+                FeatureDescriptor(FuncWrapper(np.max, "f"), "EDA", "5s", "2.5s"),
+                FeatureDescriptor(FuncWrapper(np.max, "f"), "EDA", "5s", "5s"),
+            ]
+        )
+
+
+def test_duplicate_features(dummy_data):
+    nb_calls = []
+
+    def counted_sum(x):
+        nb_calls.append(1)
+        return np.sum(x)
+
+    sum_func = FuncWrapper(counted_sum, "sum")
+    fc = FeatureCollection(
+        [
+            MultipleFeatureDescriptors(sum_func, ["EDA", "TMP"], "1min", "30s"),
+            # Same computation (but another FuncWrapper) with another output name
+            FeatureDescriptor(FuncWrapper(counted_sum, "total"), "EDA", "1min", "30s"),
+            FeatureDescriptor(FuncWrapper(np.max, "max"), "EDA", "1min", "30s"),
+        ]
+    )
+    # Combining collections with duplicate features does not add the duplicates
+    fc.add(FeatureCollection(FeatureDescriptor(sum_func, "EDA", "1min", "30s")))
+    fc.add(FeatureDescriptor(FuncWrapper(counted_sum, "sum"), "TMP", "1min", "30s"))
+    assert fc.get_nb_output_features() == 4
+
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 4
+    assert res["EDA__sum__w=1m"].equals(
+        res["EDA__total__w=1m"].rename("EDA__sum__w=1m")
+    )
+    # The sum is computed once for each series
+    nb_windows = res["EDA__sum__w=1m"].notna().sum()
+    nb_windows += res["TMP__sum__w=1m"].notna().sum()
+    assert len(nb_calls) == nb_windows
+
+    # Also when the stride is passed to the calculate method
+    nb_calls.clear()
+    res_stride = fc.calculate(dummy_data, stride="1min", return_df=True, n_jobs=0)
+    assert res_stride.shape[1] == 4
+    assert (
+        len(nb_calls) == res_stride[["EDA__sum__w=1m", "TMP__sum__w=1m"]].count().sum()
+    )
 
 
 def test_bound_method(dummy_data):
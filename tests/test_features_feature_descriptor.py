@@ -6,7 +6,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from tsflex.features import FeatureDescriptor, FuncWrapper, MultipleFeatureDescriptors
+from tsflex.features import (
+    FeatureDescriptor,
+    FuncWrapper,
+    MultipleFeatureDescriptors,
+    PairwiseFeatureDescriptor,
+)
 from tsflex.utils.data import flatten
 
 ### FeatureDescriptor
@@ -212,6 +217,38 @@ def test_error_optional_window_but_pass_stride_feature_descriptor():
         )
 
 
+### PairwiseFeatureDescriptor
+
+
+def test_pairwise_feature_descriptor():
+    def corr(windows):
+        return np.ones((len(windows), windows.shape[2], windows.shape[2]))
+
+    fd = PairwiseFeatureDescriptor(corr, ["x", "y", "z"], window=10, stride=5)
+
+    assert fd.series_name == ("x", "y", "z")
+    assert fd.series_pairs == [("x", "y"), ("x", "z"), ("y", "z")]
+    assert fd.get_nb_output_features() == 3
+    assert set(fd.get_required_series()) == {"x", "y", "z"}
+    assert fd.function.stack_series and fd.function.vectorized
+    assert fd._get_output_index_keys() == [
+        (("x", "y"), "corr"),
+        (("x", "z"), "corr"),
+        (("y", "z"), "corr"),
+    ]
+    out = fd.function(np.zeros((4, 10, 3)))
+    assert out.shape == (4, 3)
+
+
+def test_error_pairwise_feature_descriptor():
+    with pytest.raises(AssertionError):
+        PairwiseFeatureDescriptor(np.corrcoef, ["x"], window=10, stride=5)
+    with pytest.raises(AssertionError):
+        PairwiseFeatureDescriptor(np.corrcoef, ["x", "x"], window=10, stride=5)
+    with pytest.raises(TypeError):
+        PairwiseFeatureDescriptor("corr", ["x", "y"], window=10, stride=5)
+
+
 ### MultipleFeatureDescriptors
 
 
@@ -115,3 +115,33 @@ def test_error_func_wrapper_wrong_outputnames_type():
 def test_illegal_func_wrapper_vectorized_wrong_input_type():
     with pytest.raises(AssertionError):
         FuncWrapper(np.min, input_type=pd.Series, vectorized=True, axis=1)
+
+
+def test_auto_vectorized_func_wrapper():
+    assert FuncWrapper(np.mean, vectorized="auto")._vectorizable is None
+    # No axis argument, axis is already set, or pd.Series input -> not vectorizable
+    assert FuncWrapper(len, vectorized="auto")._vectorizable is False
+    assert FuncWrapper(np.mean, vectorized="auto", axis=0)._vectorizable is False
+    func = FuncWrapper(np.mean, vectorized="auto", input_type=pd.Series)
+    assert func._vectorizable is False
+
+
+def test_illegal_func_wrapper_vectorized_value():
+    with pytest.raises(AssertionError):
+        FuncWrapper(np.min, vectorized="yes")
+
+
+def test_illegal_func_wrapper_stack_series_wrong_input_type():
+    with pytest.raises(AssertionError):
+        FuncWrapper(np.min, input_type=pd.Series, stack_series=True)
+
+
+def test_illegal_func_wrapper_intermediate():
+    from tsflex.features.intermediate import rfft
+
+    with pytest.raises(AssertionError):
+        FuncWrapper(np.min, intermediate=np.fft.rfft)
+    with pytest.raises(AssertionError):
+        FuncWrapper(np.min, input_type=pd.Series, intermediate=rfft())
+    with pytest.raises(AssertionError):
+        FuncWrapper(np.min, stack_series=True, intermediate=rfft())
@@ -14,10 +14,13 @@ from tsflex.features.integrations import (
     catch22_wrapper,
     seglearn_feature_dict_wrapper,
     seglearn_wrapper,
+    tsfel_domain_wrapper,
     tsfel_feature_dict_wrapper,
     tsfresh_combiner_wrapper,
+    tsfresh_settings_batch_wrapper,
     tsfresh_settings_wrapper,
 )
+from tsflex.utils.data import flatten
 
 from .utils import dummy_data
 
@@ -59,6 +62,50 @@ def test_seglearn_feature_dict_wrapper(dummy_data):
     assert not res_df.isna().any().any()
 
 
+def test_seglearn_vectorized_wrapper(dummy_data):
+    all_features = seglearn.feature_functions.all_features()
+
+    def get_fc(vectorized) -> FeatureCollection:
+        return FeatureCollection(
+            MultipleFeatureDescriptors(
+                functions=[
+                    seglearn_wrapper(f, k, vectorized=vectorized)
+                    for k, f in all_features.items()
+                ],
+                series_names=["TMP", "EDA"],
+                windows="5min",
+                strides="2min",
+            )
+        )
+
+    res = {}
+    for vectorized in [True, "auto", False]:
+        fc = get_fc(vectorized)
+        res[vectorized] = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+        functions = [fd.function for fd in flatten(fc._feature_desc_dict.values())]
+        assert all(f.vectorized == vectorized for f in functions)
+        # Only the "auto" functions are probed
+        assert all(
+            f._vectorizable is (True if vectorized == "auto" else None)
+            for f in functions
+        )
+
+    assert res[True].shape == res[False].shape == res["auto"].shape
+    assert "TMP__hist4_bin4__w=5m" in res[True].columns
+    for vectorized in [True, "auto"]:
+        assert np.allclose(
+            res[vectorized][res[False].columns], res[False], equal_nan=True, rtol=1e-6
+        )
+
+    # Irregularly sampled data can only be processed with "auto" (or False)
+    irregular_data = dummy_data[["TMP", "EDA"]].drop(dummy_data.index[100:110])
+    res_auto = get_fc("auto").calculate(irregular_data, return_df=True, n_jobs=0)
+    res_seq = get_fc(False).calculate(irregular_data, return_df=True, n_jobs=0)
+    assert np.allclose(res_auto[res_seq.columns], res_seq, equal_nan=True, rtol=1e-6)
+    with pytest.raises(RuntimeError):
+        get_fc(True).calculate(irregular_data, return_df=True, n_jobs=0)
+
+
 ## TSFRESH
 
 
@@ -145,6 +192,48 @@ def test_tsfresh_settings_wrapper(dummy_data):
     assert (res_df.shape[0] > 0) and (res_df.shape[1]) > 0
 
 
+@pytest.mark.parametrize("index_based", [False, True])
+def test_tsfresh_settings_batch_wrapper(dummy_data, index_based):
+    from tsfresh.feature_extraction.settings import EfficientFCParameters
+
+    settings = EfficientFCParameters()
+    if not index_based:
+        # Remove the index based calculator (which requires a pd.Series)
+        settings.pop("linear_trend_timewise")
+
+    res = {}
+    for wrapper in [tsfresh_settings_wrapper, tsfresh_settings_batch_wrapper]:
+        fc = FeatureCollection(
+            MultipleFeatureDescriptors(
+                functions=wrapper(settings),
+                series_names=["EDA", "TMP"],
+                windows="2.5min",
+                strides="10min",
+            )
+        )
+        res[wrapper] = fc.calculate(dummy_data.first("1h"), return_df=True, n_jobs=0)
+
+    res_single, res_batch = (
+        res[tsfresh_settings_wrapper],
+        res[tsfresh_settings_batch_wrapper],
+    )
+    assert res_batch.shape == res_single.shape
+    # The outputs keep the dtype of their calculator
+    assert (res_batch[res_single.columns].dtypes == res_single.dtypes).all()
+    assert (res_batch.dtypes == bool).any()
+    assert np.allclose(
+        res_batch[res_single.columns].astype(float),
+        res_single.astype(float),
+        equal_nan=True,
+    )
+
+    # The sorted values & spectra are computed at once as intermediate
+    batch_func = tsfresh_settings_batch_wrapper(settings)
+    assert (batch_func.intermediate is None) == index_based
+    if not index_based:
+        assert batch_func.intermediate.kwargs["fields"] == ("sorted", "rfft", "psd")
+
+
 ## TSFEL
 
 
@@ -309,6 +398,84 @@ def test_tsfel_feature_dict_wrapper(dummy_data):
     assert (res_df.shape[0] > 0) and (res_df.shape[1]) > 0
 
 
+def test_tsfel_domain_wrapper(dummy_data):
+    from tsfel.feature_extraction import get_features_by_domain
+
+    # The single output spectral features (the merged dummy data is sampled at 4 Hz)
+    default_feats = {
+        "spectral": {
+            name: config
+            for name, config in get_features_by_domain("spectral")["spectral"].items()
+            if config["n_features"] == 1
+        }
+    }
+    feats = {
+        "spectral": {
+            name: {**config, "parameters": {**config["parameters"], "fs": 4}}
+            if "fs" in config["parameters"]
+            else config
+            for name, config in default_feats["spectral"].items()
+        }
+    }
+
+    res = {}
+    for name, functions in [
+        ("single", tsfel_feature_dict_wrapper(feats)),
+        ("domain", tsfel_domain_wrapper(default_feats, fs=4)),
+        ("domain_index_fs", tsfel_domain_wrapper(default_feats)),
+    ]:
+        fc = FeatureCollection(
+            MultipleFeatureDescriptors(
+                functions=functions,
+                series_names="ACC_x",
+                windows="1min",
+                strides="5min",
+            )
+        )
+        res[name] = fc.calculate(
+            dummy_data.first("1h").astype(float), return_df=True, n_jobs=0
+        )
+
+    assert res["domain"].shape == res["single"].shape
+    for name in ["domain", "domain_index_fs"]:
+        assert (res[name].dtypes == np.float64).all()
+        assert np.allclose(
+            res[name][res["single"].columns],
+            res["single"].astype(float),
+            equal_nan=True,
+        )
+
+    # The fs is set once for all the features, which are applied on np.array windows
+    func = tsfel_domain_wrapper(feats, fs=8)
+    assert func.input_type is np.array
+    assert all(
+        params["fs"] == 8 for _, params in func.kwargs["features"] if "fs" in params
+    )
+    assert any("fs" in params for _, params in func.kwargs["features"])
+    assert func._bind_sampling_rates([4.0]) is func
+    # Without fs, the fs is set to the sampling rate of the series
+    func = tsfel_domain_wrapper(default_feats)._bind_sampling_rates([4.0])
+    assert func.input_type is np.array
+    assert all(
+        params["fs"] == 4 for _, params in func.kwargs["features"] if "fs" in params
+    )
+
+    # The FFT is computed only once per signal; i.e., the window and the signals
+    # derived by some features (e.g., the demeaned window of fundamental_frequency)
+    nb_fft_calls = []
+    func = tsfel_domain_wrapper(feats, fs=4)
+    calc_fft = func.kwargs["shared_fft"].calc_fft
+    func.kwargs["shared_fft"].calc_fft = lambda *args: nb_fft_calls.append(1) or (
+        calc_fft(*args)
+    )
+    func(np.random.default_rng(0).normal(size=1_000))
+    assert 1 <= len(nb_fft_calls) <= 3  # instead of 16 (nb. FFT-based features)
+    # The calc_fft of tsfel is only replaced while evaluating the features
+    from tsfel.feature_extraction import features as tsfel_features
+
+    assert tsfel_features.calc_fft is calc_fft
+
+
 ## CATCH22
 
 
@@ -328,6 +495,45 @@ def test_catch22_all_features(dummy_data):
     assert (res_df.shape[0] > 0) and (res_df.shape[1]) > 0
 
 
+def test_catch22_subset_features(dummy_data):
+    from pycatch22 import catch22_all
+
+    names = ["DN_HistogramMode_5", "CO_f1ecac", "SB_MotifThree_quantile_hh"]
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=catch22_wrapper(catch22_all),
+            series_names=["EDA", "TMP"],
+            windows="2.5min",
+            strides="5min",
+        )
+    )
+    res_all = fc.calculate(dummy_data.first("1h"), return_df=True, n_jobs=0)
+    assert res_all.shape[1] == 22 * 2
+
+    # Only compute the selected catch22 features
+    fc_subset = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=catch22_wrapper(catch22_all, names),
+            series_names=["EDA", "TMP"],
+            windows="2.5min",
+            strides="5min",
+        )
+    )
+    res_subset = fc_subset.calculate(dummy_data.first("1h"), return_df=True, n_jobs=0)
+    assert res_subset.shape[1] == 3 * 2
+    assert np.allclose(res_subset, res_all[res_subset.columns], equal_nan=True)
+
+    # The reduced feature collection only computes the retained catch22 features
+    cols = ["EDA__CO_f1ecac__w=2m30s", "TMP__DN_HistogramMode_5__w=2m30s"]
+    fc_reduced = fc.reduce(cols)
+    assert fc_reduced.get_nb_output_features() == 2
+    res_reduced = fc_reduced.calculate(dummy_data.first("1h"), return_df=True)
+    assert np.allclose(res_reduced[cols], res_all[cols], equal_nan=True)
+
+    with pytest.raises(AssertionError):
+        catch22_wrapper(catch22_all, ["DN_Mean"])
+
+
 ## ANTROPY
 
 # With the current version that is used for Python 3.7, a small bug is present in the
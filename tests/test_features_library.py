@@ -0,0 +1,692 @@
+"""Tests for the feature library functionality."""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+from tsflex.features import (
+    FeatureCollection,
+    FuncWrapper,
+    MultipleFeatureDescriptors,
+    PairwiseFeatureDescriptor,
+)
+from tsflex.features.intermediate import power_spectrum
+from tsflex.features.library import (
+    get_approximate_distinct_count_feature,
+    get_approximate_entropy_feature,
+    get_approximate_quantile_features,
+    get_decomposable_features,
+    get_median_feature,
+    get_pairwise_features,
+    get_permutation_entropy_feature,
+    get_quantile_features,
+    get_sample_entropy_feature,
+    get_spectral_features,
+    get_statistical_features,
+    get_svd_entropy_feature,
+    get_temporal_features,
+)
+from tsflex.features.library.complexity import (
+    approximate_entropy,
+    permutation_entropy,
+    sample_entropy,
+    svd_entropy,
+)
+from tsflex.features.library.order_statistics import sliding_median, sliding_quantile
+from tsflex.features.library.pairwise import (
+    coherence,
+    correlation,
+    covariance,
+    cross_correlation_lag,
+)
+from tsflex.features.library.sketches import (
+    approximate_distinct_count,
+    approximate_quantile,
+)
+from tsflex.features.library.spectral import (
+    band_power,
+    spectral_centroid,
+    spectral_edge,
+    spectral_entropy,
+)
+from tsflex.features.library.statistical import kurtosis, skewness
+from tsflex.features.library.temporal import (
+    autocorrelation,
+    mean_crossing_rate,
+    peak_count,
+    slope,
+    zero_crossing_rate,
+)
+
+from .utils import dummy_data
+
+## STATISTICAL
+
+
+def test_statistical_feature_functions():
+    from scipy.stats import kurtosis as scipy_kurtosis
+    from scipy.stats import skew
+
+    x = np.random.default_rng(0).exponential(size=(5, 100))
+    assert np.allclose(skewness(x), skew(x, axis=1))
+    assert np.allclose(kurtosis(x), scipy_kurtosis(x, axis=1))
+    assert np.isclose(skewness(x[2]), skew(x[2]))
+    assert np.isnan(skewness(np.ones(10))) and np.isnan(kurtosis(np.ones(10)))
+
+
+def test_statistical_features(dummy_data):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=get_statistical_features(),
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 9
+
+    fc_np = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                FuncWrapper(np.mean, "mean"),
+                FuncWrapper(np.std, "std"),
+                FuncWrapper(np.ptp, "range"),
+                FuncWrapper(lambda x: np.sqrt(np.mean(x**2)), "rms"),
+                FuncWrapper(skewness, "skewness"),
+            ],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res_np = fc_np.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert np.allclose(res[res_np.columns], res_np, equal_nan=True)
+
+
+## TEMPORAL
+
+
+def test_temporal_feature_functions():
+    x = np.random.default_rng(0).standard_normal((5, 200))
+    x[1] = np.arange(200) * 0.5 + 3
+
+    zcr = zero_crossing_rate(x)
+    assert np.isclose(zcr[0], np.mean(np.diff(np.sign(x[0])) != 0))
+    assert zcr[1] == 0
+    assert np.isclose(mean_crossing_rate(x)[1], 1 / 199)
+    assert np.allclose(
+        slope(x, fs=4), [np.polyfit(np.arange(200) / 4, w, 1)[0] for w in x]
+    )
+    assert np.isclose(slope(x[1]), 0.5)
+
+    ac_1, ac_5 = autocorrelation(x, lags=[1, 5])
+    for lag, ac in [(1, ac_1), (5, ac_5)]:
+        d = x[0] - x[0].mean()
+        assert np.isclose(
+            ac[0], np.sum(d[:-lag] * d[lag:]) / ((200 - lag) * np.var(x[0]))
+        )
+    assert np.allclose(autocorrelation(x, lags=1), ac_1)
+    assert np.isnan(autocorrelation(np.ones(10)))
+
+    from scipy.signal import find_peaks
+
+    assert np.array_equal(peak_count(x), [len(find_peaks(w)[0]) for w in x])
+
+
+def test_temporal_features(dummy_data):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=get_temporal_features(lags=[1, 4], fs=4),
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 6
+    assert "TMP__autocorrelation_lag_4__w=5m" in res.columns
+    assert np.all(res["EDA__zero_crossing_rate__w=5m"].between(0, 1))
+
+
+## SPECTRAL
+
+
+@pytest.mark.parametrize("nperseg", [None, 16, 20])
+@pytest.mark.parametrize("window", ["hann", "hamming", "boxcar"])
+def test_power_spectrum(nperseg, window):
+    x = np.random.default_rng(0).standard_normal((7, 64))
+    psd = power_spectrum(fs=4, nperseg=nperseg, window=window)(x)
+    nperseg_ = 64 if nperseg is None else nperseg
+    _, psd_scipy = welch(x, fs=4, nperseg=nperseg_, window=window, axis=-1)
+    assert np.allclose(psd, psd_scipy)
+    # Batched computation equals the window per window computation
+    assert np.allclose(
+        psd[3], power_spectrum(fs=4, nperseg=nperseg, window=window)(x[3])
+    )
+
+
+def test_power_spectrum_odd_nperseg():
+    x = np.random.default_rng(0).standard_normal((3, 50))
+    psd = power_spectrum(fs=2, nperseg=15)(x)
+    _, psd_scipy = welch(x, fs=2, nperseg=15, nfft=16, axis=-1)
+    assert psd.shape == (3, 9)
+    assert np.allclose(psd, psd_scipy)
+
+
+def test_spectral_feature_functions():
+    fs = 10
+    t = np.arange(200) / fs
+    x = np.vstack([np.sin(2 * np.pi * 2 * t), np.sin(2 * np.pi * 4 * t), 0 * t])
+    psd = power_spectrum(fs=fs)(x)
+
+    centroid = spectral_centroid(psd, fs=fs)
+    assert np.allclose(centroid[:2], [2, 4], atol=0.05)
+    assert np.isnan(centroid[2])
+    edge = spectral_edge(psd, fs=fs, q=0.5)
+    assert np.allclose(edge[:2], [2, 4], atol=0.05)
+    assert np.isnan(edge[2])
+    entropy = spectral_entropy(psd, normalize=True)
+    assert np.all((entropy[:2] >= 0) & (entropy[:2] < 0.2))
+    assert np.isnan(entropy[2])
+    low, high = band_power(psd, bands=[(0, 3), (3, 5.1)], fs=fs)
+    assert low[0] > 100 * high[0] and high[1] > 100 * low[1]
+    # The total power equals the variance of the signal
+    assert np.allclose(low[:2] + high[:2], np.var(x[:2], axis=-1), rtol=0.01)
+
+    # Window per window
+    assert np.isclose(spectral_centroid(psd[0], fs=fs), centroid[0])
+    assert np.isclose(spectral_entropy(psd[1], normalize=True), entropy[1])
+
+
+def test_spectral_features(dummy_data):
+    bands = [(0, 0.5), (0.5, 2)]
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=get_spectral_features(fs=4, nperseg=64, bands=bands),
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 5
+    assert "EDA__band_power_0.5-2__w=5m" in res.columns
+
+    # Compare with the window per window computation
+    eda = dummy_data["EDA"].dropna()
+    window = eda[res.index[1] - np.timedelta64(5, "m") : res.index[1]][:-1].values
+    psd = power_spectrum(fs=4, nperseg=64)(window)
+    assert np.isclose(
+        res["EDA__spectral_centroid__w=5m"].iloc[1], spectral_centroid(psd, 4)
+    )
+    assert np.isclose(
+        res["EDA__spectral_edge_0.9__w=5m"].iloc[1], spectral_edge(psd, 4, 0.9)
+    )
+
+
+## ORDER STATISTICS
+
+
+@pytest.mark.parametrize("window", [4096, 5001])
+@pytest.mark.parametrize("step", [1, 7, 500])
+def test_sliding_order_statistics(window, step):
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).standard_normal(8_000).round(2)  # duplicates
+    x[6_000] = np.nan
+    nb_windows = (len(x) - window) // step + 1
+    windows = _sliding_strided_window(x, window, step, nb_windows)
+
+    assert np.array_equal(
+        sliding_median(windows), np.median(windows, axis=1), equal_nan=True
+    )
+    qs = [0, 0.1, 0.33, 0.5, 0.75, 1]
+    assert np.array_equal(
+        np.array(sliding_quantile(windows, qs)),
+        np.quantile(windows, qs, axis=1),
+        equal_nan=True,
+    )
+    assert np.array_equal(
+        sliding_quantile(windows, 0.25),
+        np.quantile(windows, 0.25, axis=1),
+        equal_nan=True,
+    )
+    # Not a strided view (i.e., a copy) -> numpy fallback
+    assert np.array_equal(
+        sliding_median(windows[::3].copy()),
+        np.median(windows[::3], axis=1),
+        equal_nan=True,
+    )
+
+
+def test_sorted_blocks():
+    from tsflex.features.library.order_statistics import _SortedBlocks
+
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 100, 1_000).astype(float).tolist()  # duplicates
+    sorted_blocks = _SortedBlocks(values)
+    for _ in range(3_000):
+        if rng.random() < 0.55 or not values:
+            value = float(rng.integers(0, 100))
+            values.append(value)
+            sorted_blocks.add(value)
+        else:
+            value = values.pop(rng.integers(len(values)))
+            sorted_blocks.remove(value)
+    assert max(map(len, sorted_blocks.blocks)) <= 2 * _SortedBlocks._BLOCK_SIZE
+    assert sorted_blocks.maxes == [block[-1] for block in sorted_blocks.blocks]
+    positions = [0, len(values) // 3, len(values) - 1]
+    assert sorted_blocks.take(positions) == [sorted(values)[p] for p in positions]
+
+
+def test_sliding_order_statistics_dispatch():
+    from tsflex.features.library.order_statistics import _sliding_take_sorted
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).standard_normal(20_000)
+    positions = np.array([2048])
+    # The window is not sufficiently larger than the step -> numpy is faster
+    windows = _sliding_strided_window(x, 4096, 256, 50)
+    assert _sliding_take_sorted(windows, positions) is None
+    windows = _sliding_strided_window(x, 4096, 16, 50)
+    assert np.array_equal(
+        _sliding_take_sorted(windows, positions)[:, 0],
+        np.sort(windows, axis=1)[:, 2048],
+    )
+
+
+def test_order_statistic_features(dummy_data):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[get_median_feature(), get_quantile_features([0.1, 0.9])],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 3
+    assert "TMP__quantile_0.9__w=5m" in res.columns
+
+    fc_np = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                np.median,
+                FuncWrapper(
+                    np.quantile, ["quantile_0.1", "quantile_0.9"], q=[0.1, 0.9]
+                ),
+            ],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res_np = fc_np.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert np.allclose(res[res_np.columns], res_np, equal_nan=True)
+
+
+## SKETCHES
+
+
+@pytest.mark.parametrize("window, step", [(20_000, 2_000), (6_000, 4_000), (500, 700)])
+def test_approximate_quantile(window, step):
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).standard_normal(60_000)
+    windows = _sliding_strided_window(x, window, step, (len(x) - window) // step + 1)
+    qs = [0.05, 0.5, 0.95]
+    approx = np.array(approximate_quantile(windows, qs, rank_error=0.005))
+    assert approx.shape == (3, len(windows))
+    for q, approx_q in zip(qs, approx):
+        ranks = np.mean(windows < approx_q[:, None], axis=1)
+        assert np.all(np.abs(ranks - q) <= 0.005 + 1 / window)
+    # Exact when the blocks are small enough
+    small = windows[:, :50].copy()
+    assert np.allclose(
+        approximate_quantile(small, 0.3), np.quantile(small, 0.3, axis=1)
+    )
+
+
+def test_approximate_distinct_count():
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).integers(0, 20_000, 100_000).astype(float)
+    x[:10] = np.nan
+    windows = _sliding_strided_window(x, 30_000, 5_000, 15)
+    approx = approximate_distinct_count(windows, relative_error=0.02)
+    exact = np.array([len(np.unique(w[~np.isnan(w)])) for w in windows])
+    assert np.all(np.abs(approx / exact - 1) < 0.1)
+    assert np.allclose(
+        approximate_distinct_count(np.array([[0.0, -0.0, 1.0, 1.0, np.nan]])),
+        2,
+        atol=0.1,
+    )
+
+
+def test_approximate_distinct_count_memory_cap(monkeypatch):
+    from tsflex.features.library import sketches
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).integers(0, 500, 20_000).astype(float)
+    # Small gcd (i.e., block size) of the window and stride -> many blocks
+    windows = _sliding_strided_window(x, 1_000, 7, (len(x) - 1_000) // 7 + 1)
+    expected = approximate_distinct_count(windows)
+
+    # Above the cap, each window is sketched directly (which gives the same registers)
+    monkeypatch.setattr(sketches, "_MAX_HLL_REGISTERS_SIZE", 2**16)
+    nb_calls = []
+    hll_registers = sketches._hll_registers
+    monkeypatch.setattr(
+        sketches,
+        "_hll_registers",
+        lambda blocks, p: nb_calls.append(len(blocks)) or hll_registers(blocks, p),
+    )
+    assert np.allclose(approximate_distinct_count(windows), expected)
+    assert len(nb_calls) > 1 and max(nb_calls) * 8 * windows.shape[1] <= 2**16
+
+
+def test_sketch_features(dummy_data):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                get_approximate_quantile_features([0.1, 0.9], rank_error=0.01),
+                get_approximate_distinct_count_feature(),
+            ],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 3
+    assert "EDA__approx_nunique__w=5m" in res.columns
+    assert np.all(
+        res["TMP__approx_quantile_0.1__w=5m"] <= res["TMP__approx_quantile_0.9__w=5m"]
+    )
+
+
+## DECOMPOSABLE
+
+
+def test_block_statistics():
+    from tsflex.features.intermediate import _intermediate_cache
+    from tsflex.features.library.decomposable import block_statistics
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).standard_normal(10_000)
+    stats = block_statistics()
+    segmentations = [
+        _sliding_strided_window(x, window, step, (len(x) - window) // step + 1)
+        for window, step in [(600, 100), (300, 150), (1000, 500), (100, 50)]
+    ]
+    with _intermediate_cache() as cache:
+        stats.prepare(segmentations)
+        for windows in segmentations:
+            window = windows.shape[1]
+            res = stats(windows)
+            assert np.allclose(res["count"], window)
+            assert np.allclose(res["sum"], windows.sum(axis=1))
+            assert np.allclose(res["sumsq"], (windows**2).sum(axis=1))
+            assert np.allclose(res["min"], windows.min(axis=1))
+            assert np.allclose(res["max"], windows.max(axis=1))
+            assert np.allclose(res["mean"], windows.mean(axis=1))
+            assert np.allclose(res["m2"] / window, windows.var(axis=1))
+        # All the block statistics are derived from the shared blocks (i.e., gcd)
+        (records,) = cache.values()
+        assert len(records) == 1 and records[0][1] == 50
+
+    # Single window & window per window
+    res = stats(x[:77])
+    assert np.isclose(res["mean"], x[:77].mean()) and np.isclose(
+        res["max"], x[:77].max()
+    )
+
+
+def test_decomposable_features(dummy_data):
+    windows = ["1min", "2min", "5min", "15min"]
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=get_decomposable_features(),
+            series_names=["EDA", "TMP"],
+            windows=windows,
+            strides="1min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 4 * 8
+
+    fc_np = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                FuncWrapper(len, "count"),
+                FuncWrapper(np.sum, "sum"),
+                FuncWrapper(lambda x: np.sum(x**2), "sumsq"),
+                FuncWrapper(np.min, "min"),
+                FuncWrapper(np.max, "max"),
+                FuncWrapper(np.mean, "mean"),
+                FuncWrapper(np.var, "var"),
+                FuncWrapper(np.std, "std"),
+            ],
+            series_names=["EDA", "TMP"],
+            windows=windows,
+            strides="1min",
+        )
+    )
+    res_np = fc_np.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert np.allclose(res[res_np.columns], res_np, equal_nan=True)
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_decomposable_features_shared_blocks(dummy_data, tmp_path, monkeypatch, n_jobs):
+    from tsflex.features.library import decomposable
+
+    # Log the block sizes of the computed block results (also in the worker processes)
+    log_path = tmp_path / "block_sizes.txt"
+    block_partials = decomposable._block_partials
+
+    def logged_block_partials(blocks):
+        with open(log_path, "a") as f:
+            f.write(f"{blocks.shape[1]}\n")
+        return block_partials(blocks)
+
+    monkeypatch.setattr(decomposable, "_block_partials", logged_block_partials)
+
+    # The coarsest window is processed first
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=get_decomposable_features(["mean", "max"]),
+            series_names=["EDA", "TMP"],
+            windows=["15min", "5min", "2min", "1min"],
+            strides=["2min", "1min"],
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=n_jobs)
+    assert res.shape[1] == 2 * 2 * 4
+    # The block results are computed once per series (with a 1min = 240 samples block)
+    assert log_path.read_text().split() == ["240", "240"]
+
+
+## COMPLEXITY
+
+
+def _brute_force_entropy(x, order, approximate):
+    # O(N^2) reference implementation of the sample & approximate entropy
+    r = 0.2 * np.std(x)
+    n = len(x)
+
+    def nb_matches(length, nb_templates):
+        emb = np.array([x[i : i + length] for i in range(nb_templates)])
+        return np.sum(np.max(np.abs(emb[:, None] - emb[None]), axis=-1) <= r, axis=1)
+
+    if approximate:
+        phi_m = np.mean(np.log(nb_matches(order, n - order + 1) / (n - order + 1)))
+        phi_m1 = np.mean(np.log(nb_matches(order + 1, n - order) / (n - order)))
+        return phi_m - phi_m1
+    b = np.sum(nb_matches(order, n - order) - 1)
+    a = np.sum(nb_matches(order + 1, n - order) - 1)
+    return -np.log(a / b)
+
+
+@pytest.mark.parametrize("order", [1, 2, 3])
+def test_sample_approximate_entropy(order):
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).standard_normal(1_000)
+    x[500:] = x[500:].round(1)  # duplicates
+    windows = _sliding_strided_window(x, 300, 100, 8)
+    sampen = sample_entropy(windows, order=order)
+    apen = approximate_entropy(windows, order=order)
+    assert sampen.shape == apen.shape == (8,)
+    for idx, window in enumerate(windows):
+        assert np.isclose(sampen[idx], _brute_force_entropy(window, order, False))
+        assert np.isclose(apen[idx], _brute_force_entropy(window, order, True))
+    # Single window
+    assert np.isclose(sample_entropy(windows[3], order=order), sampen[3])
+
+    # NaNs & constant windows
+    assert np.isnan(sample_entropy(np.array([1.0, np.nan, 2, 3, 4, 5])))
+    assert sample_entropy(np.ones(50)) == 0 and approximate_entropy(np.ones(50)) == 0
+
+
+def test_permutation_svd_entropy():
+    ant = pytest.importorskip("antropy")
+    from tsflex.features.segmenter.strided_rolling import _sliding_strided_window
+
+    x = np.random.default_rng(0).standard_normal(2_000)
+    for window, step in [(500, 100), (300, 500)]:
+        nb_windows = (len(x) - window) // step + 1
+        windows = _sliding_strided_window(x, window, step, nb_windows)
+        for order, delay in [(3, 1), (4, 2)]:
+            assert np.allclose(
+                permutation_entropy(windows, order, delay, normalize=True),
+                [ant.perm_entropy(w, order, delay, normalize=True) for w in windows],
+            )
+            assert np.allclose(
+                svd_entropy(windows, order, delay),
+                [ant.svd_entropy(w, order, delay) for w in windows],
+            )
+        # Not a strided view (i.e., a copy)
+        assert np.allclose(
+            permutation_entropy(windows.copy()), permutation_entropy(windows)
+        )
+    assert np.isclose(permutation_entropy(x[:500]), ant.perm_entropy(x[:500]))
+
+
+def test_complexity_features(dummy_data):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            functions=[
+                get_sample_entropy_feature(),
+                get_approximate_entropy_feature(),
+                get_permutation_entropy_feature(normalize=True),
+                get_svd_entropy_feature(normalize=True),
+            ],
+            series_names=["EDA", "TMP"],
+            windows="5min",
+            strides="2.5min",
+        )
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 2 * 4
+    assert "EDA__sample_entropy__w=5m" in res.columns
+    assert np.all(res["TMP__permutation_entropy__w=5m"].between(0, 1))
+    assert np.all(res["TMP__svd_entropy__w=5m"].between(0, 1))
+
+
+## PAIRWISE
+
+
+def test_pairwise_feature_functions():
+    rng = np.random.default_rng(0)
+    windows = rng.standard_normal((6, 200, 3))
+    windows[..., 1] = np.roll(windows[..., 0], 7, axis=1) + 0.1 * windows[..., 1]
+    windows[3, :, 2] = 1  # constant series
+
+    assert np.allclose(covariance(windows), [np.cov(w.T) for w in windows])
+    assert np.allclose(
+        covariance(windows, ddof=0), [np.cov(w.T, ddof=0) for w in windows]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        assert np.allclose(
+            correlation(windows), [np.corrcoef(w.T) for w in windows], equal_nan=True
+        )
+    assert np.all(np.isnan(correlation(windows)[3, :, 2]))
+
+    def xcorr_lag(x, y, max_lag):
+        x, y = x - x.mean(), y - y.mean()
+        lags = np.arange(-max_lag, max_lag + 1)
+        xcorr = [
+            np.sum(
+                x[max(0, -lag) : len(x) - max(0, lag)]
+                * y[max(0, lag) : len(y) - max(0, -lag)]
+            )
+            for lag in lags
+        ]
+        return lags[np.argmax(xcorr)]
+
+    for max_lag in [None, 20]:
+        lags = cross_correlation_lag(windows, max_lag=max_lag)
+        assert lags.shape == (6, 3, 3)
+        assert np.all(lags[:, 0, 1] == 7) and np.all(lags[:, 1, 0] == -7)
+        m = windows.shape[1] - 1 if max_lag is None else max_lag
+        for w, w_lags in zip(windows, lags):
+            assert w_lags[0, 2] == xcorr_lag(w[:, 0], w[:, 2], m)
+            assert w_lags[1, 2] == xcorr_lag(w[:, 1], w[:, 2], m)
+
+
+def test_coherence():
+    from scipy.signal import coherence as scipy_coherence
+
+    rng = np.random.default_rng(0)
+    windows = rng.standard_normal((5, 600, 3))
+    windows[..., 1] = np.roll(windows[..., 0], 3, axis=1) + 0.5 * windows[..., 1]
+    windows[3, :, 2] = 1  # constant series
+
+    for kwargs, band in [
+        ({"nperseg": 64}, (0, 5)),
+        ({"nperseg": 100, "noverlap": 20, "window": "hamming"}, (0, 5)),
+        ({"nperseg": 64, "fmin": 1, "fmax": 3}, (1, 3)),
+    ]:
+        coh = coherence(windows, fs=10, **kwargs)
+        assert coh.shape == (5, 3, 3)
+        assert np.allclose(coh, coh.transpose(0, 2, 1), equal_nan=True)
+        for w, w_coh in zip(windows, coh):
+            for i, j in [(0, 1), (0, 2), (1, 2)]:
+                f, expected = scipy_coherence(
+                    w[:, i],
+                    w[:, j],
+                    fs=10,
+                    **{"window": "hann", **kwargs_scipy(kwargs)},
+                )
+                if np.all(w[:, j] == 1):
+                    assert np.isnan(w_coh[i, j])
+                    continue
+                band_mask = (f > band[0]) & (f <= band[1])
+                assert np.isclose(w_coh[i, j], expected[band_mask].mean())
+    # The shifted series are (much) more coherent than the independent series
+    assert np.all(coh[:, 0, 1] > 0.5) and np.all(coh[[0, 1, 2, 4], 0, 2] < 0.3)
+
+
+def kwargs_scipy(kwargs: dict) -> dict:
+    return {k: v for k, v in kwargs.items() if k not in ["fmin", "fmax"]}
+
+
+def test_pairwise_features(dummy_data):
+    series_names = ["ACC_x", "ACC_y", "ACC_z"]
+    fc = FeatureCollection(
+        [
+            PairwiseFeatureDescriptor(f, series_names, "30s", "15s")
+            # The (merged) data is sampled at 4 Hz; i.e., 120 samples per window
+            for f in get_pairwise_features(max_lag=16, nperseg=32)
+        ]
+    )
+    res = fc.calculate(dummy_data, return_df=True, n_jobs=0)
+    assert res.shape[1] == 3 * 4
+    assert "ACC_x|ACC_z__cross_correlation_lag__w=30s" in res.columns
+    coh = res["ACC_x|ACC_y__coherence__w=30s"].dropna()
+    assert np.all(coh.between(0, 1)) and np.any(coh < 1)
+    assert np.all(res["ACC_y|ACC_z__correlation__w=30s"].dropna().between(-1, 1))
+    assert np.all(res["ACC_x|ACC_y__cross_correlation_lag__w=30s"].abs() <= 16)
@@ -2,19 +2,23 @@
 
 __author__ = "Jeroen Van Der Donckt, Emiel Deprost, Jonas Van Der Donckt"
 
+import json
 import os
 import warnings
 
 import numpy as np
+import pytest
 
 from tsflex.features import (
     FeatureCollection,
     FeatureDescriptor,
+    MetricsCollector,
     MultipleFeatureDescriptors,
     get_feature_logs,
     get_function_stats,
     get_series_names_stats,
 )
+from tsflex.features.logger import logger
 from tsflex.utils.data import flatten
 
 from .utils import dummy_data, logging_file_path
@@ -674,3 +678,74 @@ def test_file_warning_features_logging(dummy_data, logging_file_path):
         assert "already exists" in str(w[0])
         # CLEANUP
         os.remove(logging_file_path)
+
+
+@pytest.mark.parametrize("n_jobs", [0, 2])
+def test_features_metrics_collector(dummy_data, logging_file_path, n_jobs, tmp_path):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            [np.min, np.sum], series_names=["EDA", "TMP"], windows="5s", strides="12s"
+        )
+    )
+    metrics = MetricsCollector(file_path=tmp_path / "metrics.jsonl")
+    _ = fc.calculate(
+        dummy_data,
+        logging_file_path=logging_file_path,
+        metrics_collector=metrics,
+        n_jobs=n_jobs,
+    )
+    assert len(metrics) == 4
+
+    # The records contain the same info as the logging file
+    sort_cols = ["function", "series_names"]
+    logging_df = get_feature_logs(logging_file_path).sort_values(sort_cols)
+    metrics_df = get_feature_logs(metrics).sort_values(sort_cols)
+    assert all(metrics_df.columns == logging_df.columns)
+    assert all(metrics_df.dtypes == logging_df.dtypes)
+    for col in ["function", "series_names", "window", "stride", "output_names"]:
+        assert list(metrics_df[col]) == list(logging_df[col])
+    assert np.isclose(metrics_df["duration %"].sum(), 100, atol=0.5)
+
+    assert set(get_function_stats(metrics).index) == set(
+        get_function_stats(logging_file_path).index
+    )
+    assert set(get_series_names_stats(metrics).index) == set(
+        get_series_names_stats(logging_file_path).index
+    )
+
+    # The records are appended as JSON lines
+    with open(tmp_path / "metrics.jsonl") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 4
+    assert all(line["record"] == "FeatureRecord" for line in lines)
+    assert {line["output_names"] for line in lines} == set(logging_df["output_names"])
+
+    # The records are added on each call
+    _ = fc.calculate(dummy_data, metrics_collector=metrics, n_jobs=n_jobs)
+    assert len(metrics) == 8
+    metrics.clear()
+    assert len(metrics) == 0 and len(get_feature_logs(metrics)) == 0
+
+
+def test_features_logging_multiprocessing(dummy_data, logging_file_path):
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(
+            [np.min, np.max, np.sum],
+            series_names=["EDA", "TMP", "ACC_x", "ACC_y"],
+            windows=["5s", "10s"],
+            strides="12s",
+        )
+    )
+    _ = fc.calculate(dummy_data, logging_file_path=logging_file_path, n_jobs=4)
+
+    # The workers their records are all written (by the parent) to the logging file
+    with open(logging_file_path) as f:
+        lines = f.readlines()
+    assert len(lines) == 3 * 4 * 2
+    assert all(" - feature_calculation_logger - INFO - Finished" in ln for ln in lines)
+    logging_df = get_feature_logs(logging_file_path)
+    assert set(logging_df["output_names"]) == set(
+        fc.calculate(dummy_data, return_df=True, n_jobs=0).columns
+    )
+    # Only the StreamHandler remains (in the parent process)
+    assert len(logger.handlers) == 1
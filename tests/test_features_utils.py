@@ -6,7 +6,13 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from tsflex.features import FeatureCollection, FuncWrapper, MultipleFeatureDescriptors
+from tsflex.features import (
+    FeatureCollection,
+    FeatureDescriptor,
+    FuncWrapper,
+    MultipleFeatureDescriptors,
+)
+from tsflex.features.segmenter.strided_rolling import SequenceStridedRolling
 from tsflex.features.utils import make_robust
 
 from .utils import dummy_data
@@ -147,3 +153,88 @@ def test_robust_pass_through_features(dummy_data):
 
     res_df = feature_collection.calculate(eda_data, return_df=True, n_jobs=0)
     assert not res_df.isna().any().any()
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+@pytest.mark.parametrize("passthrough_nans", [False, True])
+def test_robust_features_fast_path(dummy_data, vectorized, passthrough_nans):
+    min_nb_samples = 30
+    eda_data = dummy_data["EDA"].dropna()
+    eda_data[
+        np.random.choice(len(eda_data), len(eda_data) // 3, replace=False)
+    ] = np.nan
+    eda_data[100:200] = np.nan  # some windows do not meet the min_nb_samples
+
+    robust_funcs = make_robust(
+        [
+            FuncWrapper(np.mean, vectorized=vectorized, axis=-1),
+            FuncWrapper(np.ptp, vectorized=vectorized, axis=-1),  # no nan-variant
+        ],
+        min_nb_samples=min_nb_samples,
+        passthrough_nans=passthrough_nans,
+        error_val=-1,
+    )
+    fc = FeatureCollection(
+        MultipleFeatureDescriptors(robust_funcs, "EDA", windows=40, strides=20)
+    )
+    res_df = fc.calculate(eda_data.reset_index(drop=True), return_df=True)
+
+    # Compare with applying the robust function window per window
+    values = eda_data.values
+    for robust_func, name in zip(robust_funcs, ["mean", "ptp"]):
+        expected = [
+            robust_func(values[start : start + 40])
+            for start in res_df.index.values - 40
+        ]
+        assert np.allclose(res_df[f"EDA__{name}__w=40"], expected, equal_nan=True)
+    # Only when the NaNs are masked out, windows do not meet the min_nb_samples
+    assert passthrough_nans != (res_df["EDA__mean__w=40"] == -1).any()
+    assert passthrough_nans == res_df["EDA__mean__w=40"].isna().any()
+
+
+def test_robust_vectorized_features_axis_no_nan_variant():
+    # A vectorized function (with axis=1) without a nan-variant is applied vectorized
+    # on the windows with the same number of NaNs (of which the NaNs are masked out)
+    data = pd.Series(np.arange(100, dtype=float), name="a")
+    data[np.arange(3, 100, 7)] = np.nan
+    robust_func = make_robust(
+        FuncWrapper(np.ptp, output_names="ptp", vectorized=True, axis=1),
+        passthrough_nans=False,
+    )
+    fc = FeatureCollection(FeatureDescriptor(robust_func, "a", 10, 5))
+    res_df = fc.calculate(data, return_df=True)
+
+    values = data.values
+    expected = [
+        np.ptp(values[start : start + 10][~np.isnan(values[start : start + 10])])
+        for start in res_df.index.values - 10
+    ]
+    assert np.allclose(res_df["a__ptp__w=10"], expected)
+
+    # The function is called once per distinct number of NaNs (i.e., 1 or 2)
+    stroll = SequenceStridedRolling(data, 10, [5], window_idx="end")
+    assert np.allclose(stroll.apply_func(robust_func).values.ravel(), expected)
+    assert stroll.apply_func_stats.nb_func_calls == 2
+
+    # Multiple series; the windows are grouped by the number of NaNs of each series
+    data_b = pd.Series(np.arange(100, dtype=float) ** 2, name="b")
+    data_b[np.arange(0, 100, 4)] = np.nan
+    robust_func = make_robust(
+        FuncWrapper(
+            lambda a, b: np.ptp(a, axis=1) - np.mean(b, axis=1),
+            output_names="ptp_diff",
+            vectorized=True,
+        ),
+        passthrough_nans=False,
+    )
+    stroll = SequenceStridedRolling([data, data_b], 10, [5], window_idx="begin")
+    res = stroll.apply_func(robust_func).values.ravel()
+    expected = [
+        np.ptp(a[~np.isnan(a)]) - np.mean(b[~np.isnan(b)])
+        for a, b in (
+            (values[start : start + 10], data_b.values[start : start + 10])
+            for start in stroll.index.values
+        )
+    ]
+    assert np.allclose(res, expected)
+    assert stroll.apply_func_stats.nb_func_calls == 4
@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 
 from tsflex.processing import (
+    MetricsCollector,
     SeriesPipeline,
     SeriesProcessor,
     dataframe_func,
@@ -104,3 +105,36 @@ def test_file_warning_processing_logging(dummy_data, logging_file_path):
         assert len(w) == 1
         assert all([issubclass(warn.category, RuntimeWarning) for warn in w])
         assert "already exists" in str(w[0])
+
+
+def test_processing_metrics_collector(dummy_data, logging_file_path):
+    def interpolate(series: pd.Series) -> pd.Series:
+        return series.interpolate()
+
+    @dataframe_func
+    def drop_nans(df: pd.DataFrame) -> pd.DataFrame:
+        return df.dropna()
+
+    inp = dummy_data.copy()
+    inp.loc[inp["TMP"] > 31.5, "TMP"] = pd.NA
+    series_pipeline = SeriesPipeline(
+        [
+            SeriesProcessor(series_names=["TMP", "ACC_x"], function=interpolate),
+            SeriesProcessor(series_names="TMP", function=drop_nans),
+        ]
+    )
+
+    metrics = MetricsCollector()
+    _ = series_pipeline.process(
+        inp, logging_file_path=logging_file_path, metrics_collector=metrics
+    )
+    assert len(metrics) == len(series_pipeline.processing_steps)
+
+    # The records contain the same info as the logging file
+    logging_df = get_processor_logs(logging_file_path)
+    metrics_df = get_processor_logs(metrics)
+    assert all(metrics_df.columns == logging_df.columns)
+    assert all(metrics_df.dtypes == logging_df.dtypes)
+    for col in ["function", "series_names", "output_names"]:
+        assert list(metrics_df[col]) == list(logging_df[col])
+    assert all(metrics_df["duration"] > pd.Timedelta(0))
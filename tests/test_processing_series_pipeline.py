@@ -10,7 +10,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from tsflex.processing import SeriesPipeline, SeriesProcessor, dataframe_func
+from tsflex.processing import (
+    SeriesPipeline,
+    SeriesProcessor,
+    TaskHooks,
+    dataframe_func,
+)
 from tsflex.processing.series_pipeline import _ProcessingError
 
 from .utils import dummy_data
@@ -434,3 +439,43 @@ def test_serialization(dummy_data):
         equal_nan=True,
     )
     os.remove(save_path)
+
+
+def test_task_hooks_series_pipeline(dummy_data):
+    def interpolate(series: pd.Series) -> pd.Series:
+        return series.interpolate()
+
+    def raise_error(series: pd.Series) -> pd.Series:
+        raise ValueError("error")
+
+    inp = dummy_data.copy()
+    inp.loc[inp["TMP"] > 31.5, "TMP"] = pd.NA
+    series_pipeline = SeriesPipeline(
+        [
+            SeriesProcessor(series_names=["TMP", "ACC_x"], function=interpolate),
+            SeriesProcessor(series_names="TMP", function=np.abs),
+        ]
+    )
+
+    hooks = TaskHooks(
+        on_task_start=lambda info: info["function"], on_task_end=lambda info: info
+    )
+    res = series_pipeline.process(inp, return_df=True, hooks=hooks)
+    assert res.equals(series_pipeline.process(inp, return_df=True))
+
+    assert [e.hook for e in hooks.events] == ["on_task_start", "on_task_end"] * 2
+    assert [e.output for e in hooks.events[::2]] == ["interpolate", "absolute"]
+    end_info = hooks.events[1].output
+    assert end_info["series_names"] == [("TMP",), ("ACC_x",)]
+    assert end_info["duration"] > 0
+    assert end_info["output_shapes"] == {
+        "TMP": inp["TMP"].shape,
+        "ACC_x": inp["ACC_x"].shape,
+    }
+
+    # The error hook is invoked when a processing step fails
+    hooks = TaskHooks(on_error=lambda info, e: str(e))
+    series_pipeline.append(SeriesProcessor(raise_error, series_names="TMP"))
+    with pytest.raises(_ProcessingError):
+        series_pipeline.process(inp, hooks=hooks)
+    assert [(e.hook, e.output) for e in hooks.events] == [("on_error", "error")]
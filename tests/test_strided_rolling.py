@@ -11,6 +11,7 @@ from tsflex.features.segmenter.strided_rolling import (
     TimeIndexSampleStridedRolling,
     TimeStridedRolling,
 )
+from tsflex.utils.data import to_series_list
 
 from .utils import dummy_data
 
@@ -1860,3 +1861,406 @@ def test_various_time_zones():
             window=pd.Timedelta(3, unit="h"),
             strides=[pd.Timedelta(3, unit="h")],
         )
+
+
+def test_stroll_apply_func_stack_series():
+    df = pd.DataFrame(
+        np.random.randn(100, 3),
+        columns=["x", "y", "z"],
+        index=pd.date_range("2020-01-01", freq="1s", periods=100),
+    )
+
+    def magnitude(x, y, z):
+        return np.mean(np.sqrt(x**2 + y**2 + z**2))
+
+    def magnitude_stacked(xyz):
+        return np.mean(np.linalg.norm(xyz, axis=-1), axis=-1)
+
+    f = FuncWrapper(magnitude, output_names="mag")
+    f_stacked = FuncWrapper(magnitude_stacked, output_names="mag", stack_series=True)
+    f_stacked_vect = FuncWrapper(
+        magnitude_stacked, output_names="mag", vectorized=True, stack_series=True
+    )
+
+    sr = TimeStridedRolling(
+        df, window=pd.Timedelta(seconds=10), strides=[pd.Timedelta(seconds=5)]
+    )
+    res = sr.apply_func(f)
+    assert res.columns.tolist() == ["x|y|z__mag__w=10s"]
+    for f_ in [f_stacked, f_stacked_vect]:
+        res_stacked = sr.apply_func(f_)
+        assert res_stacked.columns.tolist() == ["x|y|z__mag__w=10s"]
+        assert np.all(res.index == res_stacked.index)
+        assert np.allclose(res.values, res_stacked.values)
+
+    # Series that do not share the same index cannot be stacked
+    sr = TimeStridedRolling(
+        [df["x"], df["y"].iloc[::2]],
+        window=pd.Timedelta(seconds=10),
+        strides=[pd.Timedelta(seconds=5)],
+        approve_sparsity=True,
+    )
+    with pytest.raises(AssertionError):
+        sr.apply_func(f_stacked)
+
+
+def test_stack_1d_arrays_view():
+    from tsflex.features.segmenter.strided_rolling import _stack_1d_arrays
+
+    df = pd.DataFrame(np.random.randn(50, 4), columns=["a", "b", "c", "d"])
+    arrs = [df[c].values for c in df.columns]
+    stacked = _stack_1d_arrays(arrs)
+    assert stacked.shape == (50, 4)
+    assert np.all(stacked == df.values)
+    assert np.shares_memory(stacked, arrs[0])  # no copy is made
+    assert not stacked.flags.writeable
+
+    # Arrays from different memory blocks are copied
+    arrs = [np.random.randn(50), np.random.randn(50)]
+    stacked = _stack_1d_arrays(arrs)
+    assert np.all(stacked == np.stack(arrs, axis=-1))
+    assert not np.shares_memory(stacked, arrs[0])
+
+
+def test_stroll_apply_func_output_dtype():
+    s = pd.Series(np.arange(21, dtype=float), name="dummy")
+    sr = SequenceStridedRolling(s, window=5, strides=[5], window_idx="begin")
+
+    def min_max(x):
+        return np.min(x), int(np.max(x))
+
+    # Tuple outputs are written in a (typed) float array, not in an object array
+    res = sr.apply_func(FuncWrapper(min_max, output_names=["min", "max"]))
+    assert all(dtype == np.float64 for dtype in res.dtypes)
+    assert np.all(res.values == [[0, 4], [5, 9], [10, 14], [15, 19]])
+
+    # The declared output dtype is used
+    for dtype in [np.float32, np.int32]:
+        f = FuncWrapper(min_max, output_names=["min", "max"], output_dtype=dtype)
+        res = sr.apply_func(f)
+        assert all(res_dtype == dtype for res_dtype in res.dtypes)
+        f = FuncWrapper(
+            np.max, output_names="max", output_dtype=dtype, vectorized=True, axis=1
+        )
+        assert sr.apply_func(f).values.dtype == dtype
+
+    # Outputs that do not fit in a numeric array are still supported
+    def max_or_str(x):
+        return np.max(x) if np.max(x) < 10 else "too large"
+
+    res = sr.apply_func(FuncWrapper(max_or_str))
+    expected = np.array([max_or_str(s.values[i : i + 5]) for i in range(0, 20, 5)])
+    assert np.all(res.values.ravel() == expected)
+
+    # A complex output after float outputs is not cast (i.e., its imaginary part is
+    # not discarded)
+    def max_or_complex(x):
+        return np.max(x) if np.max(x) < 10 else np.max(x) + 1j
+
+    res = sr.apply_func(FuncWrapper(max_or_complex))
+    expected = [max_or_complex(s.values[i : i + 5]) for i in range(0, 20, 5)]
+    assert np.iscomplexobj(res.values)
+    assert np.all(res.values.ravel() == expected)
+
+
+def test_stroll_apply_func_sequential_overhead():
+    import time
+
+    s = pd.Series(np.random.default_rng(0).random(200_000), name="dummy")
+    sr = SequenceStridedRolling(s, window=100, strides=[10], window_idx="begin")
+    sc = sr.series_containers[0]
+
+    def timeit(func) -> float:
+        durations = []
+        for _ in range(5):
+            t_start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - t_start)
+        return min(durations)
+
+    # The per-window overhead of apply_func should not exceed that of mapping the
+    # FuncWrapper over a list of the window views
+    for f in [FuncWrapper(len), FuncWrapper(lambda x: (x[0], x[-1]), ["a", "b"])]:
+        reference = timeit(
+            lambda: np.array(
+                list(
+                    map(
+                        f,
+                        [
+                            sc.values[start:end]
+                            for start, end in zip(sc.start_indexes, sc.end_indexes)
+                        ],
+                    )
+                )
+            )
+        )
+        assert timeit(lambda: sr.apply_func(f)) < 1.5 * reference
+
+
+def test_stroll_apply_func_stats():
+    s = pd.Series(np.arange(21, dtype=float), name="dummy")
+    sr = SequenceStridedRolling(s, window=5, strides=[5], window_idx="begin")
+    assert sr.apply_func_stats is None
+
+    sr.apply_func(FuncWrapper(np.max))
+    assert sr.apply_func_stats.nb_windows == 4
+    assert sr.apply_func_stats.nb_func_calls == 4
+    assert sr.apply_func_stats.elapsed > 0
+
+    sr.apply_func(FuncWrapper(np.max, vectorized=True, axis=1))
+    assert sr.apply_func_stats.nb_windows == 4
+    assert sr.apply_func_stats.nb_func_calls == 1
+
+
+def test_stroll_apply_func_auto_vectorized():
+    s = pd.Series(np.random.default_rng(0).random(21), name="dummy")
+    sr = SequenceStridedRolling(s, window=5, strides=[5], window_idx="begin")
+
+    f_auto = FuncWrapper(np.std, vectorized="auto", ddof=1)
+    assert f_auto._vectorizable is None
+    res_auto = sr.apply_func(f_auto)
+    assert f_auto._vectorizable
+    assert sr.apply_func_stats.nb_func_calls == 1
+    res_seq = sr.apply_func(FuncWrapper(np.std, ddof=1))
+    assert np.allclose(res_auto.values, res_seq.values)
+
+    # Function that ignores the axis argument -> falls back to the sequential loop
+    def ignore_axis(x, axis=None):
+        return np.max(x)
+
+    f_ignore = FuncWrapper(ignore_axis, vectorized="auto")
+    res_ignore = sr.apply_func(f_ignore)
+    assert f_ignore._vectorizable is False
+    assert sr.apply_func_stats.nb_func_calls == 4
+    assert np.all(res_ignore.values.ravel() == s.values[:20].reshape(4, 5).max(axis=1))
+
+    # Function without axis argument -> not vectorizable (without probing)
+    f_no_axis = FuncWrapper(lambda x: x[0], output_names="first", vectorized="auto")
+    assert f_no_axis._vectorizable is False
+    assert np.all(sr.apply_func(f_no_axis).values.ravel() == s.values[[0, 5, 10, 15]])
+
+    # Irregular segmentation -> silently falls back to the sequential loop
+    sr_irreg = SequenceStridedRolling(
+        s,
+        window=None,
+        strides=None,
+        segment_start_idxs=np.array([0, 2, 10]),
+        segment_end_idxs=np.array([4, 9, 12]),
+    )
+    res_irreg = sr_irreg.apply_func(FuncWrapper(np.std, vectorized="auto"))
+    assert sr_irreg.apply_func_stats.nb_func_calls == 3
+    assert np.allclose(
+        res_irreg.values.ravel(),
+        [np.std(s.values[i:j]) for i, j in [(0, 4), (2, 9), (10, 12)]],
+    )
+
+
+def test_stroll_apply_func_intermediate():
+    from tsflex.features.intermediate import _intermediate_cache, diff, welch_psd
+
+    s = pd.Series(np.random.default_rng(0).random(100), name="dummy")
+    sr = SequenceStridedRolling(s, window=20, strides=[10], window_idx="begin")
+    expected = [np.abs(np.diff(s.values[i : i + 20])).mean() for i in range(0, 71, 10)]
+
+    f = FuncWrapper(lambda x: np.abs(x).mean(), "mad", intermediate=diff())
+    assert np.allclose(sr.apply_func(f).values.ravel(), expected)
+    f_vect = FuncWrapper(
+        lambda x: np.abs(x).mean(axis=1), "mad", vectorized=True, intermediate=diff()
+    )
+    assert np.allclose(sr.apply_func(f_vect).values.ravel(), expected)
+
+    # The intermediate is cached (& shared) within the cache context
+    f_psd = FuncWrapper(np.sum, "psd_sum", intermediate=welch_psd(nperseg=8))
+    with _intermediate_cache() as cache:
+        res = sr.apply_func(f_psd)
+        assert len(cache) == 1
+        ((_, cached),) = cache.values()
+        assert cached.shape == (8, 5) and not cached.flags.writeable
+        assert np.allclose(res.values.ravel(), cached.sum(axis=1))
+        sr.apply_func(f_psd)
+        assert len(cache) == 1
+
+    # Segmentations with the same window, stride & nb. windows but another offset
+    # do not share the intermediate
+    sr_offset = SequenceStridedRolling(
+        s, window=20, strides=[10], start_idx=5, end_idx=95, window_idx="begin"
+    )
+    assert len(sr_offset.index) == len(sr.index)
+    with _intermediate_cache() as cache:
+        sr.apply_func(f_psd)
+        res = sr_offset.apply_func(f_psd)
+        assert len(cache) == 2
+    expected = [
+        np.sum(welch_psd(nperseg=8)(s.values[i : i + 20])) for i in range(5, 76, 10)
+    ]
+    assert np.allclose(res.values.ravel(), expected)
+
+    # Array kwargs are identified by their content (and not by their truncated repr)
+    window_a, window_b = np.ones(2000), np.ones(2000)
+    window_b[1000] = 0
+    assert repr(window_a) == repr(window_b)
+    assert (
+        welch_psd(nperseg=2000, window=window_a).key
+        != welch_psd(nperseg=2000, window=window_b).key
+    )
+    assert (
+        welch_psd(nperseg=2000, window=window_a).key
+        == welch_psd(nperseg=2000, window=window_a.copy()).key
+    )
+
+    # Irregular segmentation -> intermediate is computed window per window
+    sr_irreg = SequenceStridedRolling(
+        s,
+        window=None,
+        strides=None,
+        segment_start_idxs=np.array([0, 10, 30]),
+        segment_end_idxs=np.array([5, 30, 35]),
+    )
+    res = sr_irreg.apply_func(f)
+    expected = [
+        np.abs(np.diff(s.values[i:j])).mean() for i, j in [(0, 5), (10, 30), (30, 35)]
+    ]
+    assert np.allclose(res.values.ravel(), expected)
+    with pytest.raises(AssertionError):
+        sr_irreg.apply_func(f_vect)
+
+
+def test_stroll_apply_func_series_intermediate_cache():
+    from tsflex.features.intermediate import SeriesIntermediate, _intermediate_cache
+
+    def weighted_prefix_sum(values, weights):
+        return np.concatenate([[0], np.cumsum(values * weights)])
+
+    def window_sum(prefix, start_indexes, end_indexes):
+        return prefix[end_indexes] - prefix[start_indexes]
+
+    s = pd.Series(np.random.default_rng(0).random(2000), name="dummy")
+    sr = SequenceStridedRolling(s, window=100, strides=[50], window_idx="begin")
+    # The weights only differ in their (by the repr truncated) middle part
+    weights_a, weights_b = np.ones(2000), np.ones(2000)
+    weights_b[1000] = 0
+    assert repr(weights_a) == repr(weights_b)
+
+    res = []
+    with _intermediate_cache() as cache:
+        for weights in [weights_a, weights_b, weights_a.copy()]:
+            intermediate = SeriesIntermediate(
+                weighted_prefix_sum, window_sum, name="wsum", weights=weights
+            )
+            f = FuncWrapper(lambda x: x, "wsum", intermediate=intermediate)
+            res.append(sr.apply_func(f).values.ravel())
+        # A precomputation & a result for each distinct weights
+        assert len(cache) == 2 * 2
+    expected = [s.values[i : i + 100].sum() for i in sr.index.values]
+    assert np.allclose(res[0], expected)
+    assert not np.allclose(res[0], res[1])
+    assert np.allclose(res[0], res[2])
+
+
+def test_get_sampling_period():
+    from tsflex.features.segmenter.strided_rolling import _get_sampling_period
+
+    time_index = pd.date_range("2020-01-01", freq="250ms", periods=100)
+    assert _get_sampling_period(time_index) == 250 * 10**6  # freq is used
+    time_index_no_freq = pd.DatetimeIndex(list(time_index))
+    assert time_index_no_freq.freq is None
+    assert _get_sampling_period(time_index_no_freq) == 250 * 10**6
+    assert _get_sampling_period(time_index.tz_localize("Europe/Brussels")) == 25e7
+    assert _get_sampling_period(pd.RangeIndex(0, 20, 2)) == 2
+    assert _get_sampling_period(pd.Index([3, 6, 9, 12])) == 3
+
+    # Irregularly sampled data
+    assert _get_sampling_period(time_index[[0, 1, 3]]) is None
+    assert _get_sampling_period(pd.Index([0, 1, 3])) is None
+    # Float indexes do not allow exact arithmetic
+    assert _get_sampling_period(pd.Index([0.0, 0.5, 1.0])) is None
+    # Too short indexes
+    assert _get_sampling_period(pd.RangeIndex(1)) is None
+
+
+def test_get_sampling_rate():
+    from tsflex.features.segmenter.strided_rolling import _get_sampling_rate
+
+    time_index = pd.date_range("2020-01-01", freq="250ms", periods=100)
+    assert _get_sampling_rate(time_index) == 4
+    assert _get_sampling_rate(pd.RangeIndex(0, 20, 2)) == 0.5
+    # Irregularly sampled data -> the average sampling rate
+    assert np.isclose(_get_sampling_rate(time_index[[0, 1, 3, 4]]), 3)
+    assert _get_sampling_rate(time_index[:1]) is None
+
+
+def test_time_stroll_dst_index():
+    from tsflex.features.segmenter.strided_rolling import _get_sampling_period
+
+    # A daily tz-aware index that crosses a DST change -> UTC steps of 23h & 25h
+    index = pd.date_range("2021-03-20", periods=15, freq="D", tz="Europe/Brussels")
+    assert _get_sampling_period(index) is None
+    s = pd.Series(np.arange(len(index), dtype=float), index=index, name="dummy")
+
+    sr = TimeStridedRolling(
+        s, window=pd.Timedelta("2D"), strides=[pd.Timedelta("1D")], window_idx="begin"
+    )
+    res = sr.apply_func(FuncWrapper(np.min))
+    # Compare with the (searchsorted based) start indexes of the windows
+    start_idxs = np.searchsorted(index.values, res.index.values, "left")
+    assert np.all(res.values.ravel() == s.values[start_idxs])
+
+
+def test_searchsorted_regular():
+    from tsflex.features.segmenter.strided_rolling import _searchsorted_regular
+
+    rng = np.random.default_rng(42)
+    for first, period, length in [(0, 1, 100), (5, 3, 50), (-7, 2, 10)]:
+        idx = first + period * np.arange(length)
+        values = rng.integers(first - 20, first + period * length + 20, size=1_000)
+        assert np.all(
+            _searchsorted_regular(first, period, length, values)
+            == np.searchsorted(idx, values, "left")
+        )
+
+
+def test_stroll_regular_segmentation_indexes():
+    s = pd.Series(
+        np.arange(100.0),
+        index=pd.date_range("2020-01-01", freq="250ms", periods=100),
+        name="dummy",
+    )
+    s_irregular = s.drop(s.index[[10, 11, 50]])
+
+    for window, stride, include_final_window in [
+        ("2s", "1s", False),
+        ("2s", "1s", True),
+        ("2s", "0.75s", False),
+        ("1.1s", "1s", True),
+    ]:
+        window, stride = pd.Timedelta(window), pd.Timedelta(stride)
+        for data in [s, s_irregular, [s, s_irregular]]:
+            sr = TimeStridedRolling(
+                data,
+                window,
+                [stride],
+                include_final_window=include_final_window,
+                approve_sparsity=True,
+            )
+            np_start_times = sr._get_np_start_idx_for_stride(stride)
+            np_end_times = np_start_times + window.to_timedelta64()
+            for sc, series in zip(sr.series_containers, to_series_list(data)):
+                np_idx_times = series.index.values
+                assert np.all(
+                    sc.start_indexes
+                    == np.searchsorted(np_idx_times, np_start_times, "left")
+                )
+                assert np.all(
+                    sc.end_indexes
+                    == np.searchsorted(np_idx_times, np_end_times, "left")
+                )
+
+    # Regular segmentations are known to have same window & stride (in samples)
+    sr = TimeStridedRolling(s, pd.Timedelta("2s"), [pd.Timedelta("1s")])
+    assert sr.series_containers[0].window_stride_samples == (8, 4)
+    sr = TimeStridedRolling(s, pd.Timedelta("2s"), [pd.Timedelta("0.1s")])
+    assert sr.series_containers[0].window_stride_samples is None
+    sr = TimeStridedRolling(s_irregular, pd.Timedelta("2s"), [pd.Timedelta("1s")])
+    assert sr.series_containers[0].window_stride_samples is None
+    sr = SequenceStridedRolling(s.reset_index(drop=True), 8, [4])
+    assert sr.series_containers[0].window_stride_samples == (8, 4)
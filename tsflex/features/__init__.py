@@ -7,7 +7,13 @@
 __author__ = "Jonas Van Der Donckt, Jeroen Van Der Donckt, Emiel Deprost"
 
 from .. import __pdoc__
-from .feature import FeatureDescriptor, MultipleFeatureDescriptors
+from ..utils.hooks import TaskHooks
+from ..utils.metrics import MetricsCollector
+from .feature import (
+    FeatureDescriptor,
+    MultipleFeatureDescriptors,
+    PairwiseFeatureDescriptor,
+)
 from .feature_collection import FeatureCollection
 from .function_wrapper import FuncWrapper
 from .logger import get_feature_logs, get_function_stats, get_series_names_stats
@@ -18,10 +24,13 @@ __pdoc__["FuncWrapper.__call__"] = True
 __all__ = [
     "FeatureDescriptor",
     "MultipleFeatureDescriptors",
+    "PairwiseFeatureDescriptor",
     "FeatureCollection",
     "FuncWrapper",
     "StridedRollingFactory",
     "get_feature_logs",
     "get_function_stats",
     "get_series_names_stats",
+    "MetricsCollector",
+    "TaskHooks",
 ]
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 """
 
-FeatureDescriptor and MultipleFeatureDescriptors class for creating time-series
-features.
+FeatureDescriptor, PairwiseFeatureDescriptor and MultipleFeatureDescriptors class for
+creating time-series features.
 
 """
 
 import itertools
 from typing import Callable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from ..utils.attribute_parsing import AttributeParser, DataType
@@ -193,6 +194,15 @@ class FeatureDescriptor(FrozenClass):
         """
         return len(self.function.output_names)
 
+    def _get_output_index_keys(self) -> List[Tuple[Tuple[str, ...], str]]:
+        """Return the (series names, feature name) of each function output.
+
+        These are used to construct the output column names (see
+        `StridedRolling.construct_output_index`) and are in the same order as the
+        `output_names` of the function.
+        """
+        return [(self.series_name, o) for o in self.function.output_names]
+
     def __repr__(self) -> str:
         """Representation string of Feature."""
         return (
@@ -201,6 +211,133 @@ class FeatureDescriptor(FrozenClass):
         )
 
 
+def _apply_pairwise_func(
+    windows: np.ndarray,
+    pairwise_func: Callable,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    **kwargs,
+) -> np.ndarray:
+    """Apply the pairwise function on the stacked windows and select the pairs.
+
+    Returns an array with shape (nb. windows, nb. outputs x nb. pairs).
+    """
+    out = pairwise_func(windows, **kwargs)
+    out = out if isinstance(out, tuple) else (out,)
+    return np.concatenate([np.asarray(m)[:, rows, cols] for m in out], axis=1)
+
+
+class PairwiseFeatureDescriptor(FeatureDescriptor):
+    """A FeatureDescriptor for pairwise (i.e., cross-series) features.
+
+    Instead of creating a `FeatureDescriptor` for each pair of series, this descriptor
+    computes a pair statistic (e.g., the correlation) for all the pairs of the given
+    series at once. All the series are segmented once and the function is applied
+    (vectorized) on the stacked window block.
+
+    Parameters
+    ----------
+    function : Union[FuncWrapper, Callable]
+        The function that calculates the pairwise feature(s).
+        The prototype of the function should match: \n
+
+            function(windows: np.ndarray)
+                -> Union[np.ndarray, Tuple[np.ndarray, ...]]
+
+        Where `windows` has shape (nb. windows, window size, nb. series) and each
+        returned array has shape (nb. windows, nb. series, nb. series); i.e., the
+        `[:, i, j]` entries hold the statistic of the pair
+        (`series_names[i]`, `series_names[j]`). When a `FuncWrapper` is passed, its
+        `output_names` should contain a name for each returned array and its keyword
+        arguments are passed to the function.<br>
+        Ready-made pairwise functions can be found in
+        `tsflex.features.library.pairwise`.
+    series_names : Union[List[str], Tuple[str, ...]]
+        The names of the (at least 2) series whose pairs are used. As the series are
+        stacked, these should share the same index.
+    window : Union[float, str, pd.Timedelta], optional
+        The window size. See `FeatureDescriptor` for more information.
+    stride : Union[float, str, pd.Timedelta, List[Union[float, str, pd.Timedelta]]], optional
+        The stride size(s). See `FeatureDescriptor` for more information.
+
+    Notes
+    -----
+    * Only the pairs (`series_names[i]`, `series_names[j]`) with `i < j` are
+      outputted, with as column name
+      `<series_names[i]>|<series_names[j]>__<output_name>__w=<window>`. Hence, the
+      pair statistic should be symmetric (or anti-symmetric).
+    * As the function is applied on the stacked windows, all the segmented windows
+      should contain the same number of samples.
+
+    """
+
+    def __init__(
+        self,
+        function: Union[FuncWrapper, Callable],
+        series_names: Union[List[str], Tuple[str, ...]],
+        window: Optional[Union[float, str, pd.Timedelta]] = None,
+        stride: Optional[
+            Union[float, str, pd.Timedelta, List[Union[float, str, pd.Timedelta]]]
+        ] = None,
+    ):
+        # Order of if statements is important (as FuncWrapper also is a Callable)!
+        if isinstance(function, FuncWrapper):
+            assert (
+                function.intermediate is None
+            ), "An intermediate can not be used in a pairwise function!"
+            assert (
+                function.input_type is np.array
+            ), "The input_type of a pairwise function must be np.array!"
+        elif isinstance(function, Callable):
+            function = FuncWrapper(function)
+        else:
+            raise TypeError(
+                "Expected feature function to be a `FuncWrapper` but is a"
+                f" {type(function)}."
+            )
+        series_names = (
+            list(series_names)
+            if isinstance(series_names, tuple)
+            else to_list(series_names)
+        )
+        assert len(series_names) >= 2, "A pairwise feature requires at least 2 series!"
+        assert len(set(series_names)) == len(series_names), "Duplicate series names!"
+
+        rows, cols = np.triu_indices(len(series_names), k=1)
+        self.pairwise_function: FuncWrapper = function
+        self.series_pairs: List[Tuple[str, str]] = [
+            (series_names[i], series_names[j]) for i, j in zip(rows, cols)
+        ]
+        super().__init__(
+            FuncWrapper(
+                _apply_pairwise_func,
+                output_names=[
+                    "|".join(pair + (name,))
+                    for name in function.output_names
+                    for pair in self.series_pairs
+                ],
+                vectorized=True,
+                output_dtype=function.output_dtype,
+                stack_series=True,
+                pairwise_func=function.func,
+                rows=rows,
+                cols=cols,
+                **function.kwargs,
+            ),
+            tuple(series_names),
+            window,
+            stride,
+        )
+        self._func_str = f"{self.__class__.__name__} - func: {self.pairwise_function}"
+
+    def _get_output_index_keys(self) -> List[Tuple[Tuple[str, ...], str]]:
+        return [
+            (pair, name)
+            for name in self.pairwise_function.output_names
+            for pair in self.series_pairs
+        ]
+
+
 class MultipleFeatureDescriptors:
     """Create a MultipleFeatureDescriptors object.
 
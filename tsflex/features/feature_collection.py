@@ -9,12 +9,16 @@ Methods, next to `FeatureCollection.calculate()`, worth looking at: \n
 from __future__ import annotations
 
 import warnings
+from functools import partial
 
 __author__ = "Jonas Van Der Donckt, Emiel Deprost, Jeroen Van Der Donckt"
 
 import os
+import time
 import traceback
+import tracemalloc
 import uuid
+from collections import namedtuple
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
@@ -25,15 +29,30 @@ import pandas as pd
 from multiprocess import Pool
 from tqdm.auto import tqdm
 
-from ..features.function_wrapper import FuncWrapper
+from ..features.function_wrapper import FuncWrapper, _get_name
 from ..utils.attribute_parsing import AttributeParser
 from ..utils.data import flatten, to_list, to_series_list
-from ..utils.logging import add_logging_handler, delete_logging_handlers
+from ..utils.hooks import HookEvent, TaskHooks, _TaskError
+from ..utils.logging import (
+    add_logging_handler,
+    delete_logging_handlers,
+    queue_logging_handler,
+)
+from ..utils.metrics import FeatureRecord, MetricsCollector
 from ..utils.time import parse_time_arg, timedelta_to_str
-from .feature import FeatureDescriptor, MultipleFeatureDescriptors
-from .logger import logger
+from .feature import (
+    FeatureDescriptor,
+    MultipleFeatureDescriptors,
+    PairwiseFeatureDescriptor,
+)
+from .intermediate import Intermediate, _intermediate_cache, _intermediate_scope
+from .logger import _get_feature_record, logger
 from .segmenter import StridedRolling, StridedRollingFactory
-from .utils import _check_start_end_array, _determine_bounds
+from .utils import (
+    _check_start_end_array,
+    _determine_bounds,
+    _is_equivalent_funcwrapper,
+)
 
 
 class FeatureCollection:
@@ -132,10 +151,10 @@ class FeatureCollection:
         """
         return len(
             set(
-                (series, o)
-                for (series, _), fd_list in self._feature_desc_dict.items()
+                output_index_key
+                for fd_list in self._feature_desc_dict.values()
                 for fd in fd_list
-                for o in fd.function.output_names
+                for output_index_key in fd._get_output_index_keys()
             )
         )
 
@@ -187,6 +206,10 @@ class FeatureCollection:
     def _add_feature(self, feature: FeatureDescriptor):
         """Add a `FeatureDescriptor` instance to the collection.
 
+        A feature that is identical to an already added feature (i.e., an equivalent
+        function with the same output names on the same series, window & strides) is
+        skipped.
+
         Parameters
         ----------
         feature : FeatureDescriptor
@@ -203,6 +226,15 @@ class FeatureCollection:
 
         series_win_stride_key = self._get_collection_key(feature)
         if series_win_stride_key in self._feature_desc_dict.keys():
+            # Skip the feature if an identical feature is already added (e.g., when
+            # the same function is added via multiple collections)
+            if any(
+                f.stride == feature.stride
+                and f.function.output_names == feature.function.output_names
+                and _is_equivalent_funcwrapper(f.function, feature.function)
+                for f in self._feature_desc_dict[series_win_stride_key]
+            ):
+                return
             added_output_names = flatten(
                 f.function.output_names
                 for f in self._feature_desc_dict[series_win_stride_key]
@@ -259,19 +291,323 @@ class FeatureCollection:
         # After adding the features, check whether the descriptors are compatible
         self._check_feature_descriptors(skip_none=True)
 
+    # A feature calculation task; the function of the first feature is applied on the
+    # segmentation of the (series, window) key with the given strides, after which the
+    # output of each feature is derived by selecting the windows of its feature strides
+    # (None = all windows) and renaming the output columns (see `_executor`).
+    _FeatureTask = namedtuple(
+        "_FeatureTask", ["key", "features", "strides", "feature_strides"]
+    )
+
+    @staticmethod
+    def _executor(idx: int) -> Tuple[List[pd.DataFrame], FeatureRecord]:
+        # global get_stroll_func
+        stroll, function, task = get_stroll_func(idx)
+        dfs = FeatureCollection._apply_task(stroll, function, task)
+        return dfs, FeatureCollection._get_task_record(stroll, function, dfs)
+
+    @staticmethod
+    def _profiled_executor(
+        idx: int,
+    ) -> Tuple[List[pd.DataFrame], FeatureRecord, Dict[str, Any]]:
+        """Execute the task and profile its segmentation, function and assembly.
+
+        The peak memory is the peak of the memory allocated (as traced by
+        `tracemalloc`) during the task, relative to the memory at its start.
+        """
+        # global get_stroll_func
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        mem_start = _reset_traced_memory_peak()
+        t_start = time.perf_counter()
+        stroll, function, task = get_stroll_func(idx)
+        t_segmented = time.perf_counter()
+        stroll.record_window_latencies = True
+        dfs = FeatureCollection._apply_task(stroll, function, task)
+        t_end = time.perf_counter()
+        peak_memory = tracemalloc.get_traced_memory()[1] - mem_start
+
+        stats = stroll.apply_func_stats
+        latencies = stats.window_latencies
+        if latencies is not None and len(latencies):
+            mean_latency = np.mean(latencies)
+            p99_latency = np.percentile(latencies, 99)
+        else:
+            # Vectorized execution -> there is no latency per window
+            mean_latency = (
+                stats.func_elapsed / stats.nb_windows if stats.nb_windows else np.nan
+            )
+            p99_latency = np.nan
+        series_key, window = task.key
+        profile = {
+            "function": _get_name(function.func),
+            "series_names": "|".join(series_key),
+            "window": FeatureCollection._ws_to_str(window),
+            "strides": "manual"
+            if task.strides is None
+            else tuple(map(FeatureCollection._ws_to_str, task.strides)),
+            "output_names": [c for df in dfs for c in df.columns],
+            "nb_windows": stats.nb_windows,
+            "nb_func_calls": stats.nb_func_calls,
+            "segmentation_time": t_segmented - t_start,
+            "function_time": stats.func_elapsed,
+            "assembly_time": t_end - t_segmented - stats.func_elapsed,
+            "mean_window_latency": mean_latency,
+            "p99_window_latency": p99_latency,
+            "peak_memory": peak_memory,
+        }
+        return dfs, FeatureCollection._get_task_record(stroll, function, dfs), profile
+
     @staticmethod
-    def _executor(idx: int):
+    def _hooked_executor(
+        idx: int, executor: Callable[[int], tuple], hooks: TaskHooks
+    ) -> Tuple[tuple, List[HookEvent]]:
+        """Execute the task with the `executor` and invoke the hooks around it."""
         # global get_stroll_func
-        stroll, function = get_stroll_func(idx)
-        return stroll.apply_func(function)
+        task = get_stroll_func.tasks[idx]
+        series_key, window = task.key
+        task_info = {
+            "function": _get_name(task.features[0].function.func),
+            "series_names": series_key,
+            "window": window,
+            "strides": task.strides,
+        }
+
+        def get_output_info(output: tuple) -> Dict[str, Any]:
+            output_names = [c for df in output[0] for c in df.columns]
+            nb_windows = max((len(df) for df in output[0]), default=0)
+            return {
+                "output_names": output_names,
+                "output_shape": (nb_windows, len(output_names)),
+            }
+
+        events = []
+        try:
+            output = hooks._run_task(
+                task_info, partial(executor, idx), get_output_info, events
+            )
+        except Exception as e:
+            # Pass the hook events (of the failed task) to the main process
+            raise _TaskError(f"{type(e).__name__}: {e}", events) from e
+        return output, events
+
+    @staticmethod
+    def _batch_executor(batch: List[int], executor: Callable[[int], tuple]) -> list:
+        """Execute the batch of tasks and evict their intermediates afterwards."""
+        outputs = []
+        with _intermediate_scope():
+            for idx in batch:
+                try:
+                    outputs.append(executor(idx))
+                except _TaskError as e:
+                    # Pass the hook events of the completed tasks of the batch as well
+                    e.events[:0] = [event for _, events in outputs for event in events]
+                    raise
+        return outputs
+
+    @staticmethod
+    def _get_task_record(
+        stroll: StridedRolling, function: FuncWrapper, dfs: List[pd.DataFrame]
+    ) -> FeatureRecord:
+        return _get_feature_record(
+            _get_name(function.func),
+            stroll.series_key,
+            stroll.window,
+            stroll.strides,
+            [c for df in dfs for c in df.columns],
+            stroll.apply_func_stats.elapsed,
+        )
+
+    @staticmethod
+    def _apply_task(
+        stroll: StridedRolling, function: FuncWrapper, task: _FeatureTask
+    ) -> List[pd.DataFrame]:
+        df = stroll.apply_func(function)
+        if (
+            len(task.features) == 1
+            and task.feature_strides[0] is None
+            and not isinstance(task.features[0], PairwiseFeatureDescriptor)
+        ):
+            return [df]
+        # The features share their computation (or have custom output series keys)
+        # -> derive the output of each feature
+        dfs = []
+        for feature, feature_strides in zip(task.features, task.feature_strides):
+            col_names = {
+                stroll._create_feat_col_name(name): stroll._create_feat_col_name(
+                    feature_name, series_keys
+                )
+                for name, (series_keys, feature_name) in zip(
+                    function.output_names, feature._get_output_index_keys()
+                )
+            }
+            if feature_strides is not None:
+                dfs.append(
+                    df[stroll.get_stride_mask(feature_strides)].rename(
+                        columns=col_names
+                    )
+                )
+            else:
+                dfs.append(df.rename(columns=col_names))
+        return dfs
+
+    @staticmethod
+    def _group_equivalent_features(
+        features: List[FeatureDescriptor],
+    ) -> List[List[FeatureDescriptor]]:
+        """Group the features with equivalent functions (see `_is_equivalent_funcwrapper`).
+
+        Equivalent functions compute the same outputs on the same windows; hence their
+        computation can be shared.
+        """
+        groups: List[List[FeatureDescriptor]] = []
+        for feature in features:
+            for group in groups:
+                if _is_equivalent_funcwrapper(group[0].function, feature.function):
+                    group.append(feature)
+                    break
+            else:
+                groups.append([feature])
+        return groups
+
+    @staticmethod
+    def _get_nested_stride_groups(
+        features: List[FeatureDescriptor], nested: bool
+    ) -> List[List[FeatureDescriptor]]:
+        """Group the (equivalent) features whose windows are a subset of each other.
+
+        Features with the same strides are always grouped. If `nested` is True, features
+        are also grouped when all their strides are integer multiples of the smallest
+        stride in the group. In that case, the segmented windows of each feature are a
+        subset of the windows of the smallest stride; hence the function only needs to
+        be applied once on the windows of the smallest stride.
+
+        Note that only exact (i.e., `pd.Timedelta` or integer) strides are nested.
+        """
+
+        def is_exact(stride) -> bool:
+            return isinstance(stride, (pd.Timedelta, int, np.integer))
+
+        nested = nested and all(
+            is_exact(s) and s > type(s)(0) for s in flatten(f.stride for f in features)
+        )
+
+        def is_nested(strides, base_stride) -> bool:
+            return all(s % base_stride == type(s)(0) for s in strides)
+
+        # Each group is based on the (smallest) stride of its first feature; a feature
+        # is only nested in a group when all strides of the group's first feature and
+        # of the feature itself are integer multiples of this base stride
+        groups: List[List[FeatureDescriptor]] = []
+        for feature in sorted(features, key=lambda f: min(f.stride)):
+            for group in groups:
+                base_stride = min(group[0].stride)
+                if feature.stride == group[0].stride or (
+                    nested
+                    and is_nested(group[0].stride, base_stride)
+                    and is_nested(feature.stride, base_stride)
+                ):
+                    group.append(feature)
+                    break
+            else:
+                groups.append([feature])
+        return groups
+
+    def _get_feature_tasks(
+        self,
+        calc_stride: Union[List[Union[float, pd.Timedelta]], None],
+        shared_segmentation: bool,
+        nested_strides: bool,
+    ) -> List[FeatureCollection._FeatureTask]:
+        """Get the feature calculation tasks.
+
+        Features of the same series and window with equivalent functions are computed
+        only once (and their output is fanned out to each feature);
+
+        * if `shared_segmentation` is True (i.e., when a `calc_stride` or segment
+          indices are used), all these features share the same segmentation.
+        * otherwise, features with the same strides, or, if `nested_strides` is True,
+          features with nested strides are grouped (see `_get_nested_stride_groups`).
+        """
+        tasks = []
+        for key, features in self._feature_desc_dict.items():
+            for group in self._group_equivalent_features(features):
+                if shared_segmentation:
+                    tasks.append(
+                        self._FeatureTask(key, group, calc_stride, [None] * len(group))
+                    )
+                    continue
+                for nested_group in self._get_nested_stride_groups(
+                    group, nested=nested_strides
+                ):
+                    strides = nested_group[0].stride
+                    if any(f.stride != strides for f in nested_group):
+                        strides = [min(strides)]
+                    tasks.append(
+                        self._FeatureTask(
+                            key,
+                            nested_group,
+                            strides,
+                            [
+                                None if f.stride == strides else f.stride
+                                for f in nested_group
+                            ],
+                        )
+                    )
+        return tasks
+
+    @staticmethod
+    def _get_task_batches(
+        tasks: List[FeatureCollection._FeatureTask],
+    ) -> List[List[int]]:
+        """Group the (indexes of the) tasks that share an intermediate in batches.
+
+        The tasks of the same series, window & strides whose functions use the same
+        intermediate share the intermediate of their segmented windows; these are the
+        only consumers of this intermediate, which can thus be evicted after their
+        batch.
+        """
+        batches: Dict[Any, List[int]] = {}
+        for idx, task in enumerate(tasks):
+            intermediate = task.features[0].function.intermediate
+            if intermediate is None:
+                batches[idx] = [idx]
+                continue
+            strides = None if task.strides is None else tuple(task.strides)
+            batches.setdefault((task.key, strides, intermediate.key), []).append(idx)
+        return list(batches.values())
+
+    @staticmethod
+    def _prepare_intermediates(get_stroll_func: Callable) -> None:
+        """Prepare the intermediates that are shared by the tasks of each series.
 
-    # def _get_stroll(self, kwargs):
-    #     return StridedRollingFactory.get_segmenter(**kwargs)
+        The intermediates are prepared in this process (i.e., before the tasks are
+        dispatched), so that all the (forked) worker processes share the prepared
+        results, regardless of the order in which the tasks are processed.
+        """
+        intermediates: Dict[str, Intermediate] = {}
+        views: Dict[Tuple[str, str], List[np.ndarray]] = {}
+        for idx, task in enumerate(get_stroll_func.tasks):
+            intermediate = task.features[0].function.intermediate
+            if (
+                intermediate is None
+                or type(intermediate).prepare is Intermediate.prepare
+            ):
+                continue
+            stroll, _, _ = get_stroll_func(idx)
+            for sc in stroll.series_containers:
+                if len(sc.start_indexes) and stroll._is_regular_segmentation(sc):
+                    intermediates[intermediate.key] = intermediate
+                    views.setdefault((sc.name, intermediate.key), []).append(
+                        stroll._get_vectorized_view(sc)
+                    )
+        for (_, key), series_views in views.items():
+            intermediates[key].prepare(series_views)
 
     def _stroll_feat_generator(
         self,
+        tasks: List[FeatureCollection._FeatureTask],
         series_dict: Dict[str, pd.Series],
-        calc_stride: Union[List[Union[float, pd.Timedelta]], None],
         segment_start_idxs: Union[np.ndarray, None],
         segment_end_idxs: Union[np.ndarray, None],
         start_idx: Any,
@@ -279,29 +615,25 @@ class FeatureCollection:
         window_idx: str,
         include_final_window: bool,
         approve_sparsity: bool,
-    ) -> Callable[[int], Tuple[StridedRolling, FuncWrapper]]:
+        float_dtype: Optional[np.dtype],
+    ) -> Callable[
+        [int], Tuple[StridedRolling, FuncWrapper, FeatureCollection._FeatureTask]
+    ]:
         # --- Future work ---
         # We could also make the StridedRolling creation multithreaded
         # Very low priority because the STROLL __init__ is rather efficient!
-        keys_wins_strides = list(self._feature_desc_dict.keys())
-        lengths = np.cumsum(
-            [len(self._feature_desc_dict[k]) for k in keys_wins_strides]
-        )
-
-        def get_stroll_function(idx) -> Tuple[StridedRolling, FuncWrapper]:
-            key_idx = np.searchsorted(lengths, idx, "right")  # right bc idx starts at 0
-            key, win = keys_wins_strides[key_idx]
 
-            feature = self._feature_desc_dict[keys_wins_strides[key_idx]][
-                idx - lengths[key_idx]
-            ]
-            stride = feature.stride if calc_stride is None else calc_stride
-            function: FuncWrapper = feature.function
+        def get_stroll_function(
+            idx,
+        ) -> Tuple[StridedRolling, FuncWrapper, FeatureCollection._FeatureTask]:
+            task = tasks[idx]
+            key, win = task.key
+            function: FuncWrapper = task.features[0].function
             # The factory method will instantiate the right StridedRolling object
             stroll_arg_dict = dict(
                 data=[series_dict[k] for k in key],
                 window=win,
-                strides=stride,
+                strides=task.strides,
                 segment_start_idxs=segment_start_idxs,
                 segment_end_idxs=segment_end_idxs,
                 start_idx=start_idx,
@@ -310,17 +642,15 @@ class FeatureCollection:
                 include_final_window=include_final_window,
                 approve_sparsity=approve_sparsity,
                 func_data_type=function.input_type,
+                float_dtype=float_dtype,
             )
             stroll = StridedRollingFactory.get_segmenter(**stroll_arg_dict)
-            return stroll, function
+            return stroll, function, task
 
+        # The tasks are used by the hooks (see `_hooked_executor`)
+        get_stroll_function.tasks = tasks
         return get_stroll_function
 
-    def _get_stroll_feat_length(self) -> int:
-        return sum(
-            len(self._feature_desc_dict[k]) for k in self._feature_desc_dict.keys()
-        )
-
     def _check_no_multiple_windows(self):
         assert (
             self._get_nb_output_features_without_window()
@@ -357,7 +687,15 @@ class FeatureCollection:
         show_progress: Optional[bool] = False,
         logging_file_path: Optional[Union[str, Path]] = None,
         n_jobs: Optional[int] = None,
-    ) -> Union[List[pd.DataFrame], pd.DataFrame]:
+        float_dtype: Optional[Union[np.dtype, type, str]] = None,
+        profile: Optional[bool] = False,
+        metrics_collector: Optional[MetricsCollector] = None,
+        hooks: Optional[TaskHooks] = None,
+    ) -> Union[
+        List[pd.DataFrame],
+        pd.DataFrame,
+        Tuple[Union[List[pd.DataFrame], pd.DataFrame], pd.DataFrame],
+    ]:
         """Calculate features on the passed data.
 
         Parameters
@@ -478,6 +816,9 @@ class FeatureCollection:
             logging `FileHandler` will be used and the logging messages are only pushed
             to stdout. Otherwise, a logging `FileHandler` will write the logged messages
             to the given file path. See also the `tsflex.features.logger` module.
+            When multiprocessing, the workers route their logged messages (through a
+            queue) to this `FileHandler`, which writes them (in batches) in the main
+            process.
         n_jobs : int, optional
             The number of processes used for the feature calculation. If `None`, then
             the number returned by _os.cpu_count()_ is used, by default None. \n
@@ -496,11 +837,61 @@ class FeatureCollection:
                 multiprocessing. So if your sequential feature extraction code runs
                 faster than ~1s, it might not be worth it to parallelize the process
                 (and thus better leave `n_jobs` to 0 or 1).
+        float_dtype: Union[np.dtype, type, str], optional
+            The floating point dtype (e.g., `np.float32`) that is used for the
+            calculation, by default None. If None, the dtypes of the data and of the
+            function outputs are retained. \n
+            When set, the floating point series in `data` are cast (once) to this
+            dtype and the floating point feature outputs are stored in this dtype.
+            Integer and boolean series & outputs are not affected, and the
+            `output_dtype` of a `FuncWrapper` takes precedence.
+
+            .. tip::
+                Using `np.float32` roughly halves the memory (bandwidth) of the
+                segmented data and the size of the output, which is useful when the
+                downstream models only require single precision.
+        profile: bool, optional
+            Whether the feature calculation should be profiled, by default False. If
+            True, a tuple of the calculated features and a profiling DataFrame is
+            returned. The profiling DataFrame contains a row for each calculation task
+            (i.e., a function applied on a segmentation of the series, see the note
+            below), sorted by decreasing function time, with the columns:
+
+            * `function`, `series_names`, `window`, `strides` and `output_names`
+            * `nb_windows` & `nb_func_calls`: the number of segmented windows and
+              function calls (1 when the function is applied vectorized)
+            * `segmentation_time`, `function_time` & `assembly_time`: the time (in
+              seconds) spent in segmenting the data, applying the function and
+              assembling the output (DataFrame), respectively
+            * `mean_window_latency` & `p99_window_latency`: the mean and 99th
+              percentile duration (in seconds) of the function call on a window. For
+              vectorized execution, the mean is the function time divided by the number
+              of windows, and the 99th percentile is NaN.
+            * `peak_memory`: the peak memory (in bytes) allocated during the task, as
+              traced by `tracemalloc`
+
+            .. note::
+                Features (of the same series & window) with equivalent functions are
+                computed in a single task; their output names are thus listed in the
+                same row.<br>
+                The profiling (i.e., timing each window and tracing the memory
+                allocations) adds overhead to the feature calculation.
+        metrics_collector: MetricsCollector, optional
+            The collector to which the execution record (i.e., a `FeatureRecord`) of
+            each calculation task is added, by default None. The execution (time) info
+            can then be retrieved (without a logging file) by passing this collector to
+            e.g. `logger.get_function_stats`.
+        hooks: TaskHooks, optional
+            The hooks that are invoked around each calculation task, by default None.
+            The hooks are invoked in the process that executes the task, and their
+            (non-None) outputs are aggregated in the `events` of `hooks`. The
+            `task_info` contains the `function`, `series_names`, `window`, and `strides`
+            of the task (see `TaskHooks`).
 
         Returns
         -------
-        Union[List[pd.DataFrame], pd.DataFrame]
-            The calculated features.
+        Union[List[pd.DataFrame], pd.DataFrame, Tuple[Union[List[pd.DataFrame], pd.DataFrame], pd.DataFrame]]
+            The calculated features (and the profiling DataFrame if `profile` is True).
 
         Raises
         ------
@@ -510,8 +901,10 @@ class FeatureCollection:
         Notes
         ------
         * The (column-)names of the series in `data` represent the `series_names`.
-        * If a `logging_file_path` is provided, the execution (time) info can be
-          retrieved by calling `logger.get_feature_logs(logging_file_path)`.
+        * If a `logging_file_path` (or `metrics_collector`) is provided, the execution
+          (time) info can be retrieved by calling
+          `logger.get_feature_logs(logging_file_path)` (or
+          `logger.get_feature_logs(metrics_collector)`).
           Be aware that the `logging_file_path` gets cleared before the logger pushes
           logged messages. Hence, one should use a separate logging file for each
           constructed processing and feature instance with this library.
@@ -565,6 +958,10 @@ class FeatureCollection:
                 + "At least one of both should be None."
             )
 
+        if float_dtype is not None:
+            float_dtype = np.dtype(float_dtype)
+            assert float_dtype.kind == "f", "The float_dtype must be a float dtype!"
+
         if stride is not None:
             # Verify whether the stride complies with the input data dtype
             stride = [
@@ -587,6 +984,8 @@ class FeatureCollection:
             assert s.index.is_monotonic_increasing
 
             if s.name in self.get_required_series():
+                if float_dtype is not None and s.dtype.kind == "f":
+                    s = s.astype(float_dtype, copy=False)
                 series_dict[str(s.name)] = s
 
         # Determine the bounds of the series dict items and slice on them
@@ -602,9 +1001,19 @@ class FeatureCollection:
         # Note: this variable has a global scope so this is shared in multiprocessing
         # TODO: try to make this more efficient (but is not really the bottleneck)
         global get_stroll_func
+        # Features with equivalent functions (on the same series & window) share their
+        # computation when their windows are a subset of each other
+        shared_segmentation = not (
+            stride is None and segment_start_idxs is None and segment_end_idxs is None
+        )
+        tasks = self._get_feature_tasks(
+            calc_stride=stride,
+            shared_segmentation=shared_segmentation,
+            nested_strides=not include_final_window,
+        )
         get_stroll_func = self._stroll_feat_generator(
+            tasks,
             series_dict,
-            calc_stride=stride,
             segment_start_idxs=segment_start_idxs,
             segment_end_idxs=segment_end_idxs,
             start_idx=start,
@@ -612,8 +1021,12 @@ class FeatureCollection:
             window_idx=window_idx,
             include_final_window=include_final_window,
             approve_sparsity=approve_sparsity,
+            float_dtype=float_dtype,
         )
-        nb_stroll_funcs = self._get_stroll_feat_length()
+        nb_stroll_funcs = len(tasks)
+        # The tasks that share the intermediate of their segmented windows are
+        # executed as one batch, after which this intermediate is evicted
+        batches = self._get_task_batches(tasks)
 
         if (
             os.name == "nt"
@@ -621,49 +1034,102 @@ class FeatureCollection:
             n_jobs = 1
         elif n_jobs is None:
             n_jobs = os.cpu_count()
-        n_jobs = min(n_jobs, nb_stroll_funcs)
-
-        calculated_feature_list = None
-        if n_jobs in [0, 1]:
-            idxs = range(nb_stroll_funcs)
-            if show_progress:
-                idxs = tqdm(idxs)
-            try:
-                calculated_feature_list = [self._executor(idx) for idx in idxs]
-            except Exception:
-                traceback.print_exc()
-        else:
-            with Pool(processes=n_jobs) as pool:
-                results = pool.imap_unordered(self._executor, range(nb_stroll_funcs))
-                if show_progress:
-                    results = tqdm(results, total=nb_stroll_funcs)
+        n_jobs = min(n_jobs, len(batches))
+
+        executor = self._profiled_executor if profile else self._executor
+        if hooks is not None:
+            executor = partial(self._hooked_executor, executor=executor, hooks=hooks)
+        # Stop the memory tracing afterwards if it is started by the profiling
+        stop_tracing = profile and not tracemalloc.is_tracing()
+
+        batch_executor = partial(self._batch_executor, executor=executor)
+        progress = tqdm(total=nb_stroll_funcs) if show_progress else None
+
+        task_outputs = []
+
+        def collect_outputs(batch_outputs: List[tuple]):
+            # Collect the hook events of each task once it is completed (so that these
+            # are kept when a later task fails)
+            for task_output in batch_outputs:
+                if hooks is not None:
+                    task_output, task_events = task_output
+                    hooks.events.extend(task_events)
+                task_outputs.append(task_output)
+            if progress is not None:
+                progress.update(len(batch_outputs))
+
+        # The shared intermediates are cached during the feature calculation
+        with _intermediate_cache():
+            self._prepare_intermediates(get_stroll_func)
+            if n_jobs in [0, 1]:
                 try:
-                    calculated_feature_list = [f for f in results]
-                except Exception:
+                    for batch in batches:
+                        collect_outputs(batch_executor(batch))
+                except Exception as e:
                     traceback.print_exc()
-                    pool.terminate()
-                finally:
-                    # Close & join because: https://github.com/uqfoundation/pathos/issues/131
-                    pool.close()
-                    pool.join()
+                    if isinstance(e, _TaskError):
+                        hooks.events.extend(e.events)
+                    task_outputs = None
+            else:
+                # The workers route their log records to the file handler of this
+                # process (instead of all writing to the same file)
+                with queue_logging_handler(
+                    logger, f_handler if logging_file_path else None
+                ) as (initializer, initargs), Pool(
+                    processes=n_jobs, initializer=initializer, initargs=initargs
+                ) as pool:
+                    results = pool.imap_unordered(batch_executor, batches)
+                    try:
+                        for batch_outputs in results:
+                            collect_outputs(batch_outputs)
+                    except Exception as e:
+                        traceback.print_exc()
+                        if isinstance(e, _TaskError):
+                            hooks.events.extend(e.events)
+                        task_outputs = None
+                        pool.terminate()
+                    finally:
+                        # Close & join because: https://github.com/uqfoundation/pathos/issues/131
+                        pool.close()
+                        pool.join()
+        if progress is not None:
+            progress.close()
+
+        if stop_tracing:
+            tracemalloc.stop()
 
         # Close the file handler (this avoids PermissionError: [WinError 32])
         if logging_file_path:
             f_handler.close()
             logger.removeHandler(f_handler)
 
-        if calculated_feature_list is None:
+        if task_outputs is None:
             raise RuntimeError(
                 "Feature Extraction halted due to error while extracting one "
                 + "(or multiple) feature(s)! See stack trace above."
             )
 
+        # Unzip the outputs of the tasks into the dfs, records (& profiles)
+        task_dfs, records, *profiles = (
+            zip(*task_outputs) if task_outputs else [()] * (3 if profile else 2)
+        )
+        if metrics_collector is not None:
+            metrics_collector.add(records)
+        calculated_feature_list = list(flatten(task_dfs))
+
         if return_df:
             # concatenate & sort the columns
             df = pd.concat(calculated_feature_list, axis=1, join="outer", copy=False)
-            return df.reindex(sorted(df.columns), axis=1)
+            calculated_features = df.reindex(sorted(df.columns), axis=1)
         else:
-            return calculated_feature_list
+            calculated_features = calculated_feature_list
+
+        if profile:
+            profile_df = pd.DataFrame(
+                list(profiles[0]), columns=list(_PROFILE_COLUMNS)
+            ).sort_values("function_time", ascending=False, ignore_index=True)
+            return calculated_features, profile_df
+        return calculated_features
 
     def serialize(self, file_path: Union[str, Path]):
         """Serialize this FeatureCollection instance.
@@ -708,11 +1174,15 @@ class FeatureCollection:
         Hence, if you only want to retain _a subset_ of that FeatureDescriptor its
         feature outputs, you will still get **all features** as the new
         FeatureCollection is constructed by applying a filter on de FeatureDescriptor
-        list and we thus not alter these FeatureDescriptor objects themselves.
+        list and we thus not alter these FeatureDescriptor objects themselves.<br>
+        Unless the function of the FeatureDescriptor supports computing a subset of
+        its outputs (e.g., `catch22_wrapper`), then only the retained outputs are
+        computed.
 
         """
-        # dict in which we store all the { output_col_name : (UUID, FeatureDescriptor) }
-        # items of our current FeatureCollection object
+        # dict in which we store all the
+        # { output_col_name : (UUID, FeatureDescriptor, output_name) } items of our
+        # current FeatureCollection object
         manual_window = False
         if any(c.endswith("w=manual") for c in feat_cols_to_keep):
             assert all(c.endswith("w=manual") for c in feat_cols_to_keep)
@@ -720,8 +1190,8 @@ class FeatureCollection:
             # multiple windows for the same output name - input_series combination
             self._check_no_multiple_windows()
             manual_window = True
-        feat_col_fd_mapping: Dict[str, Tuple[str, FeatureDescriptor]] = {}
-        for (s_names, window), fd_list in self._feature_desc_dict.items():
+        feat_col_fd_mapping: Dict[str, Tuple[str, FeatureDescriptor, str]] = {}
+        for (_, window), fd_list in self._feature_desc_dict.items():
             window = "manual" if manual_window else self._ws_to_str(window)
             for fd in fd_list:
                 # As a single FeatureDescriptor can have multiple output col names, we
@@ -729,33 +1199,44 @@ class FeatureCollection:
                 # will apply set-like operations later on to only retain all the unique
                 # FeatureDescriptors)
                 uuid_str = str(uuid.uuid4())
-                for output_name in fd.function.output_names:
+                for output_name, (series_keys, feat_name) in zip(
+                    fd.function.output_names, fd._get_output_index_keys()
+                ):
                     # Reconstruct the feature column name
                     feat_col_name = StridedRolling.construct_output_index(
-                        series_keys=s_names, feat_name=output_name, win_str=window
+                        series_keys=series_keys, feat_name=feat_name, win_str=window
                     )
-                    feat_col_fd_mapping[feat_col_name] = (uuid_str, fd)
+                    feat_col_fd_mapping[feat_col_name] = (uuid_str, fd, output_name)
 
         assert all(fc in feat_col_fd_mapping for fc in feat_cols_to_keep)
 
-        # Collect (uuid, FeatureDescriptor) for the feat_cols_to_keep
-        fd_subset: List[Tuple[str, FeatureDescriptor]] = [
-            feat_col_fd_mapping[fc] for fc in feat_cols_to_keep
-        ]
-
-        # Reduce to unique feature descriptor objects (based on uuid) and create a new
-        # FeatureCollection for their deepcopy's.
-        seen_uuids = set()
-        return FeatureCollection(
-            feature_descriptors=[
-                deepcopy(unique_fd)
-                for unique_fd in {
-                    fd
-                    for (uuid_str, fd) in fd_subset
-                    if uuid_str not in seen_uuids and not seen_uuids.add(uuid_str)
-                }
-            ]
-        )
+        # Collect the (unique, based on uuid) FeatureDescriptors and their output names
+        # for the feat_cols_to_keep
+        fd_output_names: Dict[str, Tuple[FeatureDescriptor, List[str]]] = {}
+        for fc in feat_cols_to_keep:
+            uuid_str, fd, output_name = feat_col_fd_mapping[fc]
+            fd_output_names.setdefault(uuid_str, (fd, []))[1].append(output_name)
+
+        # Create a new FeatureCollection for their deepcopy's. When only a subset of the
+        # outputs of a FeatureDescriptor is kept, its function is reduced to only
+        # compute that subset (if the function supports this).
+        feature_descriptors = []
+        for fd, output_names in fd_output_names.values():
+            output_names = [o for o in fd.function.output_names if o in output_names]
+            reduced_function = None
+            if len(output_names) < len(fd.function.output_names) and (
+                type(fd) is FeatureDescriptor
+            ):
+                reduced_function = fd.function._reduce(output_names)
+            if reduced_function is None:
+                feature_descriptors.append(deepcopy(fd))
+            else:
+                feature_descriptors.append(
+                    FeatureDescriptor(
+                        reduced_function, fd.series_name, fd.window, fd.stride
+                    )
+                )
+        return FeatureCollection(feature_descriptors=feature_descriptors)
 
     @staticmethod
     def _ws_to_str(window_or_stride: Any) -> str:
@@ -785,3 +1266,30 @@ class FeatureCollection:
                 output_str += "\n\t]"
             output_str += "\n)\n"
         return output_str
+
+
+# The columns of the profiling DataFrame (see `FeatureCollection.calculate`)
+_PROFILE_COLUMNS = (
+    "function",
+    "series_names",
+    "window",
+    "strides",
+    "output_names",
+    "nb_windows",
+    "nb_func_calls",
+    "segmentation_time",
+    "function_time",
+    "assembly_time",
+    "mean_window_latency",
+    "p99_window_latency",
+    "peak_memory",
+)
+
+
+def _reset_traced_memory_peak() -> int:
+    """Reset the peak of the traced memory and return the current traced memory."""
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    else:  # `reset_peak` is only available as from Python 3.9
+        tracemalloc.clear_traces()
+    return tracemalloc.get_traced_memory()[0]
@@ -3,7 +3,8 @@
 __author__ = "Jonas Van Der Donckt, Jeroen Van Der Donckt, Emiel Deprost"
 
 import functools
-from typing import Any, Callable, List, Optional, Union
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -12,6 +13,9 @@ from .. import __pdoc__
 from ..utils.classes import FrozenClass
 from ..utils.data import SUPPORTED_STROLL_TYPES
 
+if TYPE_CHECKING:
+    from .intermediate import Intermediate
+
 __pdoc__["FuncWrapper.__call__"] = True
 
 
@@ -41,6 +45,18 @@ def _get_name(func: Callable) -> str:
         return type(func).__name__
 
 
+def _accepts_axis(func: Callable) -> bool:
+    """Check whether the function has an explicit ``axis`` argument.
+
+    Returns False when the signature of ``func`` can not be inspected (e.g., for some
+    builtin functions).
+    """
+    try:
+        return "axis" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 class FuncWrapper(FrozenClass):
     """Function wrapper.
 
@@ -62,9 +78,10 @@ class FuncWrapper(FrozenClass):
             a pd.Series, since pd.Series strided-rolling is significantly less efficient.
             For a np.array it is possible to create very efficient views, but there is no
             such thing as a pd.Series view. Thus, for each stroll, a new series is created.
-    vectorized: bool, optional
+    vectorized: Union[bool, str], optional
         Flag indicating whether `func` should be executed vectorized over all the
-        segmented windows, by default False.
+        segmented windows, by default False. If "auto", tsflex determines itself
+        whether `func` can be executed vectorized (see note below).
         .. Info::
             A vectorized function should take one or multiple series that each have the
             shape (nb. segmented windows, window size).
@@ -77,6 +94,49 @@ class FuncWrapper(FrozenClass):
             * The `input_type` should be `np.array` when `vectorized` is True. It does
               not make sense to use a `pd.Series`, as the index should be regularly
               sampled (see requirement above).
+            * When `vectorized` is "auto", `func` should have an `axis` argument
+              (e.g., numpy reductions such as `np.mean` or `np.std`). On its first
+              call, `func` is probed on the first few segmented windows to verify
+              that ``func(windows, axis=1)`` returns the same result as applying
+              `func` window per window. If so, `func` is executed vectorized (with
+              `axis=1`) whenever the segmentation is regular; otherwise `func` is
+              (silently) applied window per window.
+    output_dtype: Union[np.dtype, type, str], optional
+        The dtype of the function its output(s), by default None. If None, the dtype is
+        inferred from the function its output.
+        .. Note::
+            The collected outputs of the (non-vectorized) function are converted at
+            once to an array of the `output_dtype`.
+    stack_series: bool, optional
+        Flag indicating whether the (multiple) input series of `func` should be passed
+        as one stacked array instead of as separate arguments, by default False.
+        .. Info::
+            The stacked array has the input series as its last axis, i.e.; `func`
+            receives a single array with shape (window size, nb. series) or, when
+            `vectorized` is True, with shape
+            (nb. segmented windows, window size, nb. series).
+            For example the magnitude of an accelerometer (with series x, y & z) can
+            be computed vectorized with
+            ``FuncWrapper(lambda xyz: np.linalg.norm(xyz, axis=-1).mean(axis=-1), vectorized=True, stack_series=True)``.
+        .. Note::
+            * All the required series must **share the same index**.
+            * When the series are columns of the same DataFrame (and thus reside in
+              the same memory block), no copy is made to create the stacked array.
+            * The `input_type` should be `np.array` when `stack_series` is True.
+    intermediate: Intermediate, optional
+        The shared intermediate (e.g., the FFT of the window) on which `func` is
+        applied, by default None. If None, `func` is applied on the segmented windows.
+        .. Info::
+            The intermediate is computed once per (series, window, stride)
+            segmentation in a `FeatureCollection.calculate` call, and is shared by all
+            the functions that require the same intermediate. `func` receives the
+            intermediate of the window instead of the window itself (or, when
+            `vectorized` is True, the intermediate of all the segmented windows).
+            See the `tsflex.features.intermediate` module for the built-in
+            intermediates.
+        .. Note::
+            * The `input_type` should be `np.array` when `intermediate` is set.
+            * An `intermediate` can not be combined with `stack_series`.
     **kwargs: dict, optional
         Keyword arguments which will be also passed to the `function`
 
@@ -92,7 +152,10 @@ class FuncWrapper(FrozenClass):
         func: Callable,
         output_names: Optional[Union[List[str], str]] = None,
         input_type: Optional[Union[np.array, pd.Series]] = np.array,
-        vectorized: bool = False,
+        vectorized: Union[bool, str] = False,
+        output_dtype: Optional[Union[np.dtype, type, str]] = None,
+        stack_series: bool = False,
+        intermediate: Optional["Intermediate"] = None,
         **kwargs,
     ):
         """Create FuncWrapper instance."""
@@ -109,11 +172,40 @@ class FuncWrapper(FrozenClass):
             raise TypeError(f"`output_names` is unexpected type {type(output_names)}")
 
         assert input_type in SUPPORTED_STROLL_TYPES, "Invalid input_type!"
+        assert vectorized in [True, False, "auto"], "Invalid vectorized value!"
         assert not (
-            vectorized & (input_type is not np.array)
+            (vectorized is True) & (input_type is not np.array)
         ), "The input_type must be np.array if vectorized is True!"
+        assert not (
+            stack_series & (input_type is not np.array)
+        ), "The input_type must be np.array if stack_series is True!"
+        if intermediate is not None:
+            from .intermediate import Intermediate  # avoid circular import
+
+            assert isinstance(
+                intermediate, Intermediate
+            ), "The intermediate must be an Intermediate instance!"
+            assert (
+                input_type is np.array
+            ), "The input_type must be np.array if an intermediate is set!"
+            assert (
+                not stack_series
+            ), "An intermediate can not be used with stack_series!"
         self.input_type = input_type
         self.vectorized = vectorized
+        self.output_dtype = None if output_dtype is None else np.dtype(output_dtype)
+        self.stack_series = stack_series
+        self.intermediate = intermediate
+        # Whether `func` can be executed vectorized when `vectorized` is "auto"; None
+        # if this is not yet known (i.e., `func` is probed on its first call)
+        self._vectorizable: Optional[bool] = None
+        if vectorized == "auto" and (
+            input_type is not np.array
+            or intermediate is not None
+            or "axis" in kwargs
+            or not _accepts_axis(func)
+        ):
+            self._vectorizable = False
 
         self._freeze()
 
@@ -139,3 +231,68 @@ class FuncWrapper(FrozenClass):
 
         """
         return self.func(*series, **self.kwargs)
+
+    def _bind_sampling_rates(
+        self, sampling_rates: List[Optional[float]]
+    ) -> "FuncWrapper":
+        """Return the FuncWrapper that is applied on series with these sampling rates.
+
+        This is used by the `StridedRolling` to pass the sampling rates (in Hz for a
+        time-index) of the input series, which are derived once from their index. By
+        default, the function does not depend on the sampling rate (and self is
+        returned).
+
+        Parameters
+        ----------
+        sampling_rates : List[Optional[float]]
+            The sampling rate of each input series (None if it can not be derived).
+
+        Returns
+        -------
+        FuncWrapper
+            The FuncWrapper that is applied on the series.
+
+        """
+        return self
+
+    def _convert_outputs(self, outputs: List[Any]) -> np.ndarray:
+        """Convert the collected outputs of the (sequentially applied) function.
+
+        This is used by the `StridedRolling` to convert the outputs of all segmented
+        windows at once. By default, these are converted to an array with the
+        `output_dtype` (if set). A structured array (with a field per output name) can
+        be returned to keep the dtype of each output.
+
+        Parameters
+        ----------
+        outputs : List[Any]
+            The output of the function for each segmented window.
+
+        Returns
+        -------
+        np.ndarray
+            The outputs, with the segmented windows as first axis.
+
+        """
+        return np.asarray(outputs, dtype=self.output_dtype)
+
+    def _reduce(self, output_names: List[str]) -> Optional["FuncWrapper"]:
+        """Return a FuncWrapper that only computes the given output names.
+
+        This is used by `FeatureCollection.reduce` to avoid computing the discarded
+        outputs of a function. By default, None is returned; i.e., the function can
+        not compute a subset of its outputs (and all outputs are computed).
+
+        Parameters
+        ----------
+        output_names : List[str]
+            A (strict) subset of the `output_names` of this FuncWrapper.
+
+        Returns
+        -------
+        Optional[FuncWrapper]
+            The FuncWrapper that only computes the `output_names`, or None if this is
+            not supported.
+
+        """
+        return None
@@ -3,7 +3,8 @@
 __author__ = "Jeroen Van Der Donckt, Jonas Van Der Donckt"
 
 import importlib
-from typing import Callable, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -12,13 +13,19 @@ from .function_wrapper import FuncWrapper, _get_name
 
 
 # ------------------------------------- SEGLEARN -------------------------------------
-def seglearn_wrapper(func: Callable, func_name: Optional[str] = None) -> FuncWrapper:
+def seglearn_wrapper(
+    func: Callable,
+    func_name: Optional[str] = None,
+    vectorized: Union[bool, str] = True,
+) -> FuncWrapper:
     """Wrapper enabling compatibility with seglearn functions.
 
     As [seglearn feature-functions](https://github.com/dmbee/seglearn/blob/master/seglearn/feature_functions.py)
-    are vectorized along the first axis (axis=0), we need to expand our window-data.
-    This wrapper converts `1D np.array` to a `2D np.array` with all the window-data in
-    `axis=1`.
+    are vectorized along the first axis (axis=0), the whole block of segmented windows
+    (i.e., the strided view with shape (nb. segmented windows, window size)) is passed
+    at once to the seglearn function. When the function is applied window per window,
+    this wrapper converts each `1D np.array` window to a `2D np.array` with all the
+    window-data in `axis=1`.
 
     Parameters
     ----------
@@ -27,6 +34,18 @@ def seglearn_wrapper(func: Callable, func_name: Optional[str] = None) -> FuncWra
     func_name: str, optional
         The name for the passed function. This will be used when constructing the output
         names.
+    vectorized: Union[bool, str], optional
+        Whether the seglearn function should be applied on the whole block of segmented
+        windows, by default True. If False, the function is called once per segmented
+        window. If "auto", the function is applied on the whole block of segmented
+        windows when the segmentation is regular, and otherwise window per window (see
+        the `vectorized` argument of `FuncWrapper`; note that this probes the function
+        on its first call).
+
+        .. Note::
+            As the `vectorized` argument of `FuncWrapper`, True forces the vectorized
+            execution; which requires REGULARLY sampled data. Hence, use "auto" for
+            (possibly) irregularly sampled data.
 
     Returns
     -------
@@ -35,16 +54,24 @@ def seglearn_wrapper(func: Callable, func_name: Optional[str] = None) -> FuncWra
 
     """
 
-    def wrap_func(x: np.ndarray):
-        out = func(x.reshape(1, len(x)))
-        return out.flatten()
+    def wrap_func(x: np.ndarray, axis: Optional[int] = None):
+        if axis is None:  # a single window
+            return func(x.reshape(1, len(x)))[0]
+        # The segmented windows, with shape (nb. segmented windows, window size)
+        assert axis == 1
+        return func(x)
 
     wrap_func.__name__ = "[seglearn_wrapped]__" + _get_name(func)
     output_names = _get_name(func) if func_name is None else func_name
     # A bit hacky (hard coded), bc hist is only func that returns multiple values
     if hasattr(func, "bins"):
         output_names = [output_names + f"_bin{idx}" for idx in range(1, func.bins + 1)]
-    return FuncWrapper(wrap_func, output_names=output_names)
+    if vectorized is True:
+        # The wrapped function is applied with axis=1 on the segmented windows
+        return FuncWrapper(
+            wrap_func, output_names=output_names, vectorized=True, axis=1
+        )
+    return FuncWrapper(wrap_func, output_names=output_names, vectorized=vectorized)
 
 
 def seglearn_feature_dict_wrapper(features_dict: Dict) -> List[FuncWrapper]:
@@ -98,6 +125,27 @@ def seglearn_feature_dict_wrapper(features_dict: Dict) -> List[FuncWrapper]:
 
 
 # -------------------------------------- TSFEL --------------------------------------
+def _get_tsfel_output_names(config: dict) -> Union[str, List[str]]:
+    """Create the output_names based on the configuration."""
+    nb_outputs = config["n_features"]
+    func_name = config["function"].split(".")[-1]
+    if isinstance(nb_outputs, str) and isinstance(
+        config["parameters"][nb_outputs], int
+    ):
+        nb_outputs = config["parameters"][nb_outputs]
+    if (
+        func_name == "lpcc"
+    ):  # Because https://github.com/fraunhoferportugal/tsfel/issues/103
+        nb_outputs += 1
+    if isinstance(nb_outputs, int):
+        if nb_outputs == 1:
+            return func_name
+        else:
+            return [func_name + f"_{idx}" for idx in range(1, nb_outputs + 1)]
+    output_param = eval(config["parameters"][nb_outputs])
+    return [func_name + f"_{nb_outputs}={v}" for v in output_param]
+
+
 def tsfel_feature_dict_wrapper(features_dict: Dict) -> List[Callable]:
     """Wrapper enabling compatibility with tsfel feature extraction configurations.
 
@@ -143,37 +191,184 @@ def tsfel_feature_dict_wrapper(features_dict: Dict) -> List[Callable]:
 
     """
 
-    def get_output_names(config: dict):
-        """Create the output_names based on the configuration."""
-        nb_outputs = config["n_features"]
-        func_name = config["function"].split(".")[-1]
-        if isinstance(nb_outputs, str) and isinstance(
-            config["parameters"][nb_outputs], int
-        ):
-            nb_outputs = config["parameters"][nb_outputs]
-        if (
-            func_name == "lpcc"
-        ):  # Because https://github.com/fraunhoferportugal/tsfel/issues/103
-            nb_outputs += 1
-        if isinstance(nb_outputs, int):
-            if nb_outputs == 1:
-                return func_name
-            else:
-                return [func_name + f"_{idx}" for idx in range(1, nb_outputs + 1)]
-        output_param = eval(config["parameters"][nb_outputs])
-        return [func_name + f"_{nb_outputs}={v}" for v in output_param]
-
     functions = []
     tsfel_mod = importlib.import_module("tsfel.feature_extraction")
     for domain_feats in features_dict.values():  # Iterate over feature domains
         for config in domain_feats.values():  # Iterate over function configs
             func = getattr(tsfel_mod, config["function"].split(".")[-1])
             params = config["parameters"] if config["parameters"] else {}
-            output_names = get_output_names(config)
+            output_names = _get_tsfel_output_names(config)
             functions.append(FuncWrapper(func, output_names, **params))
     return functions
 
 
+class _SharedFFT:
+    """The (tsfel) `calc_fft` function, which is only computed once per signal.
+
+    Within this context, the `calc_fft` of the tsfel features module (which is called
+    by its spectral features) is replaced by this shared `calc_fft`. Its results are
+    cached for the signals of the current window (i.e., the cache is reset when
+    entering the context).
+    """
+
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+        self.calc_fft = importlib.import_module(module_name).calc_fft
+        self.reset()
+
+    def reset(self):
+        self._cache: Dict[Tuple[int, float], Tuple[np.ndarray, Any]] = {}
+
+    def __enter__(self) -> "_SharedFFT":
+        self.reset()
+        module = importlib.import_module(self.module_name)
+        self._module_calc_fft = module.calc_fft
+        module.calc_fft = self
+        return self
+
+    def __exit__(self, *exc_info):
+        importlib.import_module(self.module_name).calc_fft = self._module_calc_fft
+        self.reset()
+
+    def __call__(self, signal: np.ndarray, fs: float) -> Tuple[np.ndarray, np.ndarray]:
+        # Note: the cached signals are referenced, so their id can not be reused
+        key = (id(signal), fs)
+        if key not in self._cache:
+            self._cache[key] = (signal, self.calc_fft(signal, fs))
+        f, fmag = self._cache[key][1]
+        return f.copy(), fmag.copy()
+
+
+def _evaluate_tsfel_features(
+    x: np.ndarray,
+    features: List[Tuple[Callable, Dict]],
+    shared_fft: _SharedFFT,
+) -> List[Any]:
+    """Evaluate all the (func, params) tsfel features on the window."""
+    out = []
+    with shared_fft:
+        for func, params in features:
+            res = func(x, **params)
+            if isinstance(res, dict):  # multiple (named) outputs
+                res = res["values"]
+            out.extend(np.atleast_1d(res))
+    return out
+
+
+class _TsfelDomainFuncWrapper(FuncWrapper):
+    """FuncWrapper that evaluates (a configuration of) tsfel features at once.
+
+    When no `fs` is passed, the `fs` parameters of the features are set to the
+    sampling rate of the series (which is derived once from its index).
+    """
+
+    def __init__(
+        self,
+        features: List[Tuple[Callable, Dict]],
+        output_names: List[str],
+        fs: Optional[float],
+    ):
+        self.fs = fs
+        if fs is not None:
+            features = _set_tsfel_fs(features, fs)
+        super().__init__(
+            _evaluate_tsfel_features,
+            output_names=output_names,
+            output_dtype=np.float64,
+            features=features,
+            shared_fft=_SharedFFT("tsfel.feature_extraction.features"),
+        )
+
+    def _bind_sampling_rates(
+        self, sampling_rates: List[Optional[float]]
+    ) -> FuncWrapper:
+        if self.fs is not None or not any(
+            "fs" in p for _, p in self.kwargs["features"]
+        ):
+            return self
+        assert sampling_rates[0] is not None, (
+            "The sampling rate can not be derived from the series index; "
+            + "pass the `fs` to tsfel_domain_wrapper!"
+        )
+        return _TsfelDomainFuncWrapper(
+            self.kwargs["features"], self.output_names, fs=sampling_rates[0]
+        )
+
+
+def _set_tsfel_fs(
+    features: List[Tuple[Callable, Dict]], fs: float
+) -> List[Tuple[Callable, Dict]]:
+    """Set the `fs` parameter of the (func, params) tsfel features."""
+    return [
+        (func, {**params, "fs": fs} if "fs" in params else params)
+        for func, params in features
+    ]
+
+
+def tsfel_domain_wrapper(
+    features_dict: Dict, fs: Optional[float] = None
+) -> FuncWrapper:
+    """Wrapper that evaluates a tsfel feature extraction configuration at once.
+
+    Whereas `tsfel_feature_dict_wrapper` creates a (wrapped) function for each tsfel
+    feature, this wrapper creates a single `FuncWrapper` that evaluates all the
+    features (e.g., a whole domain) of the configuration on each window. Hence, all
+    the features of a series - window - stride combination are computed in a single
+    task, which writes all outputs in one (float64) output array. Furthermore;
+
+    * the FFT of the window is computed once and shared by all the spectral features.
+    * the sampling frequency (the `fs` parameter of the tsfel features) is derived
+      once from the index of the series (when `fs` is None).
+
+    The output names are exactly the same as those of `tsfel_feature_dict_wrapper`.
+
+    Example
+    -------
+    ```python
+    from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+    from tsflex.features.integrations import tsfel_domain_wrapper
+    from tsfel.feature_extraction import get_features_by_domain
+
+    spectral_tsfel_feats = MultipleFeatureDescriptors(
+        functions=tsfel_domain_wrapper(get_features_by_domain("spectral")),
+        series_names=["sig_0", "sig_1"],  # list of signal names
+        windows="15min", strides="2min",
+    )
+
+    fc = FeatureCollection(spectral_tsfel_feats)
+    fc.calculate(data)  # calculate the features on your data
+    ```
+
+    Parameters
+    ----------
+    features_dict: Dictionary
+        The tsfel collection of features (which is a dict).
+    fs: float, optional
+        The sampling frequency of the data, by default None. If None, the sampling
+        frequency is derived once from the index of each series (in Hz for a
+        time-index; i.e., the inverse of its sampling period, or its average sampling
+        rate when the series is irregularly sampled). If passed, it overrides the `fs`
+        parameters of the configuration.
+
+    Returns
+    -------
+    FuncWrapper
+        The wrapped tsfel features that are compatible with tsflex.
+
+    """
+    tsfel_mod = importlib.import_module("tsfel.feature_extraction.features")
+
+    features, output_names = [], []
+    for domain_feats in features_dict.values():  # Iterate over feature domains
+        for config in domain_feats.values():  # Iterate over function configs
+            func = getattr(tsfel_mod, config["function"].split(".")[-1])
+            params = config["parameters"] if config["parameters"] else {}
+            features.append((func, params))
+            output_names.extend(np.atleast_1d(_get_tsfel_output_names(config)))
+
+    return _TsfelDomainFuncWrapper(features, list(map(str, output_names)), fs)
+
+
 # ------------------------------------- TSFRESH -------------------------------------
 def tsfresh_combiner_wrapper(func: Callable, param: List[Dict]) -> FuncWrapper:
     """Wrapper enabling compatibility with tsfresh combiner functions.
@@ -232,6 +427,10 @@ def tsfresh_settings_wrapper(settings: Dict) -> List[Union[Callable, FuncWrapper
         `TimeBasedFCParameters()`, or `ComprehensiveFCParameters()`. <br>
         See more [here](https://github.com/blue-yonder/tsfresh/blob/main/tsfresh/feature_extraction/settings.py).
 
+    .. Tip::
+        Use `tsfresh_settings_batch_wrapper` to evaluate all the settings in a single
+        task (per series - window - stride), which is faster for large settings.
+
     Example
     -------
     ```python
@@ -281,8 +480,337 @@ def tsfresh_settings_wrapper(settings: Dict) -> List[Union[Callable, FuncWrapper
     return functions
 
 
+# The intermediates that are shared by the tsfresh calculators of a window (see the
+# `_TSFRESH_SHARED_CALCULATORS`)
+_TSFRESH_INTERMEDIATES = ["sorted", "rfft", "psd"]
+
+
+def _tsfresh_intermediates(x: np.ndarray, fields: Tuple[str, ...]) -> np.ndarray:
+    """Compute the window(s) and their shared intermediates along the last axis.
+
+    The result is a structured array (with the windows as first axis) with as fields
+    the window itself (`x`) and the required intermediates (`fields`); the sorted
+    values, the real FFT and the Welch power spectrum (as used by tsfresh).
+    """
+    from scipy.signal import welch
+
+    x = np.asarray(x)
+    size = x.shape[-1]
+    values = {"x": x}
+    if "sorted" in fields:
+        values["sorted"] = np.sort(x, axis=-1)
+    if "rfft" in fields:
+        values["rfft"] = (
+            np.fft.rfft(x, axis=-1) if size else np.empty(x.shape, dtype=complex)
+        )
+    if "psd" in fields:
+        values["psd"] = (
+            welch(x, nperseg=min(size, 256), axis=-1)[1] if size else np.empty(x.shape)
+        )
+    out = np.empty(
+        x.shape[:-1], dtype=[(k, v.dtype, v.shape[-1:]) for k, v in values.items()]
+    )
+    for k, v in values.items():
+        out[k] = v
+    return out
+
+
+# The tsfresh calculators that are typically evaluated for many parameters are
+# computed at once for all their parameters, sharing their intermediates (e.g., the
+# deviations & the quantile corridors). The sorted values and the spectra are shared
+# over all these calculators (see `_tsfresh_intermediates`). These use exactly the
+# same arithmetic as the tsfresh calculators.
+def _tsfresh_quantiles(window: np.ndarray, param: List[Dict]) -> List[float]:
+    if len(window["x"]) == 0:
+        return [np.nan] * len(param)
+    # Note: the quantiles of the sorted values equal those of the values
+    return list(np.quantile(window["sorted"], [p["q"] for p in param]))
+
+
+def _tsfresh_median(window: np.ndarray, param: None) -> List[float]:
+    return [np.median(window["sorted"])]
+
+
+def _tsfresh_autocorrelations(window: np.ndarray, param: List[Dict]) -> List[float]:
+    x = window["x"]
+    deviations = x - np.mean(x)
+    var = np.var(x)
+    out = []
+    for p in param:
+        lag = p["lag"]
+        if len(x) < lag or np.isclose(var, 0):
+            out.append(np.nan)
+        else:
+            sum_product = np.sum(deviations[: len(x) - lag] * deviations[lag:])
+            out.append(sum_product / ((len(x) - lag) * var))
+    return out
+
+
+def _tsfresh_large_standard_deviations(
+    window: np.ndarray, param: List[Dict]
+) -> List[bool]:
+    x = window["x"]
+    std, value_range = np.std(x), np.max(x) - np.min(x)
+    return [std > (p["r"] * value_range) for p in param]
+
+
+def _tsfresh_ratios_beyond_r_sigma(
+    window: np.ndarray, param: List[Dict]
+) -> List[float]:
+    x = window["x"]
+    abs_deviations, std = np.abs(x - np.mean(x)), np.std(x)
+    return [np.sum(abs_deviations > p["r"] * std) / x.size for p in param]
+
+
+def _tsfresh_change_quantiles(window: np.ndarray, param: List[Dict]) -> List[float]:
+    x, sorted_x = window["x"], window["sorted"]
+    sorted_x = sorted_x[~np.isnan(sorted_x)]  # the NaNs are sorted last
+    changes = {False: np.diff(x)}
+    changes[True] = np.abs(changes[False])
+    corridors = {}  # the changes inside the corridor of each (ql, qh)
+    out = []
+    for p in param:
+        ql, qh = p["ql"], p["qh"]
+        if ql >= qh or not len(sorted_x):
+            out.append(0.0)
+            continue
+        if (ql, qh) not in corridors:
+            # The values in the (closed) corridor between the quantiles (as `pd.qcut`)
+            low, high = np.quantile(sorted_x, [ql, qh])
+            bin_cat_0 = (x >= low) & (x <= high)
+            ind = (bin_cat_0 & np.roll(bin_cat_0, 1))[1:]
+            corridors[(ql, qh)] = np.where(ind == 1) if np.sum(ind) else None
+        inside_corridor = corridors[(ql, qh)]
+        if inside_corridor is None:
+            out.append(0.0)
+        else:
+            aggregator = getattr(np, p["f_agg"])
+            out.append(aggregator(changes[p["isabs"]][inside_corridor]))
+    return out
+
+
+def _tsfresh_fourier_entropies(window: np.ndarray, param: List[Dict]) -> List[float]:
+    from tsfresh.feature_extraction.feature_calculators import binned_entropy
+
+    pxx = window["psd"]
+    return [binned_entropy(pxx / np.max(pxx), p["bins"]) for p in param]
+
+
+def _tsfresh_spkt_welch_densities(window: np.ndarray, param: List[Dict]) -> List[float]:
+    pxx = window["psd"]
+    coeff = [p["coeff"] for p in param]
+    # The coefficients that are not contained in the spectrum are filled up with NaNs
+    # (and placed last, as tsfresh does)
+    reduced_coeff = [c for c in coeff if c < len(pxx)]
+    return list(pxx[reduced_coeff]) + [np.nan] * (len(coeff) - len(reduced_coeff))
+
+
+def _tsfresh_fft_coefficients(window: np.ndarray, param: List[Dict]) -> List[float]:
+    fft = window["rfft"]
+    aggregators = {
+        "real": np.real,
+        "imag": np.imag,
+        "abs": np.abs,
+        "angle": partial(np.angle, deg=True),
+    }
+    return [
+        aggregators[p["attr"]](fft[p["coeff"]]) if p["coeff"] < len(fft) else np.nan
+        for p in param
+    ]
+
+
+# The shared tsfresh calculators and the intermediates that they use
+_TSFRESH_SHARED_CALCULATORS = {
+    "quantile": (_tsfresh_quantiles, ["sorted"]),
+    "median": (_tsfresh_median, ["sorted"]),
+    "autocorrelation": (_tsfresh_autocorrelations, []),
+    "large_standard_deviation": (_tsfresh_large_standard_deviations, []),
+    "ratio_beyond_r_sigma": (_tsfresh_ratios_beyond_r_sigma, []),
+    "change_quantiles": (_tsfresh_change_quantiles, ["sorted"]),
+    "fourier_entropy": (_tsfresh_fourier_entropies, ["psd"]),
+    "spkt_welch_density": (_tsfresh_spkt_welch_densities, ["psd"]),
+    "fft_coefficient": (_tsfresh_fft_coefficients, ["rfft"]),
+}
+
+
+def _evaluate_tsfresh_calculators(
+    x: Union[np.ndarray, pd.Series],
+    calculators: List[Tuple[Callable, Any, str]],
+    fields: Tuple[str, ...],
+) -> Tuple[Any, ...]:
+    """Evaluate all the (func, param, fctype) tsfresh calculators on the window.
+
+    The window is either the record of the window and its (shared) intermediates, or
+    the raw window (of which the intermediates are then computed).
+    """
+    window = x
+    if isinstance(x, pd.Series) or x.dtype.names is None:
+        window = _tsfresh_intermediates(np.asarray(x), fields)
+    values = window["x"]
+    out = []
+    for func, param, fctype in calculators:
+        if fctype == "shared":
+            out.extend(func(window, param))
+            continue
+        x_ = x if hasattr(func, "index_type") else values
+        if param is None:
+            out.append(func(x_))
+        elif fctype == "combiner":
+            out.extend(t[1] for t in func(x_, param))
+        else:
+            out.extend(func(x_, **kwargs) for kwargs in param)
+    return tuple(out)
+
+
+class _TsfreshBatchFuncWrapper(FuncWrapper):
+    """FuncWrapper that evaluates a batch of tsfresh calculators on each window.
+
+    The outputs of each calculator keep their dtype (e.g., boolean outputs remain
+    boolean), as the outputs are converted per calculator; i.e., per output, or at
+    once for all the outputs of a combiner calculator (as `tsfresh_settings_wrapper`).
+    """
+
+    def __init__(self, *args, output_groups: List[int], **kwargs):
+        self.output_groups = output_groups
+        super().__init__(*args, **kwargs)
+
+    def _convert_outputs(self, outputs: List[Any]) -> np.ndarray:
+        if not outputs:
+            return np.asarray(outputs)
+        columns, start = [], 0
+        window_outputs = list(zip(*outputs))
+        for nb_outputs in self.output_groups:
+            columns.extend(np.asarray(window_outputs[start : start + nb_outputs]))
+            start += nb_outputs
+        out = np.empty(
+            len(outputs), dtype=[(f"f{i}", c.dtype) for i, c in enumerate(columns)]
+        )
+        for i, column in enumerate(columns):
+            out[f"f{i}"] = column
+        return out
+
+
+def tsfresh_settings_batch_wrapper(settings: Dict) -> FuncWrapper:
+    """Wrapper that evaluates all the tsfresh feature extraction settings at once.
+
+    Whereas `tsfresh_settings_wrapper` creates a (wrapped) function for each tsfresh
+    calculator (setting), this wrapper creates a single `FuncWrapper` that evaluates
+    all the calculators of the settings on each window. Hence, all the features of a
+    series - window - stride combination are computed in a single task (and each
+    output keeps the dtype of its calculator). Furthermore, the calculators that are
+    evaluated for multiple parameters (e.g., `quantile` and `autocorrelation`) share
+    their intermediates over these parameters, and the sorted values and the spectra
+    (i.e., the real FFT and the Welch power spectrum) of the windows are shared over
+    the calculators. The latter are computed as `Intermediate` (i.e., at once on all
+    the segmented windows when the segmentation is regular), unless a calculator
+    requires the index of the window (in which case these are computed per window).
+
+    The output names are exactly the same as those of `tsfresh_settings_wrapper`.
+
+    Example
+    -------
+    ```python
+    from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+    from tsflex.features.integrations import tsfresh_settings_batch_wrapper
+    from tsfresh.feature_extraction import EfficientFCParameters
+
+    efficient_tsfresh_feats = MultipleFeatureDescriptors(
+        functions=tsfresh_settings_batch_wrapper(EfficientFCParameters()),
+        series_names=["sig_0", "sig_1"],  # list of signal names
+        windows="15min", strides="2min",
+    )
+
+    fc = FeatureCollection(efficient_tsfresh_feats)
+    fc.calculate(data)  # calculate the features on your data
+    ```
+
+    Parameters
+    ----------
+    settings: PicklableSettings
+        The tsfresh base object for feature settings (which is a dict).
+
+    Returns
+    -------
+    FuncWrapper
+        The wrapped tsfresh calculators that are compatible with tsflex.
+
+    """
+    from .intermediate import Intermediate  # avoid circular import
+
+    calculators, output_names, output_groups, fields = [], [], [], set()
+    tsfresh_mod = importlib.import_module(
+        "tsfresh.feature_extraction.feature_calculators"
+    )
+    for func_name, param in settings.items():
+        func = getattr(tsfresh_mod, func_name)
+        fctype = getattr(func, "fctype")
+        if param is None:
+            output_names.append(func.__name__)
+            output_groups.append(1)
+        elif fctype == "combiner":
+            output_names.extend(func.__name__ + "_" + str(p) for p in param)
+            output_groups.append(len(param))
+        else:
+            output_names.extend(f"{func.__name__}_{str(kwargs)}" for kwargs in param)
+            output_groups.extend([1] * len(param))
+        if func_name in _TSFRESH_SHARED_CALCULATORS:
+            func, func_fields = _TSFRESH_SHARED_CALCULATORS[func_name]
+            fctype = "shared"
+            fields.update(func_fields)
+        calculators.append((func, param, fctype))
+
+    fields = tuple(f for f in _TSFRESH_INTERMEDIATES if f in fields)
+    input_type, intermediate = np.array, None
+    if any(hasattr(c[0], "index_type") for c in calculators):
+        input_type = pd.Series
+    elif fields:
+        intermediate = Intermediate(
+            _tsfresh_intermediates, name="tsfresh_intermediates", fields=fields
+        )
+    return _TsfreshBatchFuncWrapper(
+        _evaluate_tsfresh_calculators,
+        output_names=output_names,
+        input_type=input_type,
+        intermediate=intermediate,
+        output_groups=output_groups,
+        calculators=calculators,
+        fields=fields,
+    )
+
+
 # ----------------------------------- --CATCH22 -------------------------------------
-def catch22_wrapper(catch22_all: Callable) -> FuncWrapper:
+class _Catch22FuncWrapper(FuncWrapper):
+    """FuncWrapper for (a subset of) the catch22 features.
+
+    When all the catch22 features are required, `catch22_all` is called; otherwise
+    only the individual `pycatch22` functions of the required features are called.
+    """
+
+    def __init__(self, catch22_all: Callable, catch22_names: List[str]):
+        self.catch22_all = catch22_all
+        if catch22_names == catch22_all([0])["names"]:
+
+            def wrap_catch22(x):
+                return catch22_all(x)["values"]
+
+        else:
+            pycatch22 = importlib.import_module(catch22_all.__module__.split(".")[0])
+            catch22_funcs = [getattr(pycatch22, name) for name in catch22_names]
+
+            def wrap_catch22(x):
+                x = x.tolist()  # the individual catch22 functions require a list
+                return [f(x) for f in catch22_funcs]
+
+        wrap_catch22.__name__ = "[wrapped]__" + _get_name(catch22_all)
+        super().__init__(wrap_catch22, output_names=catch22_names)
+
+    def _reduce(self, output_names: List[str]) -> FuncWrapper:
+        return _Catch22FuncWrapper(self.catch22_all, output_names)
+
+
+def catch22_wrapper(
+    catch22_all: Callable, catch22_names: Optional[List[str]] = None
+) -> FuncWrapper:
     """Wrapper enabling compatibility with catch22.
 
     [catch22](https://github.com/chlubba/catch22) is a collection of 22 time series
@@ -298,6 +826,12 @@ def catch22_wrapper(catch22_all: Callable) -> FuncWrapper:
         This wrapper wraps the `catch22_all` function from `pycatch22`.
         See more [here](https://github.com/chlubba/catch22/blob/master/wrap_Python/catch22/catch22.py).
 
+    .. Tip::
+        When only a subset of the catch22 features is required, only the individual
+        `pycatch22` functions of these features are called. This is also the case for
+        a `FeatureCollection` that is reduced (see `FeatureCollection.reduce`) to a
+        subset of the catch22 features.
+
     Example
     -------
     ```python
@@ -319,18 +853,21 @@ def catch22_wrapper(catch22_all: Callable) -> FuncWrapper:
     ----------
     catch22_all: Callable
         The `catch22_all` function from the `pycatch22` package.
+    catch22_names: List[str], optional
+        The names of the catch22 features that should be computed, by default None.
+        If None, all the 22 catch22 features are computed.
 
     Returns
     -------
     FuncWrapper
         The wrapped `catch22_all` function that is compatible with tsflex.
-        This FuncWrapper will output the 22 catch22 features.
+        This FuncWrapper will output the (selected) catch22 features.
 
     """
-    catch22_names = catch22_all([0])["names"]
-
-    def wrap_catch22_all(x):
-        return catch22_all(x)["values"]
-
-    wrap_catch22_all.__name__ = "[wrapped]__" + _get_name(catch22_all)
-    return FuncWrapper(wrap_catch22_all, output_names=catch22_names)
+    all_catch22_names = catch22_all([0])["names"]
+    if catch22_names is None:
+        catch22_names = all_catch22_names
+    assert all(
+        name in all_catch22_names for name in catch22_names
+    ), f"The catch22_names must be a subset of {all_catch22_names}!"
+    return _Catch22FuncWrapper(catch22_all, list(catch22_names))
@@ -0,0 +1,491 @@
+"""Shared intermediate computations on the segmented windows.
+
+An `Intermediate` is computed once per (series, window, stride) segmentation during
+a `FeatureCollection.calculate` call, and is passed (instead of the raw windows) to
+all the `FuncWrapper`s that declare it as their `intermediate`. These functions are
+computed consecutively (in the same process), after which the intermediate is evicted.
+
+For example, spectral features that all require the FFT of the same window:
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors, FuncWrapper
+from tsflex.features.intermediate import rfft
+
+def max_magnitude(x_fft):
+    return np.max(np.abs(x_fft))
+
+def dominant_bin(x_fft):
+    return np.argmax(np.abs(x_fft))
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=[
+            FuncWrapper(max_magnitude, intermediate=rfft()),
+            FuncWrapper(dominant_bin, intermediate=rfft()),
+        ],
+        series_names="TMP", windows="5min", strides="2.5min",
+    )
+)
+```
+
+A `SeriesIntermediate` is derived from a precomputation on the whole series (e.g.,
+prefix sums), which is computed once per series and shared by all its segmentations.
+For example, the `prefix_statistics` intermediate answers the mean, energy or number
+of zero-crossings of each window in O(1):
+
+```python
+from tsflex.features.intermediate import prefix_statistics
+
+def nanmean(stats):
+    return stats["sum"] / stats["count"]
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=FuncWrapper(
+            nanmean, vectorized=True, intermediate=prefix_statistics()
+        ),
+        series_names="TMP", windows=["1min", "5min"], strides="30s",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import hashlib
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..utils.classes import FrozenClass
+from .function_wrapper import _get_name
+
+# The cache of the intermediate results; only active (i.e., not None) within the
+# `_intermediate_cache` context
+_INTERMEDIATE_CACHE: Optional[Dict[Any, Any]] = None
+# The keys of the intermediates that are cached within the active (i.e., not None)
+# `_intermediate_scope` context
+_SCOPED_KEYS: Optional[List[Any]] = None
+
+
+class Intermediate(FrozenClass):
+    """Intermediate computation which is shared between feature functions.
+
+    Parameters
+    ----------
+    func : Callable
+        The function that computes the intermediate. This function should operate
+        along the **last axis** of its input, i.e., it is called with either a single
+        window (1D array) or with a stack of (equally sized) windows of shape
+        (nb. segmented windows, window size).
+    name : str, optional
+        The name of the intermediate, by default None. If None, the name of `func` is
+        used.
+    **kwargs: dict, optional
+        Keyword arguments which will be also passed to `func`.
+
+    Notes
+    -----
+    Intermediates are identified by their name and keyword arguments (array keyword
+    arguments are identified by their content). Hence, when multiple intermediates
+    share the same name and keyword arguments, they should compute the same result.
+
+    """
+
+    def __init__(self, func: Callable, name: Optional[str] = None, **kwargs):
+        """Create Intermediate instance."""
+        assert callable(func), f"The given argument {func} is not callable!"
+        self.func = func
+        self.name = _get_name(func) if name is None else name
+        self.kwargs: dict = kwargs
+
+        self._freeze()
+
+    @property
+    def key(self) -> str:
+        """Return the key that identifies the intermediate (i.e., name + kwargs)."""
+        kwargs_str = ", ".join(
+            f"{k}={_kwarg_key(v)}" for k, v in sorted(self.kwargs.items())
+        )
+        return f"{self.name}({kwargs_str})"
+
+    def __repr__(self) -> str:
+        """Return repr string."""
+        return f"{self.__class__.__name__}({self.key})"
+
+    def __call__(self, windows: np.ndarray) -> Any:
+        """Compute the intermediate on the (stack of) window(s)."""
+        return self.func(windows, **self.kwargs)
+
+    def prepare(self, views: List[np.ndarray]) -> None:
+        """Prepare the computation of the intermediate on multiple segmentations.
+
+        Within a `FeatureCollection.calculate` call, this method is called once per
+        series (before the feature calculation is dispatched to the workers) with the
+        strided views of all the (regular) segmentations of that series that use this
+        intermediate. By default, nothing is prepared.
+        """
+
+
+class SeriesIntermediate(Intermediate):
+    """Intermediate that is derived from a precomputation on the whole series.
+
+    The precomputation (e.g., prefix sums) is computed once per series (instead of
+    once per segmentation); within a `FeatureCollection.calculate` call it is thus
+    shared by all the segmentations (i.e., windows & strides) of the series. The
+    intermediate of the segmented windows is then derived from the precomputation,
+    using the start and end indexes of the windows.
+
+    Parameters
+    ----------
+    func : Callable
+        The function that computes the precomputation on the values (1D array) of the
+        whole series.
+    window_func : Callable
+        The function that derives the intermediate of the segmented windows from the
+        precomputation. It is called as ``window_func(precomputed, start_indexes,
+        end_indexes)`` and should return an array with the segmented windows as first
+        axis.
+    name : str, optional
+        The name of the intermediate, by default None. If None, the name of `func` is
+        used.
+    **kwargs: dict, optional
+        Keyword arguments which will be also passed to `func`.
+
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        window_func: Callable,
+        name: Optional[str] = None,
+        **kwargs,
+    ):
+        """Create SeriesIntermediate instance."""
+        assert callable(window_func), f"The given {window_func} is not callable!"
+        self.window_func = window_func
+        super().__init__(func, name=name, **kwargs)
+
+    def precompute(self, values: np.ndarray) -> Any:
+        """Compute the precomputation on the values of the whole series."""
+        return self.func(values, **self.kwargs)
+
+    def from_precomputed(
+        self, precomputed: Any, start_indexes: np.ndarray, end_indexes: np.ndarray
+    ) -> np.ndarray:
+        """Derive the intermediate of the segmented windows from the precomputation."""
+        return self.window_func(precomputed, start_indexes, end_indexes)
+
+    def __call__(self, windows: np.ndarray) -> Any:
+        """Compute the intermediate on the (stack of) window(s)."""
+        windows = np.asarray(windows)
+        single_window = windows.ndim == 1
+        windows = np.atleast_2d(windows)
+        # The stacked windows are processed as a single (concatenated) series
+        start_indexes = np.arange(len(windows)) * windows.shape[1]
+        out = self.from_precomputed(
+            self.precompute(windows.ravel()),
+            start_indexes,
+            start_indexes + windows.shape[1],
+        )
+        return out[0] if single_window else out
+
+
+def _array_digest(arr: np.ndarray) -> str:
+    """Return a digest of the content (i.e., dtype, shape & values) of the array."""
+    arr = np.asarray(arr)
+    digest = hashlib.blake2b(f"{arr.dtype.str}{arr.shape}".encode(), digest_size=16)
+    if arr.dtype.hasobject:
+        digest.update(repr(arr.tolist()).encode())
+    else:
+        digest.update(np.ascontiguousarray(arr).data)
+    return digest.hexdigest()
+
+
+def _kwarg_key(value: Any) -> str:
+    # The repr of a (large) array is truncated -> use a digest of its content
+    if isinstance(value, np.ndarray):
+        return f"array<{_array_digest(value)}>"
+    return repr(value)
+
+
+@contextmanager
+def _intermediate_cache() -> Iterator[Dict[Any, Any]]:
+    """Context in which the computed intermediates are cached (and shared)."""
+    global _INTERMEDIATE_CACHE
+    _INTERMEDIATE_CACHE = {}
+    try:
+        yield _INTERMEDIATE_CACHE
+    finally:
+        _INTERMEDIATE_CACHE = None
+
+
+def _get_intermediate_cache() -> Optional[Dict[Any, Any]]:
+    """Return the active intermediate cache (None when there is no active cache)."""
+    return _INTERMEDIATE_CACHE
+
+
+@contextmanager
+def _intermediate_scope() -> Iterator[None]:
+    """Context after which the intermediates that are cached within it are evicted.
+
+    Only the intermediates that are cached with `_cache_scoped` (i.e., those of the
+    segmented windows) are evicted; the precomputations on the whole series (and the
+    prepared results) are kept in the intermediate cache.
+    """
+    global _SCOPED_KEYS
+    outer_keys, _SCOPED_KEYS = _SCOPED_KEYS, []
+    try:
+        yield
+    finally:
+        if _INTERMEDIATE_CACHE is not None:
+            for key in _SCOPED_KEYS:
+                _INTERMEDIATE_CACHE.pop(key, None)
+        _SCOPED_KEYS = outer_keys
+
+
+def _cache_scoped(cache: Dict[Any, Any], key: Any, value: Any) -> None:
+    """Cache the value until the end of the active `_intermediate_scope` (if any)."""
+    cache[key] = value
+    if _SCOPED_KEYS is not None:
+        _SCOPED_KEYS.append(key)
+
+
+# ------------------------------- Built-in intermediates -------------------------------
+
+
+def _rfft(x: np.ndarray, **kwargs) -> np.ndarray:
+    return np.fft.rfft(x, axis=-1, **kwargs)
+
+
+def _sort(x: np.ndarray) -> np.ndarray:
+    return np.sort(x, axis=-1)
+
+
+def _diff(x: np.ndarray, **kwargs) -> np.ndarray:
+    return np.diff(x, axis=-1, **kwargs)
+
+
+def _welch_psd(x: np.ndarray, **kwargs) -> np.ndarray:
+    from scipy.signal import welch
+
+    # The window length (nperseg) is capped to the length of the segmented windows
+    kwargs.setdefault("nperseg", min(256, x.shape[-1]))
+    return welch(x, axis=-1, **kwargs)[1]
+
+
+def _get_spectral_window(window: Union[str, np.ndarray], nperseg: int) -> np.ndarray:
+    """Return the (periodic) spectral window of length `nperseg`."""
+    if not isinstance(window, str):
+        window = np.asarray(window, dtype=float)
+        assert window.shape == (nperseg,), "The window must have length nperseg!"
+        return window
+    n = np.arange(nperseg)
+    if window in ["hann", "hanning"]:
+        return 0.5 - 0.5 * np.cos(2 * np.pi * n / nperseg)
+    elif window == "hamming":
+        return 0.54 - 0.46 * np.cos(2 * np.pi * n / nperseg)
+    elif window in ["boxcar", "rectangular"]:
+        return np.ones(nperseg)
+    raise ValueError(f"Unsupported spectral window {window}!")
+
+
+def _segment_spectra(
+    x: np.ndarray,
+    nperseg: Optional[int] = None,
+    noverlap: Optional[int] = None,
+    window: Union[str, np.ndarray] = "hann",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the spectra of the (Welch) segments along the last axis of `x`.
+
+    Returns the spectra of the (constant detrended & windowed) segments, with shape
+    (..., nb. segments, nb. frequencies), and the spectral window.
+    """
+    nperseg = x.shape[-1] if nperseg is None else min(nperseg, x.shape[-1])
+    noverlap = nperseg // 2 if noverlap is None else noverlap
+    assert 0 <= noverlap < nperseg, "noverlap must be in [0, nperseg)!"
+    # Use an even FFT length, so that the frequencies are linspace(0, fs / 2, n_freqs)
+    nfft = nperseg + nperseg % 2
+
+    # View of the (overlapping) segments; shape (..., nb. segments, nperseg)
+    segments = np.lib.stride_tricks.sliding_window_view(x, nperseg, axis=-1)
+    segments = segments[..., :: nperseg - noverlap, :]
+    win = _get_spectral_window(window, nperseg)
+    # Remove the mean of each segment (i.e., constant detrending)
+    segments = (segments - segments.mean(axis=-1, keepdims=True)) * win
+    return np.fft.rfft(segments, n=nfft, axis=-1), win
+
+
+def _power_spectrum(
+    x: np.ndarray,
+    fs: float = 1.0,
+    nperseg: Optional[int] = None,
+    noverlap: Optional[int] = None,
+    window: Union[str, np.ndarray] = "hann",
+) -> np.ndarray:
+    spectra, win = _segment_spectra(x, nperseg, noverlap, window)
+    psd = np.abs(spectra) ** 2
+    # Density scaling of the one-sided spectrum (the Nyquist bin is not doubled)
+    psd /= fs * np.sum(win**2)
+    psd[..., 1:-1] *= 2
+    # Average over the segments
+    return psd.mean(axis=-2)
+
+
+def rfft(**kwargs) -> Intermediate:
+    """Real FFT of the segmented windows (see `np.fft.rfft`)."""
+    return Intermediate(_rfft, name="rfft", **kwargs)
+
+
+def sort() -> Intermediate:
+    """Sorted values of the segmented windows (see `np.sort`)."""
+    return Intermediate(_sort, name="sort")
+
+
+def diff(**kwargs) -> Intermediate:
+    """Discrete difference of the segmented windows (see `np.diff`)."""
+    return Intermediate(_diff, name="diff", **kwargs)
+
+
+def welch_psd(**kwargs) -> Intermediate:
+    """Power spectral density (only the PSD values) using Welch's method.
+
+    The keyword arguments (e.g., `fs` or `nperseg`) are passed to
+    `scipy.signal.welch`.
+    """
+    return Intermediate(_welch_psd, name="welch_psd", **kwargs)
+
+
+def power_spectrum(
+    fs: float = 1.0,
+    nperseg: Optional[int] = None,
+    noverlap: Optional[int] = None,
+    window: Union[str, np.ndarray] = "hann",
+) -> Intermediate:
+    """(Welch-averaged) power spectral density, computed batched with numpy.
+
+    When the segmentation is regular, a single batched `np.fft.rfft` is performed on
+    the strided view of all the segmented windows. The result has shape
+    (nb. segmented windows, nb. frequencies), with the frequencies equal to
+    ``np.linspace(0, fs / 2, nb. frequencies)``.
+
+    Parameters
+    ----------
+    fs : float, optional
+        The sampling frequency of the data, by default 1.0.
+    nperseg : int, optional
+        The length of each (Welch) segment, by default None. If None (or larger than
+        the window size), a single segment that spans the whole window is used (i.e.,
+        a windowed periodogram).
+    noverlap : int, optional
+        The number of samples that the (Welch) segments overlap, by default None. If
+        None, ``nperseg // 2`` is used.
+    window : Union[str, np.ndarray], optional
+        The spectral window that is applied on each segment, by default "hann".
+        Either one of `["hann", "hamming", "boxcar"]` or an array of length `nperseg`.
+
+    Notes
+    -----
+    The result equals ``scipy.signal.welch`` (with the default constant detrending and
+    density scaling) when using an even `nperseg`. For an odd `nperseg`, the segments
+    are zero-padded to an even FFT length (i.e., ``nfft = nperseg + 1``).
+
+    """
+    return Intermediate(
+        _power_spectrum,
+        name="power_spectrum",
+        fs=fs,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        window=window,
+    )
+
+
+# The statistics of the `prefix_statistics` intermediate
+_PREFIX_STATISTICS = ["count", "nan_count", "sum", "sumsq", "sign_changes"]
+
+
+def _prefix_statistics(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute the prefix arrays; ``prefix[k]`` is the statistic of ``values[:k]``."""
+    values = np.asarray(values, dtype=np.float64)
+    isnan = np.isnan(values)
+    filled = np.where(isnan, 0, values)
+    signs = np.sign(filled)  # the sign of NaN values is 0
+    # A sign change between sample i-1 and i is assigned to sample i
+    sign_changes = np.zeros(len(values), dtype=np.int64)
+    sign_changes[1:] = signs[1:] * signs[:-1] < 0
+
+    def prefix(arr: np.ndarray) -> np.ndarray:
+        return np.concatenate([np.zeros(1, dtype=arr.dtype), np.cumsum(arr)])
+
+    return {
+        "nan_count": prefix(isnan.astype(np.int64)),
+        "sum": prefix(filled),
+        "sumsq": prefix(filled * filled),
+        "sign_changes": prefix(sign_changes),
+    }
+
+
+def _prefix_window_statistics(
+    prefixes: Dict[str, np.ndarray], start_indexes: np.ndarray, end_indexes: np.ndarray
+) -> np.ndarray:
+    out = np.empty(
+        len(start_indexes), dtype=[(k, np.float64) for k in _PREFIX_STATISTICS]
+    )
+    nan_count = (
+        prefixes["nan_count"][end_indexes] - prefixes["nan_count"][start_indexes]
+    )
+    out["nan_count"] = nan_count
+    out["count"] = (end_indexes - start_indexes) - nan_count
+    out["sum"] = prefixes["sum"][end_indexes] - prefixes["sum"][start_indexes]
+    out["sumsq"] = prefixes["sumsq"][end_indexes] - prefixes["sumsq"][start_indexes]
+    # Only the sign changes within the window (i.e., not the one at its first sample)
+    sign_changes = prefixes["sign_changes"]
+    first_idxs = np.minimum(start_indexes + 1, end_indexes)
+    out["sign_changes"] = sign_changes[end_indexes] - sign_changes[first_idxs]
+    return out
+
+
+def prefix_statistics() -> SeriesIntermediate:
+    """NaN-aware statistics of the segmented windows, derived from prefix arrays.
+
+    The prefix arrays (i.e., cumulative sums) are computed once per series, after which
+    the statistics of each segmented window are derived in O(1). The result is a
+    structured array with the fields:
+
+    * `count`: the number of (non-NaN) samples
+    * `nan_count`: the number of NaN samples
+    * `sum`: the sum of the (non-NaN) samples
+    * `sumsq`: the sum of squares of the (non-NaN) samples
+    * `sign_changes`: the number of consecutive samples with strictly opposite signs
+
+    .. Note::
+        As the sums are derived from the difference of cumulative sums (over the whole
+        series), these are subject to floating point round-off errors for (very) long
+        series with large values.
+
+    """
+    return SeriesIntermediate(
+        _prefix_statistics, _prefix_window_statistics, name="prefix_statistics"
+    )
+
+
+def _nan_prefix_count(values: np.ndarray) -> np.ndarray:
+    """Compute the prefix NaN count; ``prefix[k]`` is the nb. of NaNs in ``values[:k]``."""
+    values = np.asarray(values)
+    out = np.zeros(len(values) + 1, dtype=np.int64)
+    if values.dtype.kind == "f":  # only floating point values can contain NaNs
+        np.cumsum(np.isnan(values), out=out[1:])
+    return out
+
+
+def _window_nan_count(
+    prefix: np.ndarray, start_indexes: np.ndarray, end_indexes: np.ndarray
+) -> np.ndarray:
+    return prefix[end_indexes] - prefix[start_indexes]
+
+
+# The number of NaNs in each segmented window (used by the robust FuncWrappers)
+_NAN_COUNT = SeriesIntermediate(_nan_prefix_count, _window_nan_count, name="_nan_count")
@@ -0,0 +1,53 @@
+"""Library of ready-made (vectorized) feature functions.
+
+The feature functions in this submodule are provided as `FuncWrapper`s, which can
+directly be used in `FeatureDescriptor`s (or `MultipleFeatureDescriptors`).
+
+The library contains:
+
+* `statistical`: moments & extremes (mean, std, skewness, kurtosis, ...)
+* `order_statistics`: (sliding) median & quantiles
+* `temporal`: crossing rates, slope, autocorrelation & peak counts
+* `spectral`: spectral centroid, entropy, edge frequency & band powers
+* `complexity`: sample, approximate, permutation & SVD entropy
+* `pairwise`: cross-series correlation, covariance, cross-correlation lag & coherence
+  (to be used in a `PairwiseFeatureDescriptor`)
+* `decomposable`: statistics that are derived from shared block results
+* `sketches`: approximate quantiles & distinct counts for very large windows
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+from .complexity import (
+    get_approximate_entropy_feature,
+    get_permutation_entropy_feature,
+    get_sample_entropy_feature,
+    get_svd_entropy_feature,
+)
+from .decomposable import get_decomposable_features
+from .order_statistics import get_median_feature, get_quantile_features
+from .pairwise import get_pairwise_features
+from .sketches import (
+    get_approximate_distinct_count_feature,
+    get_approximate_quantile_features,
+)
+from .spectral import get_spectral_features
+from .statistical import get_statistical_features
+from .temporal import get_temporal_features
+
+__all__ = [
+    "get_approximate_distinct_count_feature",
+    "get_approximate_entropy_feature",
+    "get_approximate_quantile_features",
+    "get_decomposable_features",
+    "get_median_feature",
+    "get_pairwise_features",
+    "get_permutation_entropy_feature",
+    "get_quantile_features",
+    "get_sample_entropy_feature",
+    "get_spectral_features",
+    "get_statistical_features",
+    "get_svd_entropy_feature",
+    "get_temporal_features",
+]
@@ -0,0 +1,401 @@
+"""Fast entropy / complexity feature functions.
+
+The feature functions in this module operate on the strided view of the segmented
+windows (i.e., shape (nb. windows, window size)) and avoid the quadratic (in the
+window size) template comparisons of naive implementations:
+
+* **sample & approximate entropy**: the templates are assigned to the cells of a grid
+  (with the tolerance as cell size) on their first two values, after which only the
+  templates in the same or adjacent cells are compared (i.e., sorted-neighbour
+  counting) - instead of all template pairs.
+* **permutation entropy**: the ordinal patterns are computed once on the data that is
+  covered by the (overlapping) windows, and are hashed into integers, after which the
+  patterns of all windows are counted at once.
+* **SVD entropy**: the singular values are derived from the (order x order) Gram
+  matrix of each window its embedding, which is computed batched on strided views.
+
+The results correspond with the (Chebyshev) definitions of e.g., `antropy`.
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import (
+    get_permutation_entropy_feature, get_sample_entropy_feature
+)
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=[
+            get_sample_entropy_feature(order=2),
+            get_permutation_entropy_feature(order=3, normalize=True),
+        ],
+        series_names="EDA", windows="5min", strides="30s",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import math
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+from .sketches import _get_strided_data
+
+# The maximal number of candidate template pairs that are compared at once
+_MAX_PAIRS_PER_CHUNK = 2**22
+
+
+def _embed(x: np.ndarray, order: int, delay: int) -> np.ndarray:
+    """Time-delay embedding (view) along the last axis; shape (..., nb. vectors, order)."""
+    nb_vectors = x.shape[-1] - (order - 1) * delay
+    assert nb_vectors > 0, "The window is too small for the given order and delay!"
+    return np.lib.stride_tricks.as_strided(
+        x,
+        shape=x.shape[:-1] + (nb_vectors, order),
+        strides=x.strides + (x.strides[-1] * delay,),
+        writeable=False,
+    )
+
+
+def _get_tolerance(x: np.ndarray, tolerance: Optional[float]) -> float:
+    # As in antropy; the default tolerance is 0.2 times the standard deviation
+    return 0.2 * np.std(x) if tolerance is None else tolerance
+
+
+def _chunked_ranges(
+    lo: np.ndarray, hi: np.ndarray
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield (chunks of) the (position, index) pairs for the index ranges [lo, hi)."""
+    counts = np.maximum(hi - lo, 0)
+    cum_counts = np.cumsum(counts)
+    if not len(counts) or cum_counts[-1] == 0:
+        return
+    # Split the positions in chunks with a bounded number of pairs
+    bounds = np.searchsorted(
+        cum_counts,
+        np.arange(_MAX_PAIRS_PER_CHUNK, cum_counts[-1], _MAX_PAIRS_PER_CHUNK),
+        side="right",
+    )
+    bounds = np.unique(np.concatenate([[0], bounds, [len(counts)]]))
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        chunk_counts = counts[start:end]
+        positions = np.repeat(np.arange(start, end), chunk_counts)
+        offsets = np.arange(len(positions)) - np.repeat(
+            np.cumsum(chunk_counts) - chunk_counts, chunk_counts
+        )
+        yield positions, lo[positions] + offsets
+
+
+def _candidate_pairs(
+    coords: np.ndarray, r: float
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield (chunks of) the candidate index pairs (i, j) of matching templates.
+
+    The templates are assigned to the cells of a grid (with cell size r) on their
+    first two coordinates; templates that match (i.e., are within Chebyshev distance
+    r) lie in the same or adjacent cells. Each (unordered) pair of templates in the
+    same or adjacent cells is yielded once.
+    """
+    # The cells are slightly larger than r, which avoids missing pairs due to round-off
+    cell_size = r * (1 + 1e-9) if r > 0 else 1.0
+    cells = np.floor(coords[:, :2] / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    nb_cols = int(cells[:, 1].max()) + 3 if cells.shape[1] == 2 else 1
+    if (int(cells[:, 0].max()) + 2) * nb_cols >= 2**62:
+        # The grid is too large to be indexed -> only use the first coordinate
+        cells, nb_cols = cells[:, :1], 1
+    keys = cells[:, 0] * nb_cols
+    if nb_cols > 1:
+        keys += cells[:, 1] + 1
+        neighbours = [(0, 1), (1, -1), (1, 0), (1, 1)]
+    else:
+        neighbours = [(1, 0)]
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    positions = np.arange(len(keys))
+    # The pairs within the same cell; only the subsequent templates
+    hi = np.searchsorted(sorted_keys, sorted_keys, side="right")
+    for i, j in _chunked_ranges(positions + 1, hi):
+        yield order[i], order[j]
+    # The pairs with the (half of the) neighbouring cells
+    for d_row, d_col in neighbours:
+        neighbour_keys = sorted_keys + d_row * nb_cols + d_col
+        lo = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+        hi = np.searchsorted(sorted_keys, neighbour_keys, side="right")
+        for i, j in _chunked_ranges(lo, hi):
+            yield order[i], order[j]
+
+
+def _sample_entropy(x: np.ndarray, order: int, r: float) -> float:
+    # The templates of length order + 1; the first `order` values of these are the
+    # N - order templates of length `order` (as in the definition of sample entropy)
+    emb = _embed(x, order + 1, 1)
+    nb_matches_m, nb_matches_m1 = 0, 0
+    for i, j in _candidate_pairs(emb[:, :order], r):
+        within_r = np.abs(emb[i] - emb[j]) <= r
+        match_m = within_r[:, :order].all(axis=1)
+        nb_matches_m += np.count_nonzero(match_m)
+        nb_matches_m1 += np.count_nonzero(match_m & within_r[:, order])
+    if nb_matches_m == 0:
+        return np.nan  # undefined: no templates of length `order` match
+    if nb_matches_m1 == 0:
+        return np.inf
+    return -math.log(nb_matches_m1 / nb_matches_m)
+
+
+def _approximate_entropy(x: np.ndarray, order: int, r: float) -> float:
+    emb = _embed(x, order, 1)
+    nb_m, nb_m1 = len(emb), len(emb) - 1
+    # The number of matching templates (including the template itself)
+    counts_m = np.ones(nb_m)
+    counts_m1 = np.ones(nb_m1)
+    for i, j in _candidate_pairs(emb, r):
+        match = (np.abs(emb[i] - emb[j]) <= r).all(axis=1)
+        i, j = i[match], j[match]
+        counts_m += np.bincount(i, minlength=nb_m) + np.bincount(j, minlength=nb_m)
+        # The templates of length order + 1 (only the first N - order templates)
+        valid = (i < nb_m1) & (j < nb_m1)
+        i, j = i[valid], j[valid]
+        match = np.abs(x[i + order] - x[j + order]) <= r
+        i, j = i[match], j[match]
+        counts_m1 += np.bincount(i, minlength=nb_m1) + np.bincount(j, minlength=nb_m1)
+    phi_m = np.mean(np.log(counts_m / nb_m))
+    phi_m1 = np.mean(np.log(counts_m1 / nb_m1))
+    return phi_m - phi_m1
+
+
+def _apply_per_window(func, windows: np.ndarray, order: int, tolerance) -> np.ndarray:
+    """Apply the template matching `func` on each window (row) of `windows`."""
+    windows = np.asarray(windows, dtype=np.float64)
+    single_window = windows.ndim == 1
+    out = np.full(len(np.atleast_2d(windows)), np.nan)
+    for idx, x in enumerate(np.atleast_2d(windows)):
+        if len(x) > order + 1 and not np.isnan(x).any():
+            out[idx] = func(x, order, _get_tolerance(x, tolerance))
+    return out[0] if single_window else out
+
+
+def sample_entropy(
+    windows: np.ndarray, order: int = 2, tolerance: Optional[float] = None
+) -> np.ndarray:
+    """Compute the sample entropy (with the Chebyshev distance) of each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size), or a single
+        window.
+    order : int, optional
+        The embedding dimension (i.e., the template length), by default 2.
+    tolerance : float, optional
+        The tolerance (r) for two templates to match, by default None. If None,
+        0.2 times the standard deviation of the window is used.
+
+    Returns
+    -------
+    np.ndarray
+        The sample entropy of each window. Windows with NaNs, or windows without
+        matching templates, result in NaN.
+
+    """
+    return _apply_per_window(_sample_entropy, windows, order, tolerance)
+
+
+def approximate_entropy(
+    windows: np.ndarray, order: int = 2, tolerance: Optional[float] = None
+) -> np.ndarray:
+    """Compute the approximate entropy (with the Chebyshev distance) of each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size), or a single
+        window.
+    order : int, optional
+        The embedding dimension (i.e., the template length), by default 2.
+    tolerance : float, optional
+        The tolerance (r) for two templates to match, by default None. If None,
+        0.2 times the standard deviation of the window is used.
+
+    Returns
+    -------
+    np.ndarray
+        The approximate entropy of each window. Windows with NaNs result in NaN.
+
+    """
+    return _apply_per_window(_approximate_entropy, windows, order, tolerance)
+
+
+def _ordinal_pattern_hashes(x: np.ndarray, order: int, delay: int) -> np.ndarray:
+    """Hash the ordinal pattern of each embedding vector (along the last axis)."""
+    ranks = np.argsort(_embed(x, order, delay), axis=-1, kind="stable")
+    return np.sum(ranks * order ** np.arange(order), axis=-1)
+
+
+def permutation_entropy(
+    windows: np.ndarray, order: int = 3, delay: int = 1, normalize: bool = False
+) -> np.ndarray:
+    """Compute the permutation entropy (in bits) of each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size), or a single
+        window.
+    order : int, optional
+        The order (i.e., length) of the ordinal patterns, by default 3.
+    delay : int, optional
+        The time delay (lag) between the samples of the patterns, by default 1.
+    normalize : bool, optional
+        Whether the entropy is divided by its maximum (i.e., log2(order!)), by
+        default False.
+
+    Returns
+    -------
+    np.ndarray
+        The permutation entropy of each window.
+
+    """
+    windows = np.asarray(windows)
+    single_window = windows.ndim == 1
+    windows = np.atleast_2d(windows)
+    nb_patterns = windows.shape[1] - (order - 1) * delay
+
+    strided_data = _get_strided_data(windows)
+    if strided_data is not None:
+        # The patterns are computed once on the data of the (overlapping) windows
+        data, step = strided_data
+        hashes = _ordinal_pattern_hashes(data, order, delay)
+        hashes = np.lib.stride_tricks.as_strided(
+            hashes,
+            shape=(len(windows), nb_patterns),
+            strides=(hashes.strides[0] * step, hashes.strides[0]),
+            writeable=False,
+        )
+    else:
+        hashes = _ordinal_pattern_hashes(windows, order, delay)
+
+    # Count the patterns of each window at once
+    uniques, inverse = np.unique(hashes, return_inverse=True)
+    window_idxs = np.repeat(np.arange(len(windows)), nb_patterns)
+    counts = np.bincount(
+        window_idxs * len(uniques) + inverse.ravel(),
+        minlength=len(windows) * len(uniques),
+    ).reshape(len(windows), len(uniques))
+    p = counts / nb_patterns
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy = -np.sum(np.where(p > 0, p * np.log2(p), 0), axis=1)
+    if normalize:
+        entropy /= np.log2(math.factorial(order))
+    return entropy[0] if single_window else entropy
+
+
+def svd_entropy(
+    windows: np.ndarray, order: int = 3, delay: int = 1, normalize: bool = False
+) -> np.ndarray:
+    """Compute the singular value decomposition entropy (in bits) of each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size), or a single
+        window.
+    order : int, optional
+        The embedding dimension, by default 3.
+    delay : int, optional
+        The time delay (lag) of the embedding, by default 1.
+    normalize : bool, optional
+        Whether the entropy is divided by its maximum (i.e., log2(order)), by default
+        False.
+
+    Returns
+    -------
+    np.ndarray
+        The SVD entropy of each window.
+
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    single_window = windows.ndim == 1
+    emb = _embed(np.atleast_2d(windows), order, delay)
+    # The singular values of the embedding are the square roots of the eigenvalues of
+    # its (order x order) Gram matrix
+    gram = np.einsum("wti,wtj->wij", emb, emb)
+    singular_values = np.sqrt(np.clip(np.linalg.eigvalsh(gram), 0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = singular_values / np.sum(singular_values, axis=1, keepdims=True)
+        entropy = -np.sum(np.where(s > 0, s * np.log2(s), 0), axis=1)
+    entropy = np.where(np.isnan(s).any(axis=1), np.nan, entropy)
+    if normalize:
+        entropy /= np.log2(order)
+    return entropy[0] if single_window else entropy
+
+
+def get_sample_entropy_feature(
+    order: int = 2, tolerance: Optional[float] = None
+) -> FuncWrapper:
+    """Get the vectorized sample entropy `FuncWrapper`.
+
+    See `sample_entropy` for more info on the parameters.
+    """
+    return FuncWrapper(
+        sample_entropy,
+        output_names="sample_entropy",
+        vectorized=True,
+        order=order,
+        tolerance=tolerance,
+    )
+
+
+def get_approximate_entropy_feature(
+    order: int = 2, tolerance: Optional[float] = None
+) -> FuncWrapper:
+    """Get the vectorized approximate entropy `FuncWrapper`.
+
+    See `approximate_entropy` for more info on the parameters.
+    """
+    return FuncWrapper(
+        approximate_entropy,
+        output_names="approximate_entropy",
+        vectorized=True,
+        order=order,
+        tolerance=tolerance,
+    )
+
+
+def get_permutation_entropy_feature(
+    order: int = 3, delay: int = 1, normalize: bool = False
+) -> FuncWrapper:
+    """Get the vectorized permutation entropy `FuncWrapper`.
+
+    See `permutation_entropy` for more info on the parameters.
+    """
+    return FuncWrapper(
+        permutation_entropy,
+        output_names="permutation_entropy",
+        vectorized=True,
+        order=order,
+        delay=delay,
+        normalize=normalize,
+    )
+
+
+def get_svd_entropy_feature(
+    order: int = 3, delay: int = 1, normalize: bool = False
+) -> FuncWrapper:
+    """Get the vectorized SVD entropy `FuncWrapper`.
+
+    See `svd_entropy` for more info on the parameters.
+    """
+    return FuncWrapper(
+        svd_entropy,
+        output_names="svd_entropy",
+        vectorized=True,
+        order=order,
+        delay=delay,
+        normalize=normalize,
+    )
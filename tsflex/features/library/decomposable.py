@@ -0,0 +1,298 @@
+"""Decomposable statistics that are composed hierarchically from block results.
+
+Decomposable (i.e., mergeable) statistics such as the count, sum, sum of squares,
+min, max and the (central) moments of a window can be derived from the statistics
+of the (non-overlapping) blocks that make up the window.
+
+The data is split in blocks of ``gcd(window, stride)`` samples, for which the
+statistics are computed. Within a `FeatureCollection.calculate` call, the block results
+of a series are computed once (before the calculation is dispatched), using as block
+size the gcd of the block sizes of all its segmentations. The statistics of each
+segmentation (e.g., a 60s window with a 30s stride, and a 10s window with a 10s stride)
+are then derived by combining these shared block results instead of rescanning the
+data. As such, a collection with multiple windows & strides costs roughly one pass
+over the data (regardless of the order of the windows and of `n_jobs`).
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import get_decomposable_features
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=get_decomposable_features(["mean", "std", "min", "max"]),
+        series_names="EDA",
+        windows=["10s", "30s", "60s", "5min", "15min"],
+        strides="10s",
+    )
+)
+```
+
+.. Tip::
+    The block results can only be shared when the gcd of the windows & strides (in
+    number of samples) is not too small; e.g., use windows & strides that are
+    multiples of each other.
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import math
+from functools import reduce
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+from ..intermediate import Intermediate, _get_intermediate_cache
+from .sketches import _get_strided_data, _merge_block_sketches
+
+# The statistics that are computed for each block (and window)
+_STATISTICS = ["count", "sum", "sumsq", "min", "max", "mean", "m2"]
+
+# The minimal block size of the shared block results; combining smaller blocks is
+# slower than rescanning the data of each segmentation
+_MIN_SHARED_BLOCK_SIZE = 4
+
+
+def _block_partials(blocks: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute the statistics of each block (i.e., each row of `blocks`)."""
+    count = np.full(len(blocks), blocks.shape[1], dtype=np.float64)
+    total = np.sum(blocks, axis=1, dtype=np.float64)
+    mean = total / count
+    return {
+        "count": count,
+        "sum": total,
+        "sumsq": np.einsum("ij,ij->i", blocks, blocks, dtype=np.float64),
+        "min": np.min(blocks, axis=1).astype(np.float64),
+        "max": np.max(blocks, axis=1).astype(np.float64),
+        "mean": mean,
+        "m2": np.sum((blocks - mean[:, None]) ** 2, axis=1),
+    }
+
+
+def _combine_partials(
+    partials: Dict[str, np.ndarray], nb_per_group: int, nb_per_step: int, nb_groups: int
+) -> Dict[str, np.ndarray]:
+    """Combine the statistics of (strided) groups of consecutive blocks.
+
+    The moments are combined with the parallel algorithm of Chan et al.
+    """
+    views = {
+        k: _merge_block_sketches(v, nb_per_group, nb_per_step, nb_groups)
+        for k, v in partials.items()
+    }
+    count = views["count"].sum(axis=1)
+    mean = np.sum(views["count"] * views["mean"], axis=1) / count
+    m2 = views["m2"].sum(axis=1) + np.sum(
+        views["count"] * (views["mean"] - mean[:, None]) ** 2, axis=1
+    )
+    return {
+        "count": count,
+        "sum": views["sum"].sum(axis=1),
+        "sumsq": views["sumsq"].sum(axis=1),
+        "min": views["min"].min(axis=1),
+        "max": views["max"].max(axis=1),
+        "mean": mean,
+        "m2": m2,
+    }
+
+
+def _get_block_partials(data: np.ndarray, block_size: int) -> Dict[str, np.ndarray]:
+    """Get the statistics of the blocks of `data` (using the prepared block results).
+
+    The prepared block results are identified by the memory range of their data (which
+    is kept alive by the cache, so that this memory can not be reused meanwhile).
+    """
+    cache = _get_intermediate_cache()
+    stride = data.strides[0]
+    if cache is not None and stride > 0:
+        start = data.__array_interface__["data"][0]
+        end = start + len(data) * stride
+        for rec_data, rec_block_size, rec_partials in cache.get(
+            ("block_statistics", stride, data.dtype.str), []
+        ):
+            rec_start = rec_data.__array_interface__["data"][0]
+            rec_end = rec_start + len(rec_data) * stride
+            if (
+                block_size % rec_block_size == 0
+                and rec_start <= start
+                and end <= rec_end
+                and (start - rec_start) % (stride * rec_block_size) == 0
+            ):
+                # Derive the block statistics from the prepared (finer) block results
+                offset = (start - rec_start) // (stride * rec_block_size)
+                nb_rec_blocks = len(data) // rec_block_size
+                rec_partials = {
+                    k: v[offset : offset + nb_rec_blocks]
+                    for k, v in rec_partials.items()
+                }
+                ratio = block_size // rec_block_size
+                return _combine_partials(
+                    rec_partials, ratio, ratio, len(data) // block_size
+                )
+    return _block_partials(data.reshape(-1, block_size))
+
+
+def _prepare_block_partials(views: List[np.ndarray]) -> None:
+    """Compute the block results that are shared by the segmentations of a series.
+
+    The segmentations (i.e., strided `views`) that cover the same data are grouped, and
+    for each group the block results are computed once, with as block size the gcd of
+    the block sizes (and of the offsets) of the segmentations. These are cached, so that
+    the block statistics of each segmentation are derived from them.
+    """
+    cache = _get_intermediate_cache()
+    if cache is None:
+        return
+    groups: Dict[tuple, list] = {}
+    for view in views:
+        strided_data = _get_strided_data(view) if view.ndim == 2 else None
+        if strided_data is None or strided_data[0].strides[0] <= 0:
+            continue
+        data, step = strided_data
+        key = ("block_statistics", data.strides[0], data.dtype.str)
+        groups.setdefault(key, []).append((data, math.gcd(view.shape[1], step)))
+
+    for key, group in groups.items():
+        if len(group) < 2:
+            continue  # nothing to share
+        stride = key[1]
+        starts = [data.__array_interface__["data"][0] for data, _ in group]
+        ends = [start + len(data) * stride for start, (data, _) in zip(starts, group)]
+        first = int(np.argmin(starts))
+        offsets = [(start - starts[first]) // stride for start in starts]
+        block_size = reduce(math.gcd, [b for _, b in group] + offsets)
+        if block_size < _MIN_SHARED_BLOCK_SIZE:
+            continue  # rescanning the data is cheaper than combining tiny blocks
+        # View on all the data of the group (i.e., starting at the first segmentation)
+        data = np.lib.stride_tricks.as_strided(
+            group[first][0],
+            shape=((max(ends) - starts[first]) // stride,),
+            strides=(stride,),
+            writeable=False,
+        )
+        partials = _block_partials(data.reshape(-1, block_size))
+        cache.setdefault(key, []).append((data, block_size, partials))
+
+
+def _block_statistics(windows: np.ndarray) -> np.ndarray:
+    single_window = windows.ndim == 1
+    if single_window:
+        windows = windows[None]
+
+    strided_data = _get_strided_data(windows)
+    if strided_data is None:
+        # Each window is a block
+        stats = _block_partials(windows)
+    else:
+        data, step = strided_data
+        block_size = math.gcd(windows.shape[1], step)
+        stats = _combine_partials(
+            _get_block_partials(data, block_size),
+            windows.shape[1] // block_size,
+            step // block_size,
+            len(windows),
+        )
+
+    out = np.empty(len(windows), dtype=[(k, np.float64) for k in _STATISTICS])
+    for k in _STATISTICS:
+        out[k] = stats[k]
+    return out[0] if single_window else out
+
+
+class _BlockStatistics(Intermediate):
+    """Block statistics intermediate, which prepares the shared block results."""
+
+    def prepare(self, views: List[np.ndarray]) -> None:
+        """Compute the block results that are shared by the segmentations."""
+        _prepare_block_partials(views)
+
+
+def block_statistics() -> Intermediate:
+    """Decomposable statistics of the segmented windows.
+
+    The result is a structured array with the fields
+    `["count", "sum", "sumsq", "min", "max", "mean", "m2"]`, where `m2` is the sum of
+    squared differences from the mean.
+    """
+    return _BlockStatistics(_block_statistics, name="block_statistics")
+
+
+def _count(stats: np.ndarray) -> np.ndarray:
+    return stats["count"]
+
+
+def _sum(stats: np.ndarray) -> np.ndarray:
+    return stats["sum"]
+
+
+def _sumsq(stats: np.ndarray) -> np.ndarray:
+    return stats["sumsq"]
+
+
+def _min(stats: np.ndarray) -> np.ndarray:
+    return stats["min"]
+
+
+def _max(stats: np.ndarray) -> np.ndarray:
+    return stats["max"]
+
+
+def _mean(stats: np.ndarray) -> np.ndarray:
+    return stats["mean"]
+
+
+def _var(stats: np.ndarray) -> np.ndarray:
+    return stats["m2"] / stats["count"]
+
+
+def _std(stats: np.ndarray) -> np.ndarray:
+    return np.sqrt(stats["m2"] / stats["count"])
+
+
+_STATISTIC_FUNCS = {
+    "count": _count,
+    "sum": _sum,
+    "sumsq": _sumsq,
+    "min": _min,
+    "max": _max,
+    "mean": _mean,
+    "var": _var,
+    "std": _std,
+}
+
+
+def get_decomposable_features(
+    statistics: Optional[List[str]] = None,
+) -> List[FuncWrapper]:
+    """Get the vectorized decomposable statistics `FuncWrapper`s.
+
+    Parameters
+    ----------
+    statistics : List[str], optional
+        The statistics to compute, by default None. Must be a subset of
+        `["count", "sum", "sumsq", "min", "max", "mean", "var", "std"]`. If None, all
+        statistics are computed. The variance and standard deviation are computed with
+        ``ddof=0`` (as `np.var` and `np.std`).
+
+    Returns
+    -------
+    List[FuncWrapper]
+        The vectorized functions, which all share the `block_statistics` intermediate.
+        These require that the data is regularly sampled.
+
+    """
+    statistics = list(_STATISTIC_FUNCS) if statistics is None else statistics
+    assert all(
+        s in _STATISTIC_FUNCS for s in statistics
+    ), f"The statistics must be a subset of {list(_STATISTIC_FUNCS)}!"
+    intermediate = block_statistics()
+    return [
+        FuncWrapper(
+            _STATISTIC_FUNCS[s],
+            output_names=s,
+            vectorized=True,
+            intermediate=intermediate,
+        )
+        for s in statistics
+    ]
@@ -0,0 +1,254 @@
+"""Vectorized sliding order statistics (median & quantiles).
+
+Applying `np.median` or `np.quantile` on each window is O(window) work for every
+window (and its vectorized variant partitions a full 2D copy of all the windows).
+For overlapping windows, the functions in this module maintain the sorted values of
+the window in a list of small sorted blocks, which is updated incrementally as the
+window advances by the stride; only the samples that leave and enter the window are
+processed, each in O(log window). The results are identical to those of `np.median`
+and `np.quantile` (with the default "linear" method).
+
+.. Note::
+    The incremental computation is used for (float64) windows that are much larger
+    than the stride, as only then the (per sample) bookkeeping is faster than numpy
+    its (per window) partitioning. In all other cases, the functions fall back to the
+    vectorized numpy implementation.
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import get_median_feature, get_quantile_features
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=[get_median_feature(), get_quantile_features([0.1, 0.9])],
+        series_names="EDA", windows="5min", strides="10s",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+
+# Windows with less samples, or windows that are less than `ratio` times larger than
+# the step, are processed with numpy (as the bookkeeping of the sorted blocks does not
+# pay off); the incremental update costs about 1us per sample that enters or leaves
+# the window, whereas numpy its partitioning costs about 15ns per window sample
+_MIN_WINDOW_SIZE = 1024
+_MIN_WINDOW_STEP_RATIO = 128
+
+
+def _get_window_step(windows: np.ndarray) -> Optional[int]:
+    """Return the number of samples between consecutive windows of a strided view.
+
+    Returns None when the step can not be derived from the strides of `windows` or
+    when consecutive windows do not overlap.
+    """
+    if windows.ndim != 2 or len(windows) < 2 or windows.strides[1] == 0:
+        return None
+    step, remainder = divmod(windows.strides[0], windows.strides[1])
+    if remainder or not 0 < step < windows.shape[1]:
+        return None
+    return step
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation between a and b (identical to numpy its `_lerp`)."""
+    diff_b_a = np.subtract(b, a)
+    lerp_interpolation = np.add(a, diff_b_a * t)
+    np.subtract(b, diff_b_a * (1 - t), out=lerp_interpolation, where=t >= 0.5)
+    return lerp_interpolation
+
+
+class _SortedBlocks:
+    """A sorted multiset of values, stored as a list of (small) sorted blocks.
+
+    Adding or removing a value bisects the block maxima and inserts / deletes the value
+    in its block; this costs O(log n + block size) instead of O(n) for a single sorted
+    buffer. The values at given (sorted) positions are looked up via the cumulative
+    block sizes.
+    """
+
+    _BLOCK_SIZE = 256
+
+    def __init__(self, values: List[float]):
+        values = sorted(values)
+        size = self._BLOCK_SIZE
+        self.blocks = [values[i : i + size] for i in range(0, len(values), size)]
+        self.maxes = [block[-1] for block in self.blocks]
+
+    def add(self, value: float):
+        blocks, maxes = self.blocks, self.maxes
+        if not blocks:
+            blocks.append([value])
+            maxes.append(value)
+            return
+        idx = bisect_left(maxes, value)
+        if idx == len(maxes):
+            # The value is larger than all values -> append to the last block
+            idx -= 1
+            blocks[idx].append(value)
+            maxes[idx] = value
+        else:
+            insort(blocks[idx], value)
+        block = blocks[idx]
+        if len(block) > 2 * self._BLOCK_SIZE:
+            # Split the block in two halves
+            blocks.insert(idx + 1, block[self._BLOCK_SIZE :])
+            del block[self._BLOCK_SIZE :]
+            maxes.insert(idx, block[-1])
+
+    def remove(self, value: float):
+        idx = bisect_left(self.maxes, value)
+        block = self.blocks[idx]
+        del block[bisect_left(block, value)]
+        if block:
+            self.maxes[idx] = block[-1]
+        else:
+            del self.blocks[idx]
+            del self.maxes[idx]
+
+    def take(self, positions: List[int]) -> List[float]:
+        cum_sizes = list(accumulate(map(len, self.blocks)))
+        out = []
+        for position in positions:
+            idx = bisect_right(cum_sizes, position)
+            out.append(self.blocks[idx][position - (cum_sizes[idx - 1] if idx else 0)])
+        return out
+
+
+def _sliding_take_sorted(
+    windows: np.ndarray, positions: np.ndarray
+) -> Optional[np.ndarray]:
+    """Take the values at the given positions of each sorted window.
+
+    Windows that contain a NaN result in NaN values. Returns None when the windows
+    can not be processed incrementally (i.e., when numpy should be used instead).
+    """
+    step = _get_window_step(windows)
+    if (
+        step is None
+        or windows.dtype != np.float64
+        or windows.shape[1] < _MIN_WINDOW_SIZE
+        or windows.shape[1] < step * _MIN_WINDOW_STEP_RATIO
+    ):
+        return None
+    nb_windows, window_size = windows.shape
+    data = np.lib.stride_tricks.as_strided(
+        windows,
+        shape=((nb_windows - 1) * step + window_size,),
+        strides=(windows.strides[1],),
+        writeable=False,
+    )
+    nan_prefix = np.concatenate([[0], np.cumsum(np.isnan(data))])
+    starts = np.arange(nb_windows) * step
+    has_nans = (nan_prefix[starts + window_size] - nan_prefix[starts]).tolist()
+
+    # The NaNs are not added to the sorted values (as they have no order)
+    values = data.tolist()
+    sorted_values = _SortedBlocks([v for v in values[:window_size] if v == v])
+    positions = positions.tolist()
+    out = np.empty((nb_windows, len(positions)), dtype=windows.dtype)
+    for idx in range(nb_windows):
+        if idx:
+            # Remove the samples that leave & add the samples that enter the window
+            start = idx * step
+            for value in values[start - step : start]:
+                if value == value:
+                    sorted_values.remove(value)
+            for value in values[start + window_size - step : start + window_size]:
+                if value == value:
+                    sorted_values.add(value)
+        out[idx] = np.nan if has_nans[idx] else sorted_values.take(positions)
+    return out
+
+
+def sliding_quantile(
+    windows: np.ndarray, q: Union[float, List[float]]
+) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+    """Compute the quantile(s) of each window (identical to `np.quantile`).
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size).
+    q : Union[float, List[float]]
+        The quantile(s) to compute, must be between 0 and 1.
+
+    Returns
+    -------
+    Union[np.ndarray, Tuple[np.ndarray, ...]]
+        The quantile of each window, or a tuple with for each quantile the quantile of
+        each window (when multiple quantiles are passed).
+
+    """
+    qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    assert np.all((qs >= 0) & (qs <= 1)), "Quantiles must be in the range [0, 1]!"
+    n = windows.shape[-1]
+    # Virtual index of the quantile (computed as numpy does for the linear method)
+    virtual_indexes = (n - 1) * qs
+    lower_positions = np.clip(np.floor(virtual_indexes).astype(np.intp), 0, n - 1)
+    upper_positions = np.clip(lower_positions + 1, 0, n - 1)
+    values = _sliding_take_sorted(
+        windows, np.concatenate([lower_positions, upper_positions])
+    )
+    if values is None:
+        out = np.quantile(windows, qs, axis=-1).T
+    else:
+        gammas = virtual_indexes - np.floor(virtual_indexes)
+        out = _lerp(values[:, : len(qs)], values[:, len(qs) :], gammas)
+    return out[:, 0] if np.ndim(q) == 0 else tuple(out.T)
+
+
+def sliding_median(windows: np.ndarray) -> np.ndarray:
+    """Compute the median of each window (identical to `np.median`).
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size).
+
+    Returns
+    -------
+    np.ndarray
+        The median of each window.
+
+    """
+    n = windows.shape[-1]
+    # The median of an even number of samples is the mean of both middle samples
+    positions = np.array([n // 2] if n % 2 else [n // 2 - 1, n // 2])
+    values = _sliding_take_sorted(windows, positions)
+    if values is None:
+        return np.median(windows, axis=-1)
+    if n % 2:
+        return values[:, 0]
+    return np.add(values[:, 0], values[:, 1]) / 2
+
+
+def get_median_feature() -> FuncWrapper:
+    """Get the vectorized sliding median `FuncWrapper`."""
+    return FuncWrapper(sliding_median, output_names="median", vectorized=True)
+
+
+def get_quantile_features(q: Union[float, List[float]]) -> FuncWrapper:
+    """Get the vectorized sliding quantile(s) `FuncWrapper`.
+
+    Parameters
+    ----------
+    q : Union[float, List[float]]
+        The quantile(s) to compute, must be between 0 and 1. The output names are
+        `quantile_<q>`.
+
+    """
+    output_names = [f"quantile_{q_}" for q_ in np.atleast_1d(q)]
+    return FuncWrapper(
+        sliding_quantile, output_names=output_names, vectorized=True, q=q
+    )
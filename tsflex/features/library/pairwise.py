@@ -0,0 +1,197 @@
+"""Vectorized pairwise (cross-series) feature functions.
+
+All the feature functions in this module operate on the stacked window block of
+multiple series, i.e., on arrays with shape (nb. windows, window size, nb. series), and
+return for each window the full (nb. series, nb. series) matrix of the pair statistic.
+These functions should be used in a `PairwiseFeatureDescriptor`, which segments all the
+series once and computes the statistic of all the pairs in one batched call.
+
+```python
+from tsflex.features import FeatureCollection, PairwiseFeatureDescriptor
+from tsflex.features.library import get_pairwise_features
+
+fc = FeatureCollection(
+    [
+        PairwiseFeatureDescriptor(
+            f, series_names=["ACC_x", "ACC_y", "ACC_z"], window="5s", stride="2s"
+        )
+        for f in get_pairwise_features(max_lag=32)
+    ]
+)
+# -> output columns such as "ACC_x|ACC_y__correlation__w=5s"
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+from ..intermediate import _segment_spectra
+
+
+def _deviations(windows: np.ndarray) -> np.ndarray:
+    return windows - np.mean(windows, axis=1, keepdims=True)
+
+
+def covariance(windows: np.ndarray, ddof: int = 1) -> np.ndarray:
+    """Covariance matrix of the series in each window (as `np.cov`)."""
+    deviations = _deviations(windows)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.einsum("nwi,nwj->nij", deviations, deviations) / (
+            windows.shape[1] - ddof
+        )
+
+
+def correlation(windows: np.ndarray) -> np.ndarray:
+    """Pearson correlation matrix of the series in each window (as `np.corrcoef`).
+
+    The correlation with a constant series (i.e., zero variance) is NaN.
+    """
+    cov = covariance(windows, ddof=0)
+    std = np.sqrt(np.diagonal(cov, axis1=1, axis2=2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / (std[:, :, None] * std[:, None, :])
+
+
+def cross_correlation_lag(
+    windows: np.ndarray, max_lag: Optional[int] = None
+) -> np.ndarray:
+    """Lag (in samples) at which the cross-correlation of each pair is maximal.
+
+    The cross-correlation of the series `i` and `j` at lag `l` is
+    ``sum((x_i[t] - mean_i) * (x_j[t + l] - mean_j))``; a positive lag thus indicates
+    that series `j` lags behind series `i`. The cross-correlations of all the pairs
+    are computed in one batched FFT.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The stacked windows, with shape (nb. windows, window size, nb. series).
+    max_lag : int, optional
+        The maximal (absolute) lag in samples, by default None. If None, all lags
+        (i.e., up to window size - 1) are considered.
+
+    Returns
+    -------
+    np.ndarray
+        The lag matrix of each window, with shape
+        (nb. windows, nb. series, nb. series).
+
+    """
+    n = windows.shape[1]
+    max_lag = n - 1 if max_lag is None else min(max_lag, n - 1)
+    nfft = 1 << int(2 * n - 1).bit_length()  # zero-padding avoids circular overlap
+    spectra = np.fft.rfft(_deviations(windows), n=nfft, axis=1)
+    xcorr = np.fft.irfft(
+        np.einsum("nfi,nfj->nijf", spectra.conj(), spectra), n=nfft, axis=-1
+    )
+    # Order the lags from -max_lag to max_lag
+    lags = np.arange(-max_lag, max_lag + 1)
+    return lags[np.argmax(xcorr[..., lags], axis=-1)]
+
+
+def coherence(
+    windows: np.ndarray,
+    fs: float = 1.0,
+    nperseg: Optional[int] = 256,
+    noverlap: Optional[int] = None,
+    window: Union[str, np.ndarray] = "hann",
+    fmin: float = 0.0,
+    fmax: Optional[float] = None,
+) -> np.ndarray:
+    """Mean magnitude squared coherence of each pair over a frequency band.
+
+    The coherence of the series `i` and `j` is ``|P_ij|**2 / (P_ii * P_jj)``, where
+    ``P_ij`` is the (Welch averaged) cross spectral density. The spectra of the Welch
+    segments are computed once (in one batched FFT) for all series, as done by the
+    `power_spectrum` intermediate, after which the cross spectra of all the pairs are
+    derived at once. The coherence with a constant series is NaN.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The stacked windows, with shape (nb. windows, window size, nb. series).
+    fs : float, optional
+        The sampling frequency of the data, by default 1.0.
+    nperseg : int, optional
+        The length of each (Welch) segment, by default 256. If None (or larger than
+        the window size), a single segment that spans the whole window is used; note
+        that the coherence of a single segment is always 1.
+    noverlap : int, optional
+        The number of samples that the (Welch) segments overlap, by default None. If
+        None, ``nperseg // 2`` is used.
+    window : Union[str, np.ndarray], optional
+        The spectral window that is applied on each segment, by default "hann".
+        Either one of `["hann", "hamming", "boxcar"]` or an array of length `nperseg`.
+    fmin : float, optional
+        The (exclusive) lower bound of the frequency band, by default 0.0. Hence, the
+        DC component (which is removed by the detrending) is excluded by default.
+    fmax : float, optional
+        The (inclusive) upper bound of the frequency band, by default None. If None,
+        the band ends at the Nyquist frequency (i.e., ``fs / 2``).
+
+    Returns
+    -------
+    np.ndarray
+        The coherence matrix of each window, with shape
+        (nb. windows, nb. series, nb. series).
+
+    Notes
+    -----
+    The coherence equals the mean (over the band) of ``scipy.signal.coherence`` when
+    using an even `nperseg`. For an odd `nperseg`, the segments are zero-padded to an
+    even FFT length (i.e., ``nfft = nperseg + 1``).
+
+    """
+    # Spectra of the segments; shape (nb. windows, nb. series, nb. segments, nb. freqs)
+    spectra, _ = _segment_spectra(
+        np.moveaxis(windows, -1, 1), nperseg=nperseg, noverlap=noverlap, window=window
+    )
+    freqs = np.linspace(0, fs / 2, spectra.shape[-1])
+    band = (freqs > fmin) & (freqs <= (fs / 2 if fmax is None else fmax))
+    spectra = spectra[..., band]
+    # The (unscaled) cross spectral densities of all the pairs; the scaling of the
+    # spectral densities cancels out in the coherence
+    csd = np.einsum("nisf,njsf->nijf", spectra.conj(), spectra)
+    psd = np.real(np.diagonal(csd, axis1=1, axis2=2))  # (nb. windows, nb. freqs, i)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coh = np.abs(csd) ** 2 / (
+            np.moveaxis(psd, -1, 1)[:, :, None] * np.moveaxis(psd, -1, 1)[:, None]
+        )
+    # Clip the rounding errors (Cauchy-Schwarz bounds the coherence by 1)
+    return np.minimum(coh, 1).mean(axis=-1)
+
+
+def get_pairwise_features(
+    max_lag: Optional[int] = None, nperseg: Optional[int] = 256
+) -> List[FuncWrapper]:
+    """Get the vectorized pairwise `FuncWrapper`s.
+
+    The returned functions should be used in a `PairwiseFeatureDescriptor`.
+
+    Parameters
+    ----------
+    max_lag : int, optional
+        The maximal (absolute) lag in samples of the cross-correlation, by default
+        None. If None, all lags are considered.
+    nperseg : int, optional
+        The length of the (Welch) segments of the coherence, by default 256. This
+        should be (a few times) smaller than the window size.
+
+    Returns
+    -------
+    List[FuncWrapper]
+        The pairwise functions, with output names `["correlation", "covariance",
+        "cross_correlation_lag", "coherence"]`.
+
+    """
+    return [
+        FuncWrapper(correlation, "correlation"),
+        FuncWrapper(covariance, "covariance"),
+        FuncWrapper(cross_correlation_lag, "cross_correlation_lag", max_lag=max_lag),
+        FuncWrapper(coherence, "coherence", nperseg=nperseg),
+    ]
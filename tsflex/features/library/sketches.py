@@ -0,0 +1,280 @@
+"""Approximate (sketch-based) feature functions for very large windows.
+
+Exact quantiles and distinct counts require processing every sample of every window,
+which is needlessly costly for e.g. day-long windows on high-frequency data. The
+feature functions in this module summarize the data in mergeable sketches instead.
+
+The data is split in blocks of ``gcd(window, stride)`` samples; each block is
+summarized **once** in a sketch, and the sketches of the blocks that make up a window
+are merged (i.e., overlapping windows share the sketches of their common blocks
+instead of rescanning the samples).
+
+* **quantiles**: each block is summarized by (at most) `k` evenly spaced order
+  statistics. The rank error of the merged summary is at most `rank_error` times the
+  window size (the result is exact when the blocks are smaller than `k`).
+* **distinct count**: each block is summarized in HyperLogLog registers, which are
+  merged by taking their maximum. The relative (standard) error of the estimate is
+  approximately `relative_error`. When the registers of all the (small) blocks would
+  take too much memory, each window is sketched directly instead.
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import (
+    get_approximate_distinct_count_feature, get_approximate_quantile_features
+)
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=[
+            get_approximate_quantile_features([0.05, 0.5, 0.95], rank_error=0.005),
+            get_approximate_distinct_count_feature(relative_error=0.02),
+        ],
+        series_names="EDA", windows="1D", strides="1h",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import math
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+
+
+def _get_strided_data(windows: np.ndarray) -> Optional[Tuple[np.ndarray, int]]:
+    """Return a view on the data that is covered by the (strided view of the) windows.
+
+    Returns
+    -------
+    Optional[Tuple[np.ndarray, int]]
+        The (read-only) data view and the step (in number of samples) between
+        consecutive windows, or None when consecutive windows are not shifted by a
+        (positive) number of samples.
+
+    """
+    nb_windows, window_size = windows.shape
+    if nb_windows < 2 or windows.strides[1] == 0:
+        return None
+    step, remainder = divmod(windows.strides[0], windows.strides[1])
+    if remainder or step <= 0:
+        return None
+    data = np.lib.stride_tricks.as_strided(
+        windows,
+        shape=((nb_windows - 1) * step + window_size,),
+        strides=(windows.strides[1],),
+        writeable=False,
+    )
+    return data, step
+
+
+def _get_blocks(windows: np.ndarray) -> Tuple[np.ndarray, int, int]:
+    """Split the data of the (strided view of the) windows into blocks.
+
+    Returns
+    -------
+    Tuple[np.ndarray, int, int]
+        The blocks with shape (nb. blocks, block size), the number of blocks per
+        window, and the number of blocks per stride.
+
+    """
+    strided_data = _get_strided_data(windows)
+    if strided_data is None:
+        # Each window is a block
+        return windows, 1, 1
+    data, step = strided_data
+    block_size = math.gcd(windows.shape[1], step)
+    blocks = data.reshape(-1, block_size)
+    return blocks, windows.shape[1] // block_size, step // block_size
+
+
+def _merge_block_sketches(
+    sketches: np.ndarray, blocks_per_window: int, blocks_per_step: int, nb_windows: int
+) -> np.ndarray:
+    """View the block sketches of each window; shape (nb. windows, nb. blocks, ...)."""
+    shape = (nb_windows, blocks_per_window) + sketches.shape[1:]
+    strides = (sketches.strides[0] * blocks_per_step,) + sketches.strides
+    return np.lib.stride_tricks.as_strided(
+        sketches, shape=shape, strides=strides, writeable=False
+    )
+
+
+# -------------------------------- Approximate quantiles -------------------------------
+
+
+def approximate_quantile(
+    windows: np.ndarray, q: Union[float, List[float]], rank_error: float = 0.01
+) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+    """Compute the approximate quantile(s) of each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size).
+    q : Union[float, List[float]]
+        The quantile(s) to compute, must be between 0 and 1.
+    rank_error : float, optional
+        The maximal rank error, relative to the window size, by default 0.01.
+
+    Returns
+    -------
+    Union[np.ndarray, Tuple[np.ndarray, ...]]
+        The approximate quantile of each window, or a tuple with for each quantile the
+        approximate quantile of each window (when multiple quantiles are passed).
+
+    """
+    assert 0 < rank_error < 0.5, "The rank_error must be in the range (0, 0.5)!"
+    blocks, blocks_per_window, blocks_per_step = _get_blocks(windows)
+    block_size = blocks.shape[1]
+    # Each summary point represents `block_size / k` samples of its block; its rank
+    # (within the block) is thus off by at most `block_size / (2 * k)`
+    k = min(block_size, math.ceil(1 / (2 * rank_error)))
+    sorted_blocks = np.sort(blocks, axis=1)
+    if k < block_size:
+        positions = ((np.arange(k) + 0.5) * block_size / k).astype(np.intp)
+        summaries = np.ascontiguousarray(sorted_blocks[:, positions])
+    else:
+        summaries = sorted_blocks
+    merged = _merge_block_sketches(
+        summaries, blocks_per_window, blocks_per_step, len(windows)
+    ).reshape(len(windows), -1)
+    out = np.quantile(merged, q, axis=1)
+    return tuple(out) if np.ndim(q) else out
+
+
+def get_approximate_quantile_features(
+    q: Union[float, List[float]], rank_error: float = 0.01
+) -> FuncWrapper:
+    """Get the vectorized approximate quantile(s) `FuncWrapper`.
+
+    Parameters
+    ----------
+    q : Union[float, List[float]]
+        The quantile(s) to compute, must be between 0 and 1. The output names are
+        `approx_quantile_<q>`.
+    rank_error : float, optional
+        The maximal rank error, relative to the window size, by default 0.01.
+
+    """
+    output_names = [f"approx_quantile_{q_}" for q_ in np.atleast_1d(q)]
+    return FuncWrapper(
+        approximate_quantile,
+        output_names=output_names,
+        vectorized=True,
+        q=q,
+        rank_error=rank_error,
+    )
+
+
+# ------------------------------ Approximate distinct count ----------------------------
+
+# The maximal size (in bytes) of the HyperLogLog registers that are computed at once
+_MAX_HLL_REGISTERS_SIZE = 2**27
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Hash the uint64 values with the splitmix64 finalizer."""
+    with np.errstate(over="ignore"):
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Return the number of bits that are required to represent the uint64 values."""
+    # The exponent of frexp is the bit length; the values are split in two 32-bit
+    # halves as these can be represented exactly as float64
+    high = np.frexp((x >> np.uint64(32)).astype(np.float64))[1]
+    low = np.frexp((x & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+    return np.where(high > 0, high + 32, low).astype(np.uint8)
+
+
+def _hll_registers(blocks: np.ndarray, precision: int) -> np.ndarray:
+    """Compute the HyperLogLog registers of each block; shape (nb. blocks, 2**p)."""
+    values = blocks.astype(np.float64) + 0.0  # + 0.0 converts -0.0 to 0.0
+    hashes = _splitmix64(values.view(np.uint64))
+    register_idxs = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    remainder = hashes & np.uint64((1 << (64 - precision)) - 1)
+    ranks = (64 - precision) - _bit_length(remainder) + 1
+    ranks[np.isnan(values)] = 0  # NaNs are not counted
+
+    registers = np.zeros((len(blocks), 2**precision), dtype=np.uint8)
+    block_idxs = np.repeat(np.arange(len(blocks)), blocks.shape[1])
+    np.maximum.at(registers, (block_idxs, register_idxs.ravel()), ranks.ravel())
+    return registers
+
+
+def _hll_estimate(registers: np.ndarray) -> np.ndarray:
+    """Estimate the cardinality from the HyperLogLog registers (along last axis)."""
+    m = registers.shape[-1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m**2 / np.sum(np.exp2(-registers.astype(np.float64)), axis=-1)
+    nb_zeros = np.sum(registers == 0, axis=-1)
+    # Small range correction (i.e., linear counting)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / nb_zeros)
+    return np.where((raw <= 2.5 * m) & (nb_zeros > 0), linear, raw)
+
+
+def approximate_distinct_count(
+    windows: np.ndarray, relative_error: float = 0.02
+) -> np.ndarray:
+    """Estimate the number of distinct (non-NaN) values of each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        The segmented windows, with shape (nb. windows, window size).
+    relative_error : float, optional
+        The relative standard error of the HyperLogLog estimate, by default 0.02.
+        This determines the number of registers (i.e., ``(1.04 / error)**2``).
+
+    Returns
+    -------
+    np.ndarray
+        The estimated number of distinct values of each window.
+
+    """
+    precision = int(np.clip(math.ceil(2 * math.log2(1.04 / relative_error)), 4, 16))
+    blocks, blocks_per_window, blocks_per_step = _get_blocks(windows)
+    if len(blocks) * 2**precision <= _MAX_HLL_REGISTERS_SIZE:
+        registers = _hll_registers(blocks, precision)
+        merged = _merge_block_sketches(
+            registers, blocks_per_window, blocks_per_step, len(windows)
+        ).max(axis=1)
+        return _hll_estimate(merged)
+
+    # The registers of the (many small) blocks do not fit in memory -> sketch each
+    # window directly, in chunks of windows that fit in memory
+    chunk_size = _MAX_HLL_REGISTERS_SIZE // max(2**precision, 8 * windows.shape[1])
+    chunk_size = max(1, chunk_size)
+    return np.concatenate(
+        [
+            _hll_estimate(_hll_registers(windows[i : i + chunk_size], precision))
+            for i in range(0, len(windows), chunk_size)
+        ]
+    )
+
+
+def get_approximate_distinct_count_feature(
+    relative_error: float = 0.02,
+) -> FuncWrapper:
+    """Get the vectorized approximate distinct count `FuncWrapper`.
+
+    Parameters
+    ----------
+    relative_error : float, optional
+        The relative standard error of the estimate, by default 0.02.
+
+    """
+    return FuncWrapper(
+        approximate_distinct_count,
+        output_names="approx_nunique",
+        vectorized=True,
+        relative_error=relative_error,
+    )
@@ -0,0 +1,139 @@
+"""Vectorized spectral features, computed on a shared (batched) power spectrum.
+
+All the feature functions in this module operate along the last axis of the power
+spectral density (PSD), which is computed once per segmentation by the
+`tsflex.features.intermediate.power_spectrum` intermediate.
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import get_spectral_features
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=get_spectral_features(fs=4, bands=[(0, 0.5), (0.5, 2)]),
+        series_names="EDA", windows="5min", strides="2.5min",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+from ..intermediate import power_spectrum
+
+
+def _get_frequencies(nb_freqs: int, fs: float) -> np.ndarray:
+    # The power spectrum has an even FFT length, see `power_spectrum`
+    return np.linspace(0, fs / 2, nb_freqs)
+
+
+def spectral_centroid(psd: np.ndarray, fs: float = 1.0) -> np.ndarray:
+    """Power-weighted mean frequency of the spectrum."""
+    freqs = _get_frequencies(psd.shape[-1], fs)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sum(psd * freqs, axis=-1) / np.sum(psd, axis=-1)
+
+
+def spectral_entropy(psd: np.ndarray, normalize: bool = False) -> np.ndarray:
+    """Shannon entropy (in bits) of the normalized spectrum.
+
+    If `normalize` is True, the entropy is divided by its maximum (i.e., log2 of the
+    number of frequencies), resulting in a value between 0 and 1.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = psd / np.sum(psd, axis=-1, keepdims=True)
+        p_log_p = np.where(p > 0, p * np.log2(np.where(p > 0, p, 1)), 0)
+    entropy = -np.sum(p_log_p, axis=-1)
+    # Windows without power have an undefined entropy
+    entropy = np.where(np.isnan(p).any(axis=-1), np.nan, entropy)
+    if normalize:
+        entropy = entropy / np.log2(psd.shape[-1])
+    return entropy
+
+
+def spectral_edge(psd: np.ndarray, fs: float = 1.0, q: float = 0.9) -> np.ndarray:
+    """Frequency below which the fraction `q` of the total power is contained."""
+    freqs = _get_frequencies(psd.shape[-1], fs)
+    cum_power = np.cumsum(psd, axis=-1)
+    edge = freqs[np.argmax(cum_power >= q * cum_power[..., -1:], axis=-1)]
+    return np.where(cum_power[..., -1] > 0, edge, np.nan)
+
+
+def band_power(
+    psd: np.ndarray, bands: List[Tuple[float, float]], fs: float = 1.0
+) -> Tuple[np.ndarray, ...]:
+    """Power in each (half-open) frequency band [low, high)."""
+    freqs = _get_frequencies(psd.shape[-1], fs)
+    df = freqs[1] - freqs[0] if len(freqs) > 1 else fs / 2
+    return tuple(
+        np.sum(psd[..., (freqs >= low) & (freqs < high)], axis=-1) * df
+        for low, high in bands
+    )
+
+
+def get_spectral_features(
+    fs: float = 1.0,
+    nperseg: Optional[int] = None,
+    noverlap: Optional[int] = None,
+    window: Union[str, np.ndarray] = "hann",
+    bands: Optional[List[Tuple[float, float]]] = None,
+    edge_q: float = 0.9,
+) -> List[FuncWrapper]:
+    """Get the vectorized spectral features (on a shared power spectrum).
+
+    Parameters
+    ----------
+    fs : float, optional
+        The sampling frequency of the data, by default 1.0.
+    nperseg : int, optional
+        The length of each (Welch) segment of the power spectrum, by default None.
+        See `tsflex.features.intermediate.power_spectrum` for more info.
+    noverlap : int, optional
+        The overlap of the (Welch) segments of the power spectrum, by default None.
+    window : Union[str, np.ndarray], optional
+        The spectral window of the power spectrum, by default "hann".
+    bands : List[Tuple[float, float]], optional
+        The (half-open) frequency bands [low, high) for which the band power is
+        computed, by default None. If None, no band powers are computed.
+    edge_q : float, optional
+        The fraction of the total power for the spectral edge frequency, by default
+        0.9.
+
+    Returns
+    -------
+    List[FuncWrapper]
+        The vectorized spectral feature functions. These require that the data is
+        regularly sampled (as the power spectrum is computed on the strided windows).
+
+    """
+    psd = power_spectrum(fs=fs, nperseg=nperseg, noverlap=noverlap, window=window)
+    funcs = [
+        FuncWrapper(spectral_centroid, vectorized=True, intermediate=psd, fs=fs),
+        FuncWrapper(spectral_entropy, vectorized=True, intermediate=psd),
+        FuncWrapper(
+            spectral_edge,
+            output_names=f"spectral_edge_{edge_q}",
+            vectorized=True,
+            intermediate=psd,
+            fs=fs,
+            q=edge_q,
+        ),
+    ]
+    if bands:
+        funcs.append(
+            FuncWrapper(
+                band_power,
+                output_names=[f"band_power_{low}-{high}" for low, high in bands],
+                vectorized=True,
+                intermediate=psd,
+                bands=bands,
+                fs=fs,
+            )
+        )
+    return funcs
@@ -0,0 +1,102 @@
+"""Vectorized statistical feature functions (moments & extremes).
+
+All the feature functions in this module operate along the last axis of the
+(strided view of the) segmented windows, i.e., on arrays with shape
+(nb. windows, window size). NaNs are propagated (as in numpy).
+
+.. Tip::
+    The quantiles & median are provided by the `order_statistics` module and the
+    decomposable (i.e., mergeable over windows & strides) statistics by the
+    `decomposable` module.
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import get_statistical_features
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=get_statistical_features(["mean", "std", "skewness", "kurtosis"]),
+        series_names="EDA", windows="5min", strides="30s",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+from typing import List, Optional
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+
+
+def _central_moment(windows: np.ndarray, moment: int) -> np.ndarray:
+    deviations = windows - np.mean(windows, axis=-1, keepdims=True)
+    return np.mean(deviations**moment, axis=-1)
+
+
+def skewness(windows: np.ndarray) -> np.ndarray:
+    """Compute the (biased) sample skewness of each window (as `scipy.stats.skew`)."""
+    m2 = _central_moment(windows, 2)
+    m3 = _central_moment(windows, 3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(m2 > 0, m3 / m2**1.5, np.nan)
+
+
+def kurtosis(windows: np.ndarray) -> np.ndarray:
+    """Compute the (biased) excess kurtosis of each window (as `scipy.stats.kurtosis`)."""
+    m2 = _central_moment(windows, 2)
+    m4 = _central_moment(windows, 4)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(m2 > 0, m4 / m2**2 - 3, np.nan)
+
+
+def value_range(windows: np.ndarray) -> np.ndarray:
+    """Compute the range (i.e., max - min) of each window."""
+    return np.ptp(windows, axis=-1)
+
+
+def rms(windows: np.ndarray) -> np.ndarray:
+    """Compute the root mean square of each window."""
+    return np.sqrt(np.mean(np.square(windows, dtype=np.float64), axis=-1))
+
+
+_STATISTICAL_FUNCS = {
+    "mean": FuncWrapper(np.mean, "mean", vectorized=True, axis=-1),
+    "std": FuncWrapper(np.std, "std", vectorized=True, axis=-1),
+    "var": FuncWrapper(np.var, "var", vectorized=True, axis=-1),
+    "min": FuncWrapper(np.min, "min", vectorized=True, axis=-1),
+    "max": FuncWrapper(np.max, "max", vectorized=True, axis=-1),
+    "range": FuncWrapper(value_range, "range", vectorized=True),
+    "rms": FuncWrapper(rms, "rms", vectorized=True),
+    "skewness": FuncWrapper(skewness, "skewness", vectorized=True),
+    "kurtosis": FuncWrapper(kurtosis, "kurtosis", vectorized=True),
+}
+
+
+def get_statistical_features(
+    statistics: Optional[List[str]] = None,
+) -> List[FuncWrapper]:
+    """Get the vectorized statistical `FuncWrapper`s.
+
+    Parameters
+    ----------
+    statistics : List[str], optional
+        The statistics to compute, by default None. Must be a subset of
+        `["mean", "std", "var", "min", "max", "range", "rms", "skewness", "kurtosis"]`.
+        If None, all statistics are computed. The (central) moments are the biased
+        estimators (i.e., as `np.std` and `scipy.stats.skew`).
+
+    Returns
+    -------
+    List[FuncWrapper]
+        The vectorized functions; the output name equals the name of the statistic.
+
+    """
+    statistics = list(_STATISTICAL_FUNCS) if statistics is None else statistics
+    assert all(
+        s in _STATISTICAL_FUNCS for s in statistics
+    ), f"The statistics must be a subset of {list(_STATISTICAL_FUNCS)}!"
+    return [_STATISTICAL_FUNCS[s] for s in statistics]
@@ -0,0 +1,128 @@
+"""Vectorized temporal feature functions.
+
+All the feature functions in this module operate along the last axis of the
+(strided view of the) segmented windows, i.e., on arrays with shape
+(nb. windows, window size). The temporal features are computed in terms of samples;
+i.e., the (regular) sampling of the data is assumed.
+
+```python
+from tsflex.features import FeatureCollection, MultipleFeatureDescriptors
+from tsflex.features.library import get_temporal_features
+
+fc = FeatureCollection(
+    MultipleFeatureDescriptors(
+        functions=get_temporal_features(lags=[1, 4, 16], fs=4),
+        series_names="EDA", windows="5min", strides="30s",
+    )
+)
+```
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from ..function_wrapper import FuncWrapper
+
+
+def _crossing_rate(windows: np.ndarray) -> np.ndarray:
+    signs = np.sign(windows)
+    nb_crossings = np.count_nonzero(signs[..., 1:] * signs[..., :-1] < 0, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return nb_crossings / (windows.shape[-1] - 1)
+
+
+def zero_crossing_rate(windows: np.ndarray) -> np.ndarray:
+    """Fraction of consecutive samples with strictly opposite signs."""
+    return _crossing_rate(windows)
+
+
+def mean_crossing_rate(windows: np.ndarray) -> np.ndarray:
+    """Fraction of consecutive samples that cross the mean of the window."""
+    return _crossing_rate(windows - np.mean(windows, axis=-1, keepdims=True))
+
+
+def slope(windows: np.ndarray, fs: float = 1.0) -> np.ndarray:
+    """Slope of the least squares linear fit of each window.
+
+    The slope is expressed per unit of time (i.e., per sample multiplied with the
+    sampling frequency `fs`).
+    """
+    n = windows.shape[-1]
+    t = np.arange(n) - (n - 1) / 2  # centered sample indices
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return windows @ t / np.sum(t**2) * fs
+
+
+def autocorrelation(
+    windows: np.ndarray, lags: Union[int, List[int]] = 1
+) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+    """Autocorrelation of each window at the given lag(s).
+
+    The autocorrelation at lag `l` is computed as
+    ``sum((x[t] - mean) * (x[t + l] - mean)) / ((n - l) * var)``.
+
+    Returns
+    -------
+    Union[np.ndarray, Tuple[np.ndarray, ...]]
+        The autocorrelation of each window, or a tuple with for each lag the
+        autocorrelation of each window (when multiple lags are passed).
+
+    """
+    deviations = windows - np.mean(windows, axis=-1, keepdims=True)
+    var = np.mean(deviations**2, axis=-1)
+    n = windows.shape[-1]
+    out = []
+    for lag in np.atleast_1d(lags):
+        assert 0 < lag < n, "The lags must be in the range [1, window size)!"
+        products = np.einsum(
+            "...i,...i->...", deviations[..., : n - lag], deviations[..., lag:]
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out.append(np.where(var > 0, products / ((n - lag) * var), np.nan))
+    return tuple(out) if np.ndim(lags) else out[0]
+
+
+def peak_count(windows: np.ndarray) -> np.ndarray:
+    """Number of (strict) local maxima, i.e., samples larger than both neighbours."""
+    center = windows[..., 1:-1]
+    is_peak = (center > windows[..., :-2]) & (center > windows[..., 2:])
+    return np.count_nonzero(is_peak, axis=-1)
+
+
+def get_temporal_features(
+    lags: Union[int, List[int]] = 1, fs: float = 1.0
+) -> List[FuncWrapper]:
+    """Get the vectorized temporal `FuncWrapper`s.
+
+    Parameters
+    ----------
+    lags : Union[int, List[int]], optional
+        The lag(s) (in number of samples) of the autocorrelation, by default 1. The
+        output names are `autocorrelation_lag_<lag>`.
+    fs : float, optional
+        The sampling frequency of the data, by default 1.0. This is used to express
+        the slope per unit of time.
+
+    Returns
+    -------
+    List[FuncWrapper]
+        The vectorized functions, with output names `["zero_crossing_rate",
+        "mean_crossing_rate", "slope", "autocorrelation_lag_<lag>", "peak_count"]`.
+
+    """
+    return [
+        FuncWrapper(zero_crossing_rate, vectorized=True),
+        FuncWrapper(mean_crossing_rate, vectorized=True),
+        FuncWrapper(slope, vectorized=True, fs=fs),
+        FuncWrapper(
+            autocorrelation,
+            output_names=[f"autocorrelation_lag_{lag}" for lag in np.atleast_1d(lags)],
+            vectorized=True,
+            lags=lags,
+        ),
+        FuncWrapper(peak_count, vectorized=True),
+    ]
@@ -1,8 +1,12 @@
 """Contains the used variables and functions to provide logging functionality.
 
+The execution info can be retrieved from either a logging file or a
+`MetricsCollector` (which avoids writing & parsing a logging file).
+
 See Also
 --------
-FeatureCollection: its `logging_file_path` of the `calculate` method.
+FeatureCollection: its `logging_file_path` & `metrics_collector` of the `calculate`
+method.
 
 """
 
@@ -10,11 +14,14 @@ __author__ = "Jeroen Van Der Donckt"
 
 import logging
 import re
+from pathlib import Path
+from typing import Any, List, Union
 
 import numpy as np
 import pandas as pd
 
 from ..utils.logging import logging_file_to_df, remove_inner_brackets
+from ..utils.metrics import FeatureRecord, MetricsCollector
 from ..utils.time import timedelta_to_str
 
 # Package specific logger
@@ -101,14 +108,58 @@ def _parse_logging_execution_to_df(logging_file_path: str) -> pd.DataFrame:
     return df.drop(columns=["name", "log_level", "message"])
 
 
-def get_feature_logs(logging_file_path: str) -> pd.DataFrame:
+def _get_feature_record(
+    function_name: str,
+    series_key: tuple,
+    window: Any,
+    strides: Union[List[Any], None],
+    output_names: List[str],
+    duration: float,
+) -> FeatureRecord:
+    """Create the execution record, formatted as the parsed logged message."""
+    if window is None:
+        window = "manual"
+    elif isinstance(window, pd.Timedelta):
+        window = timedelta_to_str(window)
+    if strides is None:
+        strides = "manual"
+    elif all(isinstance(s, pd.Timedelta) for s in strides):
+        strides = tuple(timedelta_to_str(s) for s in strides)
+    else:
+        strides = tuple(sorted(strides))
+    return FeatureRecord(
+        log_time=pd.Timestamp.now(),
+        function=function_name,
+        series_names=str(tuple(series_key)).replace("'", ""),
+        window=window,
+        stride=strides,
+        output_names=", ".join(output_names),
+        duration=duration,
+    )
+
+
+def _get_execution_df(
+    logging_file_path: Union[str, Path, MetricsCollector]
+) -> pd.DataFrame:
+    """Get the execution info from either a logging file or a `MetricsCollector`."""
+    if not isinstance(logging_file_path, MetricsCollector):
+        return _parse_logging_execution_to_df(logging_file_path)
+    df = logging_file_path.to_df(FeatureRecord)
+    df["duration %"] = (100 * (df["duration"] / df["duration"].sum())).round(2)
+    return df
+
+
+def get_feature_logs(
+    logging_file_path: Union[str, Path, MetricsCollector]
+) -> pd.DataFrame:
     """Get execution (time) info for each feature of a `FeatureCollection`.
 
     Parameters
     ----------
-    logging_file_path: str
-        The file path where the logged messages are stored. This is the file path that
-        is passed to the `FeatureCollection` its `calculate` method.
+    logging_file_path: Union[str, Path, MetricsCollector]
+        The file path where the logged messages are stored (i.e., the file path that
+        is passed to the `FeatureCollection` its `calculate` method), or the
+        `MetricsCollector` that is passed to this method.
 
     Returns
     -------
@@ -117,19 +168,22 @@ def get_feature_logs(logging_file_path: str) -> pd.DataFrame:
         (%) calculation duration.
 
     """
-    df = _parse_logging_execution_to_df(logging_file_path)
+    df = _get_execution_df(logging_file_path)
     df["duration"] = pd.to_timedelta(df["duration"], unit="s")
     return df
 
 
-def get_function_stats(logging_file_path: str) -> pd.DataFrame:
+def get_function_stats(
+    logging_file_path: Union[str, Path, MetricsCollector]
+) -> pd.DataFrame:
     """Get execution (time) statistics for each function.
 
     Parameters
     ----------
-    logging_file_path: str
-        The file path where the logged messages are stored. This is the file path that
-        is passed to the `FeatureCollection` its `calculate` method.
+    logging_file_path: Union[str, Path, MetricsCollector]
+        The file path where the logged messages are stored (i.e., the file path that
+        is passed to the `FeatureCollection` its `calculate` method), or the
+        `MetricsCollector` that is passed to this method.
 
     Returns
     -------
@@ -139,7 +193,7 @@ def get_function_stats(logging_file_path: str) -> pd.DataFrame:
         mean (% time),and number of executions.
 
     """
-    df = _parse_logging_execution_to_df(logging_file_path)
+    df = _get_execution_df(logging_file_path)
     # Get the sorted functions in a list to use as key for sorting the groups
     sorted_funcs = (
         df.groupby(["function"])
@@ -165,14 +219,17 @@ def get_function_stats(logging_file_path: str) -> pd.DataFrame:
     )
 
 
-def get_series_names_stats(logging_file_path: str) -> pd.DataFrame:
+def get_series_names_stats(
+    logging_file_path: Union[str, Path, MetricsCollector]
+) -> pd.DataFrame:
     """Get execution (time) statistics for each `key-(window,stride)` combination.
 
     Parameters
     ----------
-    logging_file_path: str
-        The file path where the logged messages are stored. This is the file path that
-        is passed to the `FeatureCollection` its `calculate` method.
+    logging_file_path: Union[str, Path, MetricsCollector]
+        The file path where the logged messages are stored (i.e., the file path that
+        is passed to the `FeatureCollection` its `calculate` method), or the
+        `MetricsCollector` that is passed to this method.
 
     Returns
     -------
@@ -181,7 +238,7 @@ def get_series_names_stats(logging_file_path: str) -> pd.DataFrame:
         sum (% time), mean (% time), and number of executions.
 
     """
-    df = _parse_logging_execution_to_df(logging_file_path)
+    df = _get_execution_df(logging_file_path)
     return (
         df.groupby(["series_names", "window", "stride"])
         .agg(
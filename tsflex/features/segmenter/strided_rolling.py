@@ -15,9 +15,11 @@ __author__ = "Jonas Van Der Donckt, Jeroen Van Der Donckt"
 
 import time
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from typing import List, Optional, Tuple, TypeVar, Union
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
@@ -26,6 +28,14 @@ from ...utils.attribute_parsing import AttributeParser, DataType
 from ...utils.data import SUPPORTED_STROLL_TYPES, to_list, to_series_list, to_tuple
 from ...utils.time import timedelta_to_str
 from ..function_wrapper import FuncWrapper, _get_name
+from ..intermediate import (
+    _NAN_COUNT,
+    Intermediate,
+    SeriesIntermediate,
+    _array_digest,
+    _cache_scoped,
+    _get_intermediate_cache,
+)
 from ..logger import logger
 from ..utils import _check_start_end_array, _determine_bounds
 
@@ -110,6 +120,10 @@ class StridedRolling(ABC):
         Bool indicating whether the user acknowledges that there may be sparsity (i.e.,
         irregularly sampled data), by default False.
         If False and sparsity is observed, a warning is raised.
+    float_dtype: Union[np.dtype, type, str], optional
+        The dtype of the floating point function outputs, by default None. If None,
+        the dtype is inferred from the function its output. Integer and boolean outputs,
+        and the outputs of functions with an `output_dtype`, are not affected.
 
     Notes
     -----
@@ -125,8 +139,31 @@ class StridedRolling(ABC):
     )
 
     # Create the named tuple
+    # Note: `window_stride_samples` is the (window, stride) in number of samples when
+    # the segmented windows are known to be regular (else None), see
+    # `_get_regular_window_stride`, and `sampling_rate` is the sampling rate of the
+    # series its index (see `_get_sampling_rate`)
     _NumpySeriesContainer = namedtuple(
-        "SeriesContainer", ["name", "values", "start_indexes", "end_indexes"]
+        "SeriesContainer",
+        [
+            "name",
+            "values",
+            "start_indexes",
+            "end_indexes",
+            "window_stride_samples",
+            "sampling_rate",
+        ],
+        defaults=[None, None],
+    )
+    # Instrumentation of the (latest) `apply_func` call; the per-window overhead can be
+    # tracked (e.g., in benchmarks) as `elapsed / nb_windows` for a no-op function.
+    # `func_elapsed` is the time spent in applying the function (i.e., excluding the
+    # output assembly) and `window_latencies` holds the duration of each sequential
+    # function call (only when `record_window_latencies` is True, else None)
+    _ApplyFuncStats = namedtuple(
+        "ApplyFuncStats",
+        ["nb_windows", "nb_func_calls", "elapsed", "func_elapsed", "window_latencies"],
+        defaults=[None, None],
     )
 
     def __init__(
@@ -142,6 +179,7 @@ class StridedRolling(ABC):
         window_idx: Optional[str] = "end",
         include_final_window: bool = False,
         approve_sparsity: Optional[bool] = False,
+        float_dtype: Optional[Union[np.dtype, type, str]] = None,
     ):
         if strides is not None:
             strides = to_list(strides)
@@ -162,6 +200,11 @@ class StridedRolling(ABC):
         self.include_final_window = include_final_window
         self.approve_sparsity = approve_sparsity
 
+        self.float_dtype = None if float_dtype is None else np.dtype(float_dtype)
+        assert (
+            self.float_dtype is None or self.float_dtype.kind == "f"
+        ), "The float_dtype must be a floating point dtype!"
+
         assert func_data_type in SUPPORTED_STROLL_TYPES
         self.data_type = func_data_type
 
@@ -223,6 +266,10 @@ class StridedRolling(ABC):
             series_list, np_start_times, np_end_times
         )
 
+        # Instrumentation of the apply_func calls (see `_ApplyFuncStats`)
+        self.apply_func_stats: Optional[StridedRolling._ApplyFuncStats] = None
+        self.record_window_latencies: bool = False
+
         # 5. Check the sparsity assumption
         if not self.approve_sparsity and len(self.index):
             for container in self.series_containers:
@@ -268,6 +315,36 @@ class StridedRolling(ABC):
         # note - np.unique also sorts the array
         return np.unique(np.concatenate(start_idxs))
 
+    def get_stride_mask(self, strides: List[T]) -> np.ndarray:
+        """Get the mask of the segmented windows that belong to the given strides.
+
+        This allows to derive the output of a segmentation with (a subset of) other
+        strides from the output of this segmentation; i.e., the segmented windows of
+        the given strides should be a subset of the windows of this segmentation.
+
+        Parameters
+        ----------
+        strides : List[T]
+            The strides for which the mask is computed.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array with for each segmented window (i.e., each row of the
+            `apply_func` output) whether it is a window of the given strides.
+
+        """
+        assert self.strides is not None, "No strides are used for this segmentation!"
+        start_idxs = self._construct_start_idxs()
+        stride_start_idxs = np.concatenate(
+            [self._get_np_start_idx_for_stride(stride) for stride in to_list(strides)]
+        )
+        mask = np.isin(start_idxs, stride_start_idxs)
+        assert mask.sum() == len(
+            np.unique(stride_start_idxs)
+        ), "The windows of the strides are not a subset of this segmentation!"
+        return mask
+
     def _get_output_index(
         self, start_idxs: np.ndarray, end_idxs: Union[np.ndarray, None], name: str
     ) -> pd.Index:
@@ -294,11 +371,36 @@ class StridedRolling(ABC):
         for series in series_list:
             if not self.reset_series_index_b4_segmenting:
                 np_idx_times = series.index.values
+                sampling_period = _get_sampling_period(series.index)
             else:
                 np_idx_times = np.arange(len(series))
                 # note: using pd.RangeIndex instead of arange gives the same performance
+                sampling_period = 1
+
+            # the slicing will be performed on [ t_start, t_end [
+            # np_idx_times, np_start_times, & np_end_times are all sorted!
+            # as we assume & check that the time index is monotonically
+            # increasing & the latter 2 are created using `np.arange()`
+            if (
+                sampling_period is not None
+                and len(np_idx_times)
+                and _is_exact_index_dtype(np_start_times.dtype)
+                and _is_exact_index_dtype(np_end_times.dtype)
+            ):
+                # Regularly sampled data -> compute the indexes in closed form
+                first_idx_time = _to_int64(np_idx_times[:1])[0]
+                start_indexes = _searchsorted_regular(
+                    first_idx_time, sampling_period, len(np_idx_times), np_start_times
+                )
+                end_indexes = _searchsorted_regular(
+                    first_idx_time, sampling_period, len(np_idx_times), np_end_times
+                )
+            else:
+                start_indexes = np.searchsorted(np_idx_times, np_start_times, "left")
+                end_indexes = np.searchsorted(np_idx_times, np_end_times, "left")
 
             series_name = series.name
+            sampling_rate = _get_sampling_rate(series.index)
             if self.data_type is np.array:
                 # create a non-writeable view of the series
                 series = series.values
@@ -313,17 +415,383 @@ class StridedRolling(ABC):
                 StridedRolling._NumpySeriesContainer(
                     name=series_name,
                     values=series,
-                    # the slicing will be performed on [ t_start, t_end [
-                    # TODO: this can maybe be optimized -> further look into this
-                    # np_idx_times, np_start_times, & np_end_times are all sorted!
-                    # as we assume & check that the time index is monotonically
-                    # increasing & the latter 2 are created using `np.arange()`
-                    start_indexes=np.searchsorted(np_idx_times, np_start_times, "left"),
-                    end_indexes=np.searchsorted(np_idx_times, np_end_times, "left"),
+                    start_indexes=start_indexes,
+                    end_indexes=end_indexes,
+                    window_stride_samples=self._get_regular_window_stride(
+                        sampling_period, start_indexes, end_indexes
+                    ),
+                    sampling_rate=sampling_rate,
                 )
             )
         return series_containers
 
+    def _get_regular_window_stride(
+        self,
+        sampling_period: Optional[int],
+        start_indexes: np.ndarray,
+        end_indexes: np.ndarray,
+    ) -> Optional[Tuple[int, int]]:
+        """Return the (window, stride) in number of samples for regular segmentations.
+
+        A segmentation is regular when the data is regularly sampled, a single stride
+        is used, and both the window and stride are a multiple of the sampling period
+        (and all windows are complete). In that case each segmented window has the same
+        number of samples and consecutive windows are shifted by the same number of
+        samples, without the need for checking all the start and end indexes.
+
+        Returns None if the segmentation is not known to be regular.
+        """
+        if (
+            sampling_period is None
+            or self.window is None
+            or self.strides is None
+            or len(self.strides) != 1
+        ):
+            return None
+        window = _to_exact_int(self._get_np_value(self.window))
+        stride = _to_exact_int(self._get_np_value(self.strides[0]))
+        if (
+            window is None
+            or stride is None
+            or window % sampling_period
+            or stride % sampling_period
+        ):
+            return None
+        window, stride = window // sampling_period, stride // sampling_period
+        if len(start_indexes) and (
+            end_indexes[0] - start_indexes[0] != window
+            or end_indexes[-1] - start_indexes[-1] != window
+        ):
+            # The first or last window is incomplete (i.e., outside the data range);
+            # note that incomplete windows can only occur at the edges.
+            return None
+        return window, stride
+
+    def _get_stacked_values_container(self) -> StridedRolling._NumpySeriesContainer:
+        """Stack the values of the series containers into a single container.
+
+        The values of the returned container have shape (nb. samples, nb. series).
+        When the series values reside in the same memory block (e.g., columns of the
+        same DataFrame), the stacked values are a view and thus no copy is made.
+        """
+        sc_0 = self.series_containers[0]
+        for sc in self.series_containers[1:]:
+            assert (
+                len(sc.values) == len(sc_0.values)
+                and np.array_equal(sc.start_indexes, sc_0.start_indexes)
+                and np.array_equal(sc.end_indexes, sc_0.end_indexes)
+            ), "Stacked series require all series to share the same index!"
+        assert all(
+            isinstance(sc.values, np.ndarray) for sc in self.series_containers
+        ), "Stacked series require np.array values!"
+        return StridedRolling._NumpySeriesContainer(
+            name="|".join(self.series_key),
+            values=_stack_1d_arrays([sc.values for sc in self.series_containers]),
+            start_indexes=sc_0.start_indexes,
+            end_indexes=sc_0.end_indexes,
+            window_stride_samples=sc_0.window_stride_samples,
+            sampling_rate=sc_0.sampling_rate,
+        )
+
+    def _get_vectorized_view(
+        self, sc: StridedRolling._NumpySeriesContainer
+    ) -> np.ndarray:
+        """Create a (strided) view of the segmented windows of the series container.
+
+        The returned view has shape (nb. segmented windows, window size, ...), where
+        ``...`` are the remaining dimensions of the container its values.
+        """
+        if len(sc.start_indexes) == 1:
+            # There is only 1 feature window (bc no steps in the sliding window)
+            return np.expand_dims(
+                sc.values[sc.start_indexes[0] : sc.end_indexes[0]], axis=0
+            )
+        # There are >1 feature windows (bc >=1 steps in the sliding window)
+        if sc.window_stride_samples is not None:
+            # Regular segmentation -> no need to check the windows & strides
+            window, stride = sc.window_stride_samples
+        else:
+            windows = sc.end_indexes - sc.start_indexes
+            strides = sc.start_indexes[1:] - sc.start_indexes[:-1]
+            assert np.all(windows == windows[0]), (
+                "Vectorized functions require same number of samples in each "
+                + "segmented window!"
+            )
+            assert np.all(
+                strides == strides[0]
+            ), "Vectorized functions require same number of samples as stride!"
+            window, stride = windows[0], strides[0]
+        return _sliding_strided_window(
+            sc.values[sc.start_indexes[0] :], window, stride, len(self.index)
+        )
+
+    @staticmethod
+    def _is_regular_segmentation(sc: StridedRolling._NumpySeriesContainer) -> bool:
+        """Check whether all segmented windows have the same size and stride."""
+        if len(sc.start_indexes) <= 1 or sc.window_stride_samples is not None:
+            return True
+        windows = sc.end_indexes - sc.start_indexes
+        strides = sc.start_indexes[1:] - sc.start_indexes[:-1]
+        return bool(np.all(windows == windows[0]) and np.all(strides == strides[0]))
+
+    def _get_auto_vectorized_views(
+        self,
+        func: FuncWrapper,
+        values_containers: List[StridedRolling._NumpySeriesContainer],
+    ) -> Optional[List[np.ndarray]]:
+        """Return the vectorized views if `func` (vectorized="auto") can use them.
+
+        The function is probed once (on its first call with at least 2 segmented
+        windows) and this decision is cached on the `FuncWrapper`. Returns None when
+        the segmentation is not regular or when `func` is not vectorizable, in which
+        case `func` should be applied sequentially.
+        """
+        if (
+            func._vectorizable is False
+            or not len(self.index)
+            or not all(self._is_regular_segmentation(sc) for sc in values_containers)
+        ):
+            return None
+        views = [self._get_vectorized_view(sc) for sc in values_containers]
+        if func._vectorizable is None:
+            if len(self.index) < 2:
+                # Too few windows to verify the vectorized output
+                return None
+            func._vectorizable = _probe_vectorization(func, views)
+        return views if func._vectorizable else None
+
+    def _get_intermediate(
+        self, intermediate: Intermediate, sc: StridedRolling._NumpySeriesContainer
+    ) -> Union[np.ndarray, List[Any]]:
+        """Compute the intermediate of each segmented window of the series container.
+
+        When the segmentation is regular, the intermediate is computed at once on the
+        strided view of the segmented windows (resulting in an array with the windows
+        as first axis), else it is computed window per window (resulting in a list).
+        A `SeriesIntermediate` is derived from its precomputation on the series
+        container its values (resulting in an array with the windows as first axis).
+        Within a `FeatureCollection.calculate` call, the result is cached (and thus
+        shared) for the series container its values and segmentation (i.e., its start
+        and end indexes) until the end of the active `_intermediate_scope`; the
+        precomputation of a `SeriesIntermediate` is cached for the series container
+        its values.
+        """
+        cache = _get_intermediate_cache()
+        # The values are identified by their memory layout (the values are kept alive
+        # in the cache, so that their memory can not be reused meanwhile)
+        values = np.asarray(sc.values)
+        values_id = (
+            values.__array_interface__["data"][0],
+            values.shape,
+            values.strides,
+            values.dtype.str,
+        )
+        segmentation_key = (
+            _array_digest(sc.start_indexes),
+            _array_digest(sc.end_indexes),
+        )
+        key = (sc.name, values_id, segmentation_key, intermediate.key)
+        if cache is not None and key in cache:
+            return cache[key][1]
+
+        if isinstance(intermediate, SeriesIntermediate):
+            # The precomputation is shared by all segmentations of the same values
+            values_key = (sc.name, values_id, intermediate.key)
+            if cache is not None and values_key in cache:
+                precomputed = cache[values_key][1]
+            else:
+                precomputed = intermediate.precompute(values)
+                if cache is not None:
+                    # Keep the values alive, so that their memory is not reused
+                    cache[values_key] = (values, precomputed)
+            result = np.asarray(
+                intermediate.from_precomputed(
+                    precomputed, sc.start_indexes, sc.end_indexes
+                )
+            )
+            result.flags.writeable = False
+        elif len(sc.start_indexes) and self._is_regular_segmentation(sc):
+            result = np.asarray(intermediate(self._get_vectorized_view(sc)))
+            # The result might be shared -> make it read-only
+            result.flags.writeable = False
+        else:
+            result = [
+                intermediate(sc.values[start:end])
+                for start, end in zip(sc.start_indexes, sc.end_indexes)
+            ]
+
+        if cache is not None:
+            # Keep the values alive, so that their memory is not reused
+            _cache_scoped(cache, key, (values, result))
+        return result
+
+    def _apply_func_sequential(
+        self,
+        func: FuncWrapper,
+        func_inputs: List[Iterable],
+        window_latencies: Optional[List[float]] = None,
+    ) -> np.ndarray:
+        """Apply the function sequentially (i.e., window per window).
+
+        The `func_inputs` contain for each input series an iterable over the segmented
+        windows (or their intermediates). The segmented windows are sliced lazily and
+        the function is mapped over them (at C-level); the collected outputs are
+        converted at once to an array (see `FuncWrapper._convert_outputs`).
+        When `window_latencies` is passed, the duration of each function call is
+        appended to it.
+        """
+        # Call the wrapped function directly (avoids the wrapper its per-call overhead)
+        func_call = partial(func.func, **func.kwargs) if func.kwargs else func.func
+        if window_latencies is not None:
+            wrapped_func = func_call
+
+            def func_call(*inputs):
+                t_call = time.perf_counter()
+                output = wrapped_func(*inputs)
+                window_latencies.append(time.perf_counter() - t_call)
+                return output
+
+        return func._convert_outputs(list(map(func_call, *func_inputs)))
+
+    def _is_robust_applicable(
+        self,
+        func: FuncWrapper,
+        values_containers: List[StridedRolling._NumpySeriesContainer],
+    ) -> bool:
+        """Check whether the robust `func` (see `make_robust`) can use its fast path."""
+        return (
+            hasattr(func.func, "_robust_settings")
+            and func.input_type is np.array
+            and not func.stack_series
+            and func.intermediate is None
+            and len(self.index) > 0
+            and all(
+                np.asarray(sc.values).dtype.kind in "biuf" for sc in values_containers
+            )
+        )
+
+    def _apply_robust_func(
+        self,
+        func: FuncWrapper,
+        values_containers: List[StridedRolling._NumpySeriesContainer],
+        window_latencies: Optional[List[float]] = None,
+    ) -> Tuple[np.ndarray, int]:
+        """Apply the robust `func` (see `make_robust`) to the segmented windows.
+
+        The number of (non-NaN) samples of each window is derived in O(1) from the
+        prefix NaN counts of the series (which are shared as intermediate). Only the
+        windows that meet the `min_nb_samples` requirement are passed to the wrapped
+        function, the other windows are filled with the `error_val` at once. When the
+        NaNs should be masked out, only the windows that contain NaNs are filtered.<br>
+        A vectorized function is applied at once on the strided view of the valid
+        windows; when these contain NaNs that should be masked out, the NaN-aware
+        variant of the function is used. When there is no such variant, the valid
+        windows are grouped by their number of NaNs; the NaNs of each group are masked
+        out at once (resulting in equally sized windows), after which the function is
+        applied vectorized on each group.
+
+        Returns the output array and the number of function calls.
+        """
+        robust = func.func._robust_settings
+        nb_windows = len(self.index)
+
+        nan_counts = [
+            self._get_intermediate(_NAN_COUNT, sc) for sc in values_containers
+        ]
+        valid = np.ones(nb_windows, dtype=bool)
+        for sc, nan_count in zip(values_containers, nan_counts):
+            nb_samples = sc.end_indexes - sc.start_indexes
+            if not robust.passthrough_nans:
+                nb_samples = nb_samples - nan_count
+            valid &= nb_samples >= robust.min_nb_samples
+        nb_valid = int(np.count_nonzero(valid))
+        all_valid = nb_valid == nb_windows
+        mask_nans = not robust.passthrough_nans and any(
+            np.any(nan_count[valid]) for nan_count in nan_counts
+        )
+
+        vectorized_func = robust.nan_func if mask_nans else robust.func
+        out_valid, nb_func_calls = None, 0
+        if nb_valid and func.vectorized is True and vectorized_func is not None:
+            views = [self._get_vectorized_view(sc) for sc in values_containers]
+            if not all_valid:
+                views = [view[valid] for view in views]
+            out_valid = vectorized_func(*views, **func.kwargs)
+            out_type = type(out_valid)
+            out_valid = np.asarray(out_valid, dtype=func.output_dtype)
+            out_valid = out_valid.T if out_type is tuple else out_valid
+            nb_func_calls = 1
+        elif nb_valid and func.vectorized is True:
+            views = [self._get_vectorized_view(sc) for sc in values_containers]
+            nan_counts = [nan_count[valid] for nan_count in nan_counts]
+            if not all_valid:
+                views = [view[valid] for view in views]
+            # Group the windows with the same number of NaNs (for each series)
+            group_nan_counts, group_idxs = np.unique(
+                np.stack(nan_counts), axis=1, return_inverse=True
+            )
+            group_idxs = group_idxs.ravel()
+            group_rows, group_outs = [], []
+            for group, group_nan_count in enumerate(group_nan_counts.T):
+                rows = np.flatnonzero(group_idxs == group)
+                out = robust.func(
+                    *map(_drop_window_nans, [v[rows] for v in views], group_nan_count),
+                    **func.kwargs,
+                )
+                out_type = type(out)
+                out = np.asarray(out, dtype=func.output_dtype)
+                group_rows.append(rows)
+                group_outs.append(out.T if out_type is tuple else out)
+            out_valid = np.empty(
+                (nb_valid,) + group_outs[0].shape[1:], dtype=np.result_type(*group_outs)
+            )
+            for rows, out in zip(group_rows, group_outs):
+                out_valid[rows] = out
+            nb_func_calls = len(group_outs)
+        elif nb_valid:
+            func_inputs = []
+            for sc, nan_count in zip(values_containers, nan_counts):
+                start_indexes, end_indexes = sc.start_indexes, sc.end_indexes
+                if not all_valid:
+                    start_indexes = start_indexes[valid]
+                    end_indexes = end_indexes[valid]
+                windows = map(
+                    sc.values.__getitem__, map(slice, start_indexes, end_indexes)
+                )
+                if mask_nans:
+                    windows = map(_drop_nans, windows, nan_count[valid] > 0)
+                func_inputs.append(windows)
+            inner_func = FuncWrapper(
+                (
+                    partial(_apply_vectorized_on_window, robust.func)
+                    if func.vectorized
+                    else robust.func
+                ),
+                output_names=func.output_names,
+                output_dtype=func.output_dtype,
+                **func.kwargs,
+            )
+            out_valid = self._apply_func_sequential(
+                inner_func, func_inputs, window_latencies
+            )
+            nb_func_calls = nb_valid
+
+        if all_valid:
+            return out_valid, nb_func_calls
+
+        # Fill the windows that do not meet the requirements with the error value
+        error_val = np.asarray(robust.error_val)
+        shape = (nb_windows,)
+        if len(func.output_names) > 1:
+            shape += (len(func.output_names),)
+        if out_valid is None:
+            out = np.full(shape, error_val, dtype=error_val.dtype)
+        else:
+            dtype = np.result_type(out_valid.dtype, error_val.dtype)
+            out = np.full(shape, error_val, dtype=dtype)
+            out[valid] = out_valid
+        return out, nb_func_calls
+
     def apply_func(self, func: FuncWrapper) -> pd.DataFrame:
         """Apply a function to the segmented series.
 
@@ -355,8 +823,27 @@ class StridedRolling(ABC):
 
         """
         feat_names = func.output_names
+        func = func._bind_sampling_rates(
+            [sc.sampling_rate for sc in self.series_containers]
+        )
 
         t_start = time.perf_counter()
+        window_latencies = [] if self.record_window_latencies else None
+
+        # The (list of) values on which the function will be applied, together with the
+        # series container that holds their start & end indexes
+        if func.stack_series:
+            values_containers = [self._get_stacked_values_container()]
+        else:
+            values_containers = self.series_containers
+
+        # The intermediates (if any) on which the function will be applied
+        intermediates = None
+        if func.intermediate is not None:
+            intermediates = [
+                self._get_intermediate(func.intermediate, sc)
+                for sc in values_containers
+            ]
 
         # --- Future work ---
         # would be nice if we could optimize this double for loop with something
@@ -367,7 +854,20 @@ class StridedRolling(ABC):
         # every time).
         # See more why: https://stackoverflow.com/a/59838723
         out: np.array
-        if func.vectorized:
+        func_kwargs = {}
+        robust = self._is_robust_applicable(func, values_containers)
+        vectorized = func.vectorized is True
+        if func.vectorized == "auto" and not robust:
+            auto_views = self._get_auto_vectorized_views(func, values_containers)
+            if auto_views is not None:
+                vectorized, func_kwargs = True, {"axis": 1}
+        if robust:
+            # Robust function execution (see `make_robust`)
+            out, nb_func_calls = self._apply_robust_func(
+                func, values_containers, window_latencies
+            )
+
+        elif vectorized:
             # Vectorized function execution
 
             ## IMPL 1
@@ -398,67 +898,65 @@ class StridedRolling(ABC):
             #     )
             # )
 
-            views = []
-            for sc in self.series_containers:
-                if len(sc.start_indexes) == 0:
-                    # There are no feature windows  -> return empty array (see below)
-                    views = []
-                    break
-                elif len(sc.start_indexes) == 1:
-                    # There is only 1 feature window (bc no steps in the sliding window)
-                    views.append(
-                        np.expand_dims(
-                            sc.values[sc.start_indexes[0] : sc.end_indexes[0]],
-                            axis=0,
-                        )
-                    )
-                else:
-                    # There are >1 feature windows (bc >=1 steps in the sliding window)
-                    windows = sc.end_indexes - sc.start_indexes
-                    strides = sc.start_indexes[1:] - sc.start_indexes[:-1]
-                    assert np.all(windows == windows[0]), (
-                        "Vectorized functions require same number of samples in each "
-                        + "segmented window!"
-                    )
-                    assert np.all(
-                        strides == strides[0]
-                    ), "Vectorized functions require same number of samples as stride!"
-                    views.append(
-                        _sliding_strided_window_1d(
-                            sc.values[sc.start_indexes[0] :],
-                            windows[0],
-                            strides[0],
-                            len(self.index),
-                        )
-                    )
+            if func_kwargs:
+                # The views are already created when probing the function
+                views = auto_views
+            elif intermediates is not None:
+                views = intermediates if len(self.index) else []
+                assert all(isinstance(v, np.ndarray) for v in views), (
+                    "Vectorized functions require same number of samples in each "
+                    + "segmented window!"
+                )
+            else:
+                views = []
+                for sc in values_containers:
+                    if len(sc.start_indexes) == 0:
+                        # There are no feature windows -> return empty array (see below)
+                        views = []
+                        break
+                    views.append(self._get_vectorized_view(sc))
 
             # Assign empty array as output when there is no view to apply the vectorized
             # function on (this is the case when there is at least for one series no
             # feature windows)
-            out = func(*views) if len(views) >= 1 else np.array([])
+            out = (
+                func.func(*views, **func_kwargs, **func.kwargs)
+                if len(views) >= 1
+                else np.array([])
+            )
 
             out_type = type(out)
-            out = np.asarray(out)
+            out = np.asarray(out, dtype=func.output_dtype)
             # When multiple outputs are returned (= tuple) they should be transposed
             # when combining into an array
             out = out.T if out_type is tuple else out
+            nb_func_calls = 1 if len(self.index) else 0
 
         else:
             # Sequential function execution (default)
-            out = np.array(
-                list(
+            if intermediates is not None:
+                func_inputs = intermediates
+            else:
+                # Lazy iterators over the (read-only) window-views of each series
+                func_inputs = [
                     map(
-                        func,
-                        *[
-                            [
-                                sc.values[sc.start_indexes[idx] : sc.end_indexes[idx]]
-                                for idx in range(len(self.index))
-                            ]
-                            for sc in self.series_containers
-                        ],
+                        sc.values.__getitem__,
+                        map(slice, sc.start_indexes, sc.end_indexes),
                     )
-                )
+                    for sc in values_containers
+                ]
+            out = self._apply_func_sequential(
+                func, func_inputs, window_latencies=window_latencies
             )
+            nb_func_calls = len(self.index)
+        func_elapsed = time.perf_counter() - t_start
+
+        if (
+            self.float_dtype is not None
+            and func.output_dtype is None
+            and out.dtype.kind == "f"
+        ):
+            out = out.astype(self.float_dtype, copy=False)
 
         # Check if the function output is valid.
         # This assertion will be raised when e.g. np.max is applied vectorized without
@@ -473,6 +971,20 @@ class StridedRolling(ABC):
             for f_name in feat_names:
                 # Will be discarded (bc no index)
                 feat_out[self._create_feat_col_name(f_name)] = None
+        elif out.dtype.names is not None:
+            # Structured array -> each output (field) keeps its dtype
+            assert len(feat_names) == len(
+                out.dtype.names
+            ), f"Func {func} returned incorrect number of outputs ({len(out.dtype.names)})!"
+            for f_name, field in zip(feat_names, out.dtype.names):
+                field_out = out[field]
+                if (
+                    self.float_dtype is not None
+                    and func.output_dtype is None
+                    and field_out.dtype.kind == "f"
+                ):
+                    field_out = field_out.astype(self.float_dtype, copy=False)
+                feat_out[self._create_feat_col_name(f_name)] = field_out
         elif out.ndim == 1 or (out.ndim == 2 and out.shape[1] == 1):
             assert len(feat_names) == 1, f"Func {func} returned more than 1 output!"
             feat_out[self._create_feat_col_name(feat_names[0])] = out.flatten()
@@ -487,6 +999,15 @@ class StridedRolling(ABC):
                 ]
 
         elapsed = time.perf_counter() - t_start
+        self.apply_func_stats = StridedRolling._ApplyFuncStats(
+            nb_windows=len(self.index),
+            nb_func_calls=nb_func_calls,
+            elapsed=elapsed,
+            func_elapsed=func_elapsed,
+            window_latencies=None
+            if window_latencies is None
+            else np.asarray(window_latencies),
+        )
         log_strides = (
             "manual" if self.strides is None else tuple(map(str, self.strides))
         )
@@ -531,7 +1052,13 @@ class StridedRolling(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def _create_feat_col_name(self, feat_name: str) -> str:
+    def _create_feat_col_name(
+        self, feat_name: str, series_keys: Optional[Tuple[str, ...]] = None
+    ) -> str:
+        """Create the output column name of the feature.
+
+        If `series_keys` is None, the series keys of this strided rolling are used.
+        """
         raise NotImplementedError
 
 
@@ -557,13 +1084,17 @@ class SequenceStridedRolling(StridedRolling):
             warnings.warn(self.OUTSIDE_DATA_BOUNDS_WARNING, RuntimeWarning)
         return segment_idxs
 
-    def _create_feat_col_name(self, feat_name: str) -> str:
+    def _create_feat_col_name(
+        self, feat_name: str, series_keys: Optional[Tuple[str, ...]] = None
+    ) -> str:
         if self.window is not None:
             win_str = str(self.window)
         else:
             win_str = "manual"
         return self.construct_output_index(
-            series_keys=self.series_key, feat_name=feat_name, win_str=win_str
+            series_keys=self.series_key if series_keys is None else series_keys,
+            feat_name=feat_name,
+            win_str=win_str,
         )
 
 
@@ -614,14 +1145,18 @@ class TimeStridedRolling(StridedRolling):
             warnings.warn(self.OUTSIDE_DATA_BOUNDS_WARNING, RuntimeWarning)
         return segment_idxs
 
-    def _create_feat_col_name(self, feat_name: str) -> str:
+    def _create_feat_col_name(
+        self, feat_name: str, series_keys: Optional[Tuple[str, ...]] = None
+    ) -> str:
         # Convert win to time-string if available :)
         if self.window is not None:
             win_str = timedelta_to_str(self.window)
         else:
             win_str = "manual"
         return self.construct_output_index(
-            series_keys=self.series_key, feat_name=feat_name, win_str=win_str
+            series_keys=self.series_key if series_keys is None else series_keys,
+            feat_name=feat_name,
+            win_str=win_str,
         )
 
 
@@ -697,6 +1232,58 @@ class TimeIndexSampleStridedRolling(SequenceStridedRolling):
         )
 
 
+def _probe_vectorization(
+    func: FuncWrapper, views: List[np.ndarray], nb_windows: int = 3
+) -> bool:
+    """Probe whether `func` can be applied vectorized (with ``axis=1``).
+
+    The function is applied vectorized on the first (at most `nb_windows`) segmented
+    windows of the views and compared to applying it window per window.
+
+    Returns
+    -------
+    bool
+        True if the vectorized output matches the window per window output.
+
+    """
+    sample = [view[:nb_windows] for view in views]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            out_vect = func.func(*sample, axis=1, **func.kwargs)
+            out_type = type(out_vect)
+            out_vect = np.asarray(out_vect)
+            out_vect = out_vect.T if out_type is tuple else out_vect
+            out_seq = np.asarray([func(*windows) for windows in zip(*sample)])
+    except Exception:
+        return False
+    if out_vect.shape != out_seq.shape or object in (out_vect.dtype, out_seq.dtype):
+        return False
+    if out_vect.dtype.kind in "biufc" and out_seq.dtype.kind in "biufc":
+        return bool(np.allclose(out_vect, out_seq, equal_nan=True))
+    return bool(np.array_equal(out_vect, out_seq))
+
+
+def _drop_nans(window: np.ndarray, has_nans: bool) -> np.ndarray:
+    """Mask out the NaNs of the window (only when it contains NaNs)."""
+    return window[~np.isnan(window)] if has_nans else window
+
+
+def _drop_window_nans(windows: np.ndarray, nb_nans: int) -> np.ndarray:
+    """Mask out the NaNs of the windows (which all contain `nb_nans` NaNs)."""
+    if not nb_nans:
+        return windows
+    return windows[~np.isnan(windows)].reshape(len(windows), -1)
+
+
+def _apply_vectorized_on_window(func, *windows: np.ndarray, **kwargs):
+    """Apply the vectorized `func` on a single (1D) window of each series."""
+    output = func(*(window[np.newaxis] for window in windows), **kwargs)
+    if isinstance(output, tuple):
+        return tuple(np.asarray(o)[0] for o in output)
+    return np.asarray(output)[0]
+
+
 def _sliding_strided_window_1d(
     data: np.ndarray, window: int, step: int, nb_segments: int
 ):
@@ -740,3 +1327,184 @@ def _sliding_strided_window_1d(
     return np.lib.stride_tricks.as_strided(
         data, shape=shape, strides=strides  # , writeable=False
     )
+
+
+def _sliding_strided_window(
+    data: np.ndarray, window: int, step: int, nb_segments: int
+) -> np.ndarray:
+    """View based sliding strided-window over the first axis of (n-dimensional) data.
+
+    Parameters
+    ----------
+    data: np.array
+        The data to slide over, the windows are taken along the first axis.
+    window: int
+        The window size, in number of samples.
+    step: int
+        The step size (i.e., the stride), in number of samples.
+    nb_segments: int
+        The number of sliding window steps, this is equal to the number of feature
+        windows.
+
+    Returns
+    -------
+    nd.array
+        A view of the sliding strided window of the data, with shape
+        (nb_segments, window, *data.shape[1:]).
+
+    """
+    if data.ndim == 1:
+        return _sliding_strided_window_1d(data, window, step, nb_segments)
+
+    assert isinstance(window, (int, np.integer)), "window must be an integer"
+    assert isinstance(step, (int, np.integer)), "step must be an integer"
+
+    assert (step >= 1) & (window < len(data))
+
+    shape = [nb_segments, window, *data.shape[1:]]
+    strides = [data.strides[0] * step, *data.strides]
+
+    return np.lib.stride_tricks.as_strided(
+        data, shape=shape, strides=strides, writeable=False
+    )
+
+
+def _get_root_base(arr: np.ndarray) -> np.ndarray:
+    """Return the array that owns the memory of the passed (view of an) array."""
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+def _stack_1d_arrays(arrs: List[np.ndarray]) -> np.ndarray:
+    """Stack the 1-dimensional arrays into a (read-only) 2D array of shape (n, len(arrs)).
+
+    When all arrays are equally strided views of the same memory block, with a
+    constant offset between consecutive arrays (which is the case for columns of the
+    same DataFrame block), a view is returned. Otherwise, the arrays are copied.
+    """
+    arr_0 = arrs[0]
+    if len(arrs) > 1 and all(
+        arr.dtype == arr_0.dtype
+        and arr.shape == arr_0.shape
+        and arr.strides == arr_0.strides
+        and _get_root_base(arr) is _get_root_base(arr_0)
+        for arr in arrs[1:]
+    ):
+        addresses = [arr.__array_interface__["data"][0] for arr in arrs]
+        offset = addresses[1] - addresses[0]
+        if offset != 0 and all(
+            a_next - a_prev == offset
+            for a_prev, a_next in zip(addresses[:-1], addresses[1:])
+        ):
+            return np.lib.stride_tricks.as_strided(
+                arr_0,
+                shape=(len(arr_0), len(arrs)),
+                strides=(arr_0.strides[0], offset),
+                writeable=False,
+            )
+    stacked = np.stack(arrs, axis=-1)
+    stacked.flags.writeable = False
+    return stacked
+
+
+# Cache of the sampling period of (index) objects, the cache entries are removed when
+# the index object is garbage collected. This avoids verifying the regular sampling of
+# the same index for each StridedRolling instance (i.e., for each feature).
+_SAMPLING_PERIOD_CACHE: Dict[int, Tuple[weakref.ref, Optional[int]]] = {}
+
+
+def _get_sampling_period(index: pd.Index) -> Optional[int]:
+    """Return the sampling period of the index if it is regularly sampled (else None).
+
+    The sampling period is returned as an integer, in the units of the int64
+    representation of the index (i.e., nanoseconds for a ``pd.DatetimeIndex``).
+    Only integer and datetime indexes are considered, as the closed form indexing
+    (see `_searchsorted_regular`) requires exact arithmetic.
+
+    Regular sampling is detected by the index its (fixed) `freq` or `step` (for a
+    ``pd.RangeIndex``), or by verifying once that the index has a constant difference.
+    The `freq` is only trusted for a tz-naive index, as the (UTC) steps of a tz-aware
+    index are not constant when it crosses a DST change (e.g., 23h or 25h days).
+    """
+    cached = _SAMPLING_PERIOD_CACHE.get(id(index))
+    if cached is not None and cached[0]() is index:
+        return cached[1]
+
+    sampling_period = None
+    if len(index) < 2 or not _is_exact_index_dtype(index.dtype):
+        pass
+    elif isinstance(index, pd.RangeIndex):
+        sampling_period = index.step
+    elif (
+        isinstance(getattr(index, "freq", None), pd.tseries.offsets.Tick)
+        and getattr(index, "tz", None) is None
+    ):
+        sampling_period = index.freq.nanos
+    else:
+        diffs = np.diff(_to_int64(index.values))
+        if np.all(diffs == diffs[0]):
+            sampling_period = int(diffs[0])
+    if sampling_period is not None and sampling_period <= 0:
+        sampling_period = None
+
+    key = id(index)
+    _SAMPLING_PERIOD_CACHE[key] = (
+        weakref.ref(index, lambda _: _SAMPLING_PERIOD_CACHE.pop(key, None)),
+        sampling_period,
+    )
+    return sampling_period
+
+
+def _get_sampling_rate(index: pd.Index) -> Optional[float]:
+    """Return the sampling rate of the index (in Hz for a time-index).
+
+    This is the inverse of the sampling period for a regularly sampled index, else the
+    average sampling rate over the whole index (None when it has less than 2 samples).
+    """
+    if len(index) < 2:
+        return None
+    sampling_period = _get_sampling_period(index)
+    if sampling_period is None:
+        sampling_period = (index[-1] - index[0]) / (len(index) - 1)
+        if isinstance(sampling_period, pd.Timedelta):
+            sampling_period = sampling_period.value
+    if index.dtype.kind == "M":
+        sampling_period /= 1e9  # nanoseconds -> seconds
+    return 1 / sampling_period if sampling_period > 0 else None
+
+
+def _is_exact_index_dtype(dtype: np.dtype) -> bool:
+    """Return whether the dtype allows exact (int64) index arithmetic."""
+    return dtype.kind in "iM"
+
+
+def _to_int64(arr: np.ndarray) -> np.ndarray:
+    """Return the int64 representation of an integer or datetime64 array."""
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[ns]").view(np.int64)
+    return arr.astype(np.int64, copy=False)
+
+
+def _to_exact_int(value) -> Optional[int]:
+    """Return the integer representation of a window / stride value (if exact)."""
+    if isinstance(value, np.timedelta64):
+        return int(value.astype("timedelta64[ns]").astype(np.int64))
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return int(value)
+    return None
+
+
+def _searchsorted_regular(
+    first: int, period: int, length: int, values: np.ndarray
+) -> np.ndarray:
+    """Closed form ``np.searchsorted(idx, values, "left")`` for a regular ``idx``.
+
+    Where ``idx`` is the regularly sampled index ``first + period * np.arange(length)``
+    (in its int64 representation).
+    """
+    # The first position i for which first + i * period >= value, i.e.,
+    # ceil((value - first) / period), clipped to [0, length]
+    return np.clip(-((first - _to_int64(values)) // period), 0, length)
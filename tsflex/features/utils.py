@@ -2,6 +2,7 @@
 
 __author__ = "Jeroen Van Der Donckt, Jonas Van Der Donckt"
 
+from collections import namedtuple
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
@@ -98,11 +99,75 @@ def _get_funcwrapper_func_and_kwargs(func: FuncWrapper) -> Tuple[Callable, dict]
     func_wrapper_kwargs["output_names"] = func.output_names
     func_wrapper_kwargs["input_type"] = func.input_type
     func_wrapper_kwargs["vectorized"] = func.vectorized
+    func_wrapper_kwargs["output_dtype"] = func.output_dtype
+    func_wrapper_kwargs["stack_series"] = func.stack_series
+    func_wrapper_kwargs["intermediate"] = func.intermediate
     func_wrapper_kwargs.update(func.kwargs)
 
     return function, func_wrapper_kwargs
 
 
+def _equal_values(value_1: Any, value_2: Any) -> bool:
+    """Check whether the two (keyword argument) values are equal."""
+    if value_1 is value_2:
+        return True
+    try:
+        return bool(np.array_equal(value_1, value_2))
+    except Exception:
+        # e.g., ragged sequences or objects that can not be compared
+        return False
+
+
+def _is_equivalent_funcwrapper(func_1: FuncWrapper, func_2: FuncWrapper) -> bool:
+    """Check whether the two FuncWrappers compute the same outputs.
+
+    Two FuncWrappers are equivalent when they wrap the same function with the same
+    (keyword) arguments and settings; only their output names may differ (the number
+    of output names must be equal).
+    """
+    if func_1 is func_2:
+        return True
+    func_1_kwargs = _get_funcwrapper_func_and_kwargs(func_1)[1]
+    func_2_kwargs = _get_funcwrapper_func_and_kwargs(func_2)[1]
+    for func_kwargs in [func_1_kwargs, func_2_kwargs]:
+        func_kwargs["output_names"] = len(func_kwargs["output_names"])
+        intermediate = func_kwargs["intermediate"]
+        func_kwargs["intermediate"] = getattr(intermediate, "key", intermediate)
+    return (
+        func_1.func is func_2.func
+        and func_1_kwargs.keys() == func_2_kwargs.keys()
+        and all(_equal_values(v, func_2_kwargs[k]) for k, v in func_1_kwargs.items())
+    )
+
+
+# The settings of a robust function, which are attached to its wrapped function (as
+# `_robust_settings` attribute) so that the segmenter can apply it in a fast way;
+# i.e., without calling the function on the windows that do not meet the requirements
+_RobustSettings = namedtuple(
+    "_RobustSettings",
+    ["func", "nan_func", "min_nb_samples", "error_val", "passthrough_nans"],
+)
+
+# The NaN-aware variants of the numpy functions, which are used (when the function is
+# vectorized) to mask out the NaNs of all windows at once
+_NAN_FUNCS = {
+    np.mean: np.nanmean,
+    np.median: np.nanmedian,
+    np.std: np.nanstd,
+    np.var: np.nanvar,
+    np.sum: np.nansum,
+    np.prod: np.nanprod,
+    np.min: np.nanmin,
+    np.max: np.nanmax,
+    np.amin: np.nanmin,
+    np.amax: np.nanmax,
+    np.argmin: np.nanargmin,
+    np.argmax: np.nanargmax,
+    np.quantile: np.nanquantile,
+    np.percentile: np.nanpercentile,
+}
+
+
 def _make_single_func_robust(
     func: Union[Callable, FuncWrapper],
     min_nb_samples: int,
@@ -149,6 +214,13 @@ def _make_single_func_robust(
         return func(*series, **kwargs)
 
     wrap_func.__name__ = "[robust]__" + _get_name(func)
+    try:
+        nan_func = _NAN_FUNCS.get(func)
+    except TypeError:  # unhashable callable
+        nan_func = None
+    wrap_func._robust_settings = _RobustSettings(
+        func, nan_func, min_nb_samples or 0, error_val, passthrough_nans
+    )
     if "output_names" not in func_wrapper_kwargs.keys():
         func_wrapper_kwargs["output_names"] = _get_name(func)
 
@@ -171,6 +243,19 @@ def make_robust(
      Note: this wrapper is useful for functions that should be robust for empty or
      sparse windows and/or nans in the data.
 
+    .. Note::
+        When applied in a `FeatureCollection`, the number of (non-NaN) samples of each
+        window is derived from the (shared) prefix NaN counts of the series. The
+        windows that do not meet the `min_nb_samples` requirement are filled with the
+        `error_val` without calling the function, and only the windows that contain
+        NaNs are filtered (when `passthrough_nans` is False).<br>
+        A vectorized function is applied at once on the valid windows; to mask out the
+        NaNs, the NaN-aware variant of the numpy function is then used (e.g.,
+        `np.nanmean` for `np.mean`). Vectorized functions without such a variant are
+        applied at once on each group of windows with the same number of NaNs, of
+        which the NaNs are masked out (resulting in a 2D-array of equally sized
+        windows; hence, the function its kwargs, e.g., `axis=1`, remain valid).
+
     Parameters
     ----------
     funcs: Union[Callable, FuncWrapper, List[Union[Callable, FuncWrapper]]]
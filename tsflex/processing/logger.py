@@ -1,8 +1,11 @@
 """Contains the used variables and functions to provide logging functionality.
 
+The execution info can be retrieved from either a logging file or a
+`MetricsCollector` (which avoids writing & parsing a logging file).
+
 See Also
 --------
-SeriesPipeline : its `logging_file_path` of the `process` method.
+SeriesPipeline : its `logging_file_path` & `metrics_collector` of the `process` method.
 
 """
 
@@ -10,10 +13,13 @@ __author__ = "Jeroen Van Der Donckt, Jonas Van Der Donckt"
 
 import logging
 import re
+from pathlib import Path
+from typing import Dict, List, Union
 
 import pandas as pd
 
 from ..utils.logging import logging_file_to_df, remove_inner_brackets
+from ..utils.metrics import MetricsCollector, ProcessorRecord
 
 # Package specific logger
 logger = logging.getLogger("feature_processing_logger")
@@ -67,14 +73,44 @@ def _parse_logging_execution_to_df(logging_file_path: str) -> pd.DataFrame:
     return df.drop(columns=["name", "log_level", "message"])
 
 
-def get_processor_logs(logging_file_path: str) -> pd.DataFrame:
+def _get_processor_record(
+    function_name: str,
+    series_names: List[tuple],
+    processed_dict: Dict[str, pd.Series],
+    duration: float,
+) -> ProcessorRecord:
+    """Create the execution record, formatted as the parsed logged message."""
+    return ProcessorRecord(
+        log_time=pd.Timestamp.now(),
+        function=function_name,
+        series_names=", ".join(str(tuple(s)) for s in series_names).replace("'", ""),
+        output_names=", ".join(map(str, processed_dict.keys())),
+        duration=duration,
+    )
+
+
+def _get_execution_df(
+    logging_file_path: Union[str, Path, MetricsCollector]
+) -> pd.DataFrame:
+    """Get the execution info from either a logging file or a `MetricsCollector`."""
+    if not isinstance(logging_file_path, MetricsCollector):
+        return _parse_logging_execution_to_df(logging_file_path)
+    df = logging_file_path.to_df(ProcessorRecord)
+    df["duration %"] = (100 * (df["duration"] / df["duration"].sum())).round(2)
+    return df
+
+
+def get_processor_logs(
+    logging_file_path: Union[str, Path, MetricsCollector]
+) -> pd.DataFrame:
     """Get execution (time) info for each processor of a ``SeriesPipeline``.
 
     Parameters
     ----------
-    logging_file_path: str
-        The file path where the logged messages are stored. This is the file path that
-        is passed to the ``SeriesPipeline`` its ``process`` method.
+    logging_file_path: Union[str, Path, MetricsCollector]
+        The file path where the logged messages are stored (i.e., the file path that
+        is passed to the ``SeriesPipeline`` its ``process`` method), or the
+        ``MetricsCollector`` that is passed to this method.
 
     Returns
     -------
@@ -83,6 +119,6 @@ def get_processor_logs(logging_file_path: str) -> pd.DataFrame:
         (%) duration.
 
     """
-    df = _parse_logging_execution_to_df(logging_file_path)
+    df = _get_execution_df(logging_file_path)
     df["duration"] = pd.to_timedelta(df["duration"], unit="s")
     return df
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 __author__ = "Jonas Van Der Donckt, Emiel Deprost, Jeroen Van Der Donckt"
 
+import time
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -10,8 +12,10 @@ import dill
 import pandas as pd
 
 from ..utils.data import flatten, series_dict_to_df, to_series_list
+from ..utils.hooks import TaskHooks
 from ..utils.logging import add_logging_handler, delete_logging_handlers
-from .logger import logger
+from ..utils.metrics import MetricsCollector
+from .logger import _get_processor_record, logger
 from .series_processor import SeriesProcessor
 
 
@@ -113,6 +117,23 @@ class SeriesPipeline:
                 + f"not {type(processor)}"
             )
 
+    @staticmethod
+    def _run_hooked_processor(
+        processor: SeriesProcessor, series_dict: Dict[str, pd.Series], hooks: TaskHooks
+    ) -> Dict[str, pd.Series]:
+        """Apply the processor and invoke the hooks around it."""
+        task_info = {"function": processor.name, "series_names": processor.series_names}
+        events = []
+        try:
+            return hooks._run_task(
+                task_info,
+                partial(processor, series_dict),
+                lambda out: {"output_shapes": {k: s.shape for k, s in out.items()}},
+                events,
+            )
+        finally:
+            hooks.events.extend(events)
+
     def process(
         self,
         data: Union[pd.Series, pd.DataFrame, List[Union[pd.Series, pd.DataFrame]]],
@@ -121,6 +142,8 @@ class SeriesPipeline:
         drop_keys: Optional[List[str]] = None,
         copy: Optional[bool] = False,
         logging_file_path: Optional[Union[str, Path]] = None,
+        metrics_collector: Optional[MetricsCollector] = None,
+        hooks: Optional[TaskHooks] = None,
     ) -> Union[List[pd.Series], pd.DataFrame]:
         """Execute all ``SeriesProcessor`` objects in pipeline sequentially.
 
@@ -154,6 +177,16 @@ class SeriesPipeline:
             If ``None``, then no logging ``FileHandler`` will be used and the logging
             messages are only pushed to stdout. Otherwise, a logging ``FileHandler`` will
             write the logged messages to the given file path.
+        metrics_collector : MetricsCollector, optional
+            The collector to which the execution record (i.e., a ``ProcessorRecord``)
+            of each processing step is added, by default None. The execution (time)
+            info can then be retrieved (without a logging file) by calling
+            ``logger.get_processor_logs(metrics_collector)``.
+        hooks : TaskHooks, optional
+            The hooks that are invoked around each processing step, by default None.
+            The (non-None) outputs of the hooks are aggregated in the ``events`` of
+            ``hooks``. The ``task_info`` contains the ``function`` (i.e., the processor
+            its name) and ``series_names`` of the processing step (see ``TaskHooks``).
 
         Returns
         -------
@@ -162,8 +195,10 @@ class SeriesPipeline:
 
         Notes
         -----
-        * If a ``logging_file_path`` is provided, the execution (time) info can be
-          retrieved by calling ``logger.get_processor_logs(logging_file_path)``. <br>
+        * If a ``logging_file_path`` (or ``metrics_collector``) is provided, the
+          execution (time) info can be retrieved by calling
+          ``logger.get_processor_logs(logging_file_path)`` (or
+          ``logger.get_processor_logs(metrics_collector)``). <br>
           Be aware that the ``logging_file_path`` gets cleared before the logger pushes
           logged messages. Hence, one should use a separate logging file for each
           constructed processing and feature instance with this library.
@@ -204,9 +239,25 @@ class SeriesPipeline:
                 series_dict[str(s.name)] = s.copy() if copy else s
 
         output_keys = set()  # Maintain set of output series
+        records = []  # The execution records (when a metrics_collector is passed)
         for processor in self.processing_steps:
             try:
-                processed_dict = processor(series_dict)
+                t_start = time.perf_counter()
+                if hooks is None:
+                    processed_dict = processor(series_dict)
+                else:
+                    processed_dict = self._run_hooked_processor(
+                        processor, series_dict, hooks
+                    )
+                if metrics_collector is not None:
+                    records.append(
+                        _get_processor_record(
+                            processor.name,
+                            processor.series_names,
+                            processed_dict,
+                            time.perf_counter() - t_start,
+                        )
+                    )
                 output_keys.update(processed_dict.keys())
                 series_dict.update(processed_dict)
             except Exception as e:
@@ -214,6 +265,8 @@ class SeriesPipeline:
                 if logging_file_path:
                     f_handler.close()
                     logger.removeHandler(f_handler)
+                if metrics_collector is not None:
+                    metrics_collector.add(records)
                 raise _ProcessingError(
                     "Error while processing function {}:\n {}".format(
                         processor.name, str(e)
@@ -224,6 +277,8 @@ class SeriesPipeline:
         if logging_file_path:
             f_handler.close()
             logger.removeHandler(f_handler)
+        if metrics_collector is not None:
+            metrics_collector.add(records)
 
         if not return_all_series:
             # Return just the output series
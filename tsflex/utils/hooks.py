@@ -0,0 +1,127 @@
+"""Callback hooks that are invoked around each task.
+
+See Also
+--------
+FeatureCollection: its `hooks` of the `calculate` method.
+SeriesPipeline: its `hooks` of the `process` method.
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import time
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# The (non-None) output of a hook, together with the name of the hook and the info of
+# the task on which the hook was invoked
+HookEvent = namedtuple("HookEvent", ["hook", "task_info", "output"])
+
+
+class TaskHooks:
+    """Callbacks that are invoked around each (feature calculation or processing) task.
+
+    Each hook is called with the `task_info` dict of the task, which contains the
+    `function` (name) and `series_names` of the task (and for a feature calculation
+    task also its `window` and `strides`). This dict is extended with:
+
+    * for `on_task_end`: the `duration` (in seconds) of the task and its output shape;
+      i.e., the `output_names` and `output_shape` (nb. windows, nb. outputs) for a
+      feature calculation task, or the `output_shapes` (a dict with the shape of each
+      output series) for a processing task.
+    * for `on_error`: the `duration` (in seconds) until the error occurred. The
+      exception is passed as second argument.
+
+    The hooks are invoked in the process that executes the task (i.e., in the worker
+    processes when multiprocessing). The non-None outputs of the hooks are returned
+    to the main process and aggregated (as `HookEvent`s) in `events`; these outputs
+    should thus be picklable.
+
+    Parameters
+    ----------
+    on_task_start : Callable[[Dict[str, Any]], Any], optional
+        The hook that is invoked before each task, by default None.
+    on_task_end : Callable[[Dict[str, Any]], Any], optional
+        The hook that is invoked after each (successful) task, by default None.
+    on_error : Callable[[Dict[str, Any], Exception], Any], optional
+        The hook that is invoked when a task raises an error, by default None.
+
+    Examples
+    --------
+    ```python
+    from tsflex.features import TaskHooks
+
+    hooks = TaskHooks(
+        on_task_end=lambda info: (info["function"], info["duration"])
+    )
+    fc.calculate(data, hooks=hooks)
+    hooks.events  # -> a HookEvent for each task
+    ```
+
+    .. Note::
+        When no hooks are passed to `calculate` or `process`, the tasks are executed
+        without any overhead.
+
+    """
+
+    def __init__(
+        self,
+        on_task_start: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        on_task_end: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        on_error: Optional[Callable[[Dict[str, Any], Exception], Any]] = None,
+    ):
+        self.on_task_start = on_task_start
+        self.on_task_end = on_task_end
+        self.on_error = on_error
+        self.events: List[HookEvent] = []
+
+    def _call(self, hook: str, task_info: Dict[str, Any], events: list, *args):
+        func = getattr(self, hook)
+        if func is not None:
+            output = func(task_info, *args)
+            if output is not None:
+                events.append(HookEvent(hook, task_info, output))
+
+    def _run_task(
+        self,
+        task_info: Dict[str, Any],
+        task: Callable[[], T],
+        get_output_info: Callable[[T], Dict[str, Any]],
+        events: List[HookEvent],
+    ) -> T:
+        """Run the task and invoke the hooks; the hook events are added to `events`."""
+        self._call("on_task_start", task_info, events)
+        t_start = time.perf_counter()
+        try:
+            output = task()
+        except Exception as e:
+            error_info = {**task_info, "duration": time.perf_counter() - t_start}
+            self._call("on_error", error_info, events, e)
+            raise
+        end_info = {
+            **task_info,
+            "duration": time.perf_counter() - t_start,
+            **get_output_info(output),
+        }
+        self._call("on_task_end", end_info, events)
+        return output
+
+    def __repr__(self) -> str:
+        """Representation string of a TaskHooks."""
+        hooks = [
+            h for h in ["on_task_start", "on_task_end", "on_error"] if getattr(self, h)
+        ]
+        return f"{self.__class__.__name__}({hooks}, {len(self.events)} events)"
+
+
+class _TaskError(Exception):
+    """Error raised by a task, which carries the hook events (to the main process)."""
+
+    def __init__(self, message: str, events: List[HookEvent]):
+        super().__init__(message, events)
+        self.events = events
+
+    def __str__(self) -> str:
+        return self.args[0]
@@ -4,10 +4,13 @@ __author__ = "Jeroen Van Der Donckt"
 
 import logging
 import warnings
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from typing import Union
+from typing import Callable, Iterator, Optional, Tuple, Union
 
 import pandas as pd
+from multiprocess import Queue
 
 
 def remove_inner_brackets(message: str) -> str:
@@ -95,6 +98,57 @@ def add_logging_handler(
     return f_handler
 
 
+def _init_worker_logging(logger_name: str, queue: Queue, level: int):
+    """Replace the (inherited) file handlers of the worker its logger by a queue."""
+    logger = logging.getLogger(logger_name)
+    delete_logging_handlers(logger)
+    queue_handler = QueueHandler(queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+
+
+@contextmanager
+def queue_logging_handler(
+    logger: logging.Logger,
+    handler: Optional[logging.Handler],
+    capacity: Optional[int] = 128,
+) -> Iterator[Tuple[Optional[Callable], tuple]]:
+    """Route the log records of (pool) worker processes to the handler of the parent.
+
+    The yielded ``(initializer, initargs)`` should be passed to the process pool; its
+    workers then put their log records on a queue (instead of writing to the
+    inherited file handler), which is consumed by a single listener thread in the
+    parent process. The listener writes the records in batches of ``capacity`` records
+    (records with level WARNING or higher are written immediately). All the records
+    are written when exiting this context.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        The logger (of the worker processes).
+    handler : logging.Handler, optional
+        The handler (e.g., a file handler) to which the log records are routed. If
+        None, the workers are not initialized (i.e., `(None, ())` is yielded).
+    capacity : int, optional
+        The number of records that are written in a single batch, by default 128.
+
+    """
+    if handler is None:
+        yield None, ()
+        return
+    queue = Queue()
+    batch_handler = MemoryHandler(
+        capacity, flushLevel=logging.WARNING, target=handler, flushOnClose=True
+    )
+    listener = QueueListener(queue, batch_handler)
+    listener.start()
+    try:
+        yield _init_worker_logging, (logger.name, queue, handler.level)
+    finally:
+        listener.stop()  # processes the remaining records on the queue
+        batch_handler.close()
+
+
 def logging_file_to_df(logging_file_path: str) -> pd.DataFrame:
     """Parse the logged messages into a dataframe.
 
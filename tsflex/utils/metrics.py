@@ -0,0 +1,117 @@
+"""In-memory collection of structured execution records.
+
+See Also
+--------
+FeatureCollection: its `metrics_collector` of the `calculate` method.
+SeriesPipeline: its `metrics_collector` of the `process` method.
+
+"""
+
+__author__ = "Jeroen Van Der Donckt"
+
+import json
+from collections import namedtuple
+from pathlib import Path
+from typing import Iterable, List, Optional, Type, Union
+
+import pandas as pd
+
+# The execution record of a feature calculation task (see `FeatureCollection`); the
+# fields correspond to the columns of `tsflex.features.get_feature_logs`
+FeatureRecord = namedtuple(
+    "FeatureRecord",
+    [
+        "log_time",
+        "function",
+        "series_names",
+        "window",
+        "stride",
+        "output_names",
+        "duration",
+    ],
+)
+
+# The execution record of a processing step (see `SeriesPipeline`); the fields
+# correspond to the columns of `tsflex.processing.get_processor_logs`
+ProcessorRecord = namedtuple(
+    "ProcessorRecord",
+    ["log_time", "function", "series_names", "output_names", "duration"],
+)
+
+
+class MetricsCollector:
+    """Collect the execution records of the feature calculation & processing.
+
+    The records (i.e., `FeatureRecord` and `ProcessorRecord` named tuples) are buffered
+    in memory, which avoids writing and parsing a logging file. The records are added
+    (and not cleared) on each `FeatureCollection.calculate` or
+    `SeriesPipeline.process` call that is passed this collector.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path], optional
+        The file path of a JSON lines file to which the records are appended, by
+        default None. If None, the records are only kept in memory.
+
+    Examples
+    --------
+    ```python
+    from tsflex.features import MetricsCollector, get_function_stats
+
+    metrics = MetricsCollector()
+    fc.calculate(data, metrics_collector=metrics)
+    get_function_stats(metrics)
+    ```
+
+    """
+
+    def __init__(self, file_path: Optional[Union[str, Path]] = None):
+        self.file_path = None if file_path is None else Path(file_path)
+        self.records: List[tuple] = []
+
+    def add(self, records: Iterable[tuple]):
+        """Add the records (and append them to the JSON lines file, if any)."""
+        records = list(records)
+        self.records.extend(records)
+        if self.file_path is not None and len(records):
+            # Write the records in a single batch
+            with open(self.file_path, "a") as f:
+                f.writelines(_record_to_json(record) + "\n" for record in records)
+
+    def clear(self):
+        """Clear the (in-memory) records."""
+        self.records.clear()
+
+    def to_df(self, record_type: Type[tuple]) -> pd.DataFrame:
+        """Get the records of the given type as a DataFrame.
+
+        Parameters
+        ----------
+        record_type : Type[tuple]
+            The type of the records, i.e., either `FeatureRecord` or
+            `ProcessorRecord`.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with a row for each record and a column for each field.
+
+        """
+        return pd.DataFrame(
+            [r for r in self.records if isinstance(r, record_type)],
+            columns=list(record_type._fields),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.records)
+
+    def __repr__(self) -> str:
+        """Representation string of a MetricsCollector."""
+        return f"{self.__class__.__name__}({len(self)} records)"
+
+
+def _record_to_json(record: tuple) -> str:
+    return json.dumps(
+        {"record": type(record).__name__, **record._asdict()}, default=str
+    )